@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Compare model round-trips and wall time per navigation step for the fused
+observe-and-decide mode and the two-call (analyze, then decide) mode.
+
+Runs Navigator._navigate offline against a mock model with fixed latency and a
+page that changes on every step, which is the worst case for the two-call mode.
+
+Usage (from the repository root):
+    python -m benchmarks.decision_mode_benchmark [--steps 8] [--latency 0.5]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from typing import Dict
+
+from src.ai_client import AIClient
+from src.config import with_overrides
+from src.mock_client import MockAsyncAnthropic
+from src.navigator import Navigator
+from src.page_snapshot import PageSnapshot
+from src.screenshots import ScreenshotService
+
+CONFIG_PATH = os.path.abspath('config.toml')
+
+
+class ChangingSnapshotter:
+    """Serves a new snapshot on every read, as if each step navigated."""
+
+    def __init__(self):
+        self.reads = 0
+        self.stats = {}
+
+    async def get(self, fresh: bool = False) -> PageSnapshot:
+        self.reads += 1
+        return PageSnapshot(
+            url=f"https://fixtures.local/page/{self.reads}",
+            title=f"Fixture page {self.reads}",
+            text="Cordless drills\nDEWALT 20V MAX Drill $99.00\nAdd to Cart\n" * 20,
+            navigation_id=self.reads
+        )
+
+    def invalidate(self):
+        pass
+
+
+class NullPage:
+    async def screenshot(self, **options) -> bytes:
+        return b''
+
+
+def scripted_responder(steps: int):
+    """Answer every request kind with canned JSON, reporting done at ``steps``."""
+    decisions = {'count': 0}
+
+    def respond(params: Dict) -> str:
+        system = params.get('system', '')
+        system = system if isinstance(system, str) else system[0]['text']
+        if 'parsing' in system:
+            return '{"primary_goal": "buy drill", "product_keywords": ["drill"]}'
+        if 'analyzing web pages' in system:
+            return '{"page_type": "search_results", "key_elements": ["products"]}'
+        decisions['count'] += 1
+        action = 'done' if decisions['count'] >= steps else 'scroll'
+        return (
+            '{"page_type": "search_results", "key_elements": ["products"], '
+            f'"action": "{action}", "target": "", "reasoning": "benchmark"}}'
+        )
+
+    return respond
+
+
+async def run_mode(mode: str, steps: int, latency: float) -> Dict:
+    navigator = Navigator(config_path=CONFIG_PATH, anthropic_api_key='benchmark')
+    navigator.config = with_overrides(navigator.config, {
+        'ai.cache.enabled': False,
+        'navigation.decision_mode': mode,
+        'general.max_navigation_steps': steps
+    })
+    navigator.ai_client = AIClient(
+        navigator.config,
+        MockAsyncAnthropic(latency=latency, responder=scripted_responder(steps)),
+        navigator.logger
+    )
+    if not navigator.ai_client._is_async:
+        raise SystemExit("AIClient put the async mock client on the thread pool")
+    navigator.snapshotter = ChangingSnapshotter()
+    navigator.page = NullPage()
+    navigator.screenshot_service = ScreenshotService(navigator.config, navigator.page)
+
+    async def skip_warm_up():
+        pass
+    navigator._warm_up_page = skip_warm_up
+
+    start = time.perf_counter()
+    result = await navigator._navigate('Find a cordless drill', {
+        'technical_achievements': []
+    })
+    duration = time.perf_counter() - start
+    # Drain pending screenshot writes while still in the temporary directory.
+    await navigator.screenshot_service.close()
+    navigator.log_pipeline.stop()
+
+    step_calls = [step['model_calls'] for step in result['steps']]
+    step_times = [step['duration'] for step in result['steps']]
+    return {
+        'mode': mode,
+        'steps': len(step_calls),
+        'model_calls_per_step': sum(step_calls) / len(step_calls),
+        'seconds_per_step': sum(step_times) / len(step_times),
+        'total_model_calls': navigator.ai_client.usage_totals()['calls'],
+        'total_seconds': duration
+    }
+
+
+async def run(steps: int, latency: float):
+    results = []
+    # Navigator writes its log and screenshots to the working directory.
+    with tempfile.TemporaryDirectory() as workdir:
+        cwd = os.getcwd()
+        os.chdir(workdir)
+        try:
+            for mode in ('two_call', 'fused'):
+                results.append(await run_mode(mode, steps, latency))
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--steps', type=int, default=8, help='Steps per run (default 8)')
+    parser.add_argument(
+        '--latency',
+        type=float,
+        default=0.5,
+        help='Mock model latency in seconds (default 0.5)'
+    )
+    parser.add_argument(
+        '-o',
+        '--output',
+        default='decision_mode_benchmark.json',
+        help='Where to write the JSON results (default "decision_mode_benchmark.json")'
+    )
+    args = parser.parse_args()
+
+    benchmark_results = asyncio.run(run(args.steps, args.latency))
+    print(f"\n{'mode':<10}{'steps':>7}{'calls/step':>12}{'s/step':>9}{'total s':>9}")
+    for row in benchmark_results:
+        print(f"{row['mode']:<10}{row['steps']:>7}{row['model_calls_per_step']:>12.2f}"
+              f"{row['seconds_per_step']:>9.2f}{row['total_seconds']:>9.2f}")
+    with open(args.output, 'w') as f:
+        json.dump(benchmark_results, f, indent=2)
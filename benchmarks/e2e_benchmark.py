@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark: run Navigator against a local fixture shop and a mock
+model server, and report wall time per phase, model round-trips, tokens, bytes
+transferred and peak memory. ``compare`` diffs two result files and fails on
+regressions beyond a threshold.
+
+Usage (from the repository root):
+    python -m benchmarks.e2e_benchmark run [--runs 3] [--latency 0.2] [-o e2e.json]
+    python -m benchmarks.e2e_benchmark compare baseline.json e2e.json [--threshold 10]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+import toml
+
+from benchmarks.fixture_shop import FixtureShop
+from benchmarks.mock_model_server import MockModelServer
+
+CONFIG_PATH = os.path.abspath('config.toml')
+
+# Timing metrics end in this suffix; every recorded metric is lower-is-better.
+TIME_SUFFIX = '_s'
+
+
+def benchmark_config(data: Dict, shop_url: str, steps: int) -> Dict:
+    """Point every site the navigator visits at the shop and shorten the pacing."""
+    data['general']['start_url'] = shop_url + '/'
+    data['general']['max_navigation_steps'] = steps
+    data['demo_mode']['enabled'] = False
+    data['navigation']['warm_up'].update(
+        scroll_steps=1, pause_between_scrolls=0.05, final_pause=0.05,
+        pre_search_browse=False, pre_search_browse_url=shop_url + '/category/power-tools'
+    )
+    data['browser'].update(headless=True, slow_mo_min=0, slow_mo_max=0)
+    data['session_building'].update(
+        entry_points=[shop_url + '/'],
+        credibility_sites=[shop_url + '/'],
+        competitor_sites=[shop_url + '/']
+    )
+    data['element_interaction'].update(
+        bunnings_link_selector='a.logo', bunnings_link_timeout=2000
+    )
+    data['bypass']['check_interval'] = 1
+    for key in data['human_behavior']['delays']:
+        data['human_behavior']['delays'][key] = 0.05
+    for key in data['human_behavior']['action_delays']:
+        data['human_behavior']['action_delays'][key] = 0.05
+    data['search_functionality'].update(
+        search_url_template=shop_url + '/search?q={query}',
+        typing_delay=10,
+        submit_delay=50
+    )
+    data['ai']['cache']['enabled'] = False
+    data['tracing'].update(enabled=True, chrome_trace_path='', otlp_path='')
+    data['monitoring']['performance_metrics'] = True
+    data.setdefault('cassette', {})['mode'] = 'off'
+    return data
+
+
+async def run_once(
+    shop: FixtureShop,
+    model: MockModelServer,
+    steps: int,
+    config_path: str
+) -> Dict:
+    """One session with the benchmark config written to ``config_path``."""
+    from src.navigator import Navigator
+
+    shop.reset()
+    model.reset()
+    with open(CONFIG_PATH, 'r') as f:
+        data = benchmark_config(toml.load(f), shop.url, steps)
+    with open(config_path, 'w') as f:
+        toml.dump(data, f)
+
+    navigator = Navigator(config_path=config_path, anthropic_api_key='benchmark')
+    start = time.perf_counter()
+    result = await navigator.run(navigator.config.general.goal)
+    total = time.perf_counter() - start
+
+    usage = navigator.ai_client.usage_totals()
+    phases = {
+        name.split('.', 1)[1] + TIME_SUFFIX: round(entry['seconds'], 4)
+        for name, entry in navigator.tracer.summary().items()
+        if name.startswith('phase.')
+    }
+    final = result.get('final_result') or {}
+    return {
+        'completed': bool(final.get('goal_completed')) and bool(shop.cart),
+        'steps': final.get('steps_taken', 0),
+        'metrics': {
+            'total' + TIME_SUFFIX: round(total, 4),
+            **{f'phase.{name}': seconds for name, seconds in phases.items()},
+            'model_round_trips': model.stats['requests'],
+            'input_tokens': usage['input_tokens'],
+            'output_tokens': usage['output_tokens'],
+            'page_requests': shop.stats['requests'],
+            'page_bytes': shop.stats['bytes_sent'],
+            'model_bytes': model.stats['bytes_received'] + model.stats['bytes_sent'],
+            # ru_maxrss is in KiB on Linux; children are the reaped browser processes.
+            'peak_rss_mb': round(
+                resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1
+            ),
+            'peak_browser_rss_mb': round(
+                resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024, 1
+            )
+        }
+    }
+
+
+async def run(runs: int, latency: float, steps: int) -> Dict:
+    shop = FixtureShop().start()
+    model = MockModelServer(latency=latency).start()
+    os.environ['ANTHROPIC_BASE_URL'] = model.url
+    results = []
+    # Navigator writes its log and summaries to the working directory.
+    with tempfile.TemporaryDirectory() as workdir:
+        config_path = os.path.join(workdir, 'benchmark_config.toml')
+        cwd = os.getcwd()
+        os.chdir(workdir)
+        try:
+            for i in range(runs):
+                results.append(await run_once(shop, model, steps, config_path))
+                print(f"run {i + 1}/{runs}: {results[-1]['metrics']['total_s']:.2f}s, "
+                      f"completed={results[-1]['completed']}")
+        finally:
+            os.chdir(cwd)
+            shop.stop()
+            model.stop()
+
+    # A failed run may skip phases, so take every metric any run reported.
+    keys = list(dict.fromkeys(key for r in results for key in r['metrics']))
+    return {
+        'settings': {'runs': runs, 'latency': latency, 'max_steps': steps},
+        'completed_runs': sum(r['completed'] for r in results),
+        'median': {
+            key: statistics.median(r['metrics'].get(key, 0) for r in results)
+            for key in keys
+        },
+        'runs': results
+    }
+
+
+def compare(
+    baseline: Dict,
+    current: Dict,
+    threshold: float,
+    overrides: Dict[str, float],
+    min_seconds: float
+) -> List[Dict]:
+    """Rows for every metric in both files; ``regression`` marks the failures.
+
+    A metric regresses when it grew by more than its threshold percentage.
+    Timings must also have grown by at least ``min_seconds``, so sub-noise
+    changes to short phases do not fail the comparison.
+    """
+    rows = []
+    for key, before in baseline['median'].items():
+        if key not in current['median']:
+            continue
+        after = current['median'][key]
+        change = (after - before) / before * 100 if before else 0.0
+        limit = overrides.get(key, threshold)
+        regression = change > limit and (
+            not key.endswith(TIME_SUFFIX) or after - before >= min_seconds
+        )
+        rows.append({
+            'metric': key,
+            'baseline': before,
+            'current': after,
+            'change_pct': round(change, 1),
+            'threshold_pct': limit,
+            'regression': regression
+        })
+    return rows
+
+
+def _parse_overrides(values: List[str]) -> Dict[str, float]:
+    overrides = {}
+    for value in values:
+        key, _, pct = value.partition('=')
+        overrides[key] = float(pct)
+    return overrides
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Run the benchmark')
+    run_parser.add_argument('--runs', type=int, default=3, help='Runs (default 3)')
+    run_parser.add_argument(
+        '--latency',
+        type=float,
+        default=0.2,
+        help='Mock model latency in seconds (default 0.2)'
+    )
+    run_parser.add_argument(
+        '--steps', type=int, default=8, help='Max navigation steps (default 8)'
+    )
+    run_parser.add_argument(
+        '-o',
+        '--output',
+        default='e2e_benchmark.json',
+        help='Where to write the JSON results (default "e2e_benchmark.json")'
+    )
+
+    compare_parser = commands.add_parser(
+        'compare', help='Diff results against a baseline'
+    )
+    compare_parser.add_argument('baseline', help='Baseline results JSON')
+    compare_parser.add_argument('current', help='Current results JSON')
+    compare_parser.add_argument(
+        '--threshold',
+        type=float,
+        default=10.0,
+        help='Allowed increase in percent for every metric (default 10)'
+    )
+    compare_parser.add_argument(
+        '--metric-threshold',
+        action='append',
+        default=[],
+        metavar='METRIC=PCT',
+        help='Per-metric threshold, e.g. phase.bypass_s=25 (repeatable)'
+    )
+    compare_parser.add_argument(
+        '--min-seconds',
+        type=float,
+        default=0.05,
+        help='Ignore timing increases smaller than this (default 0.05)'
+    )
+
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        report = asyncio.run(run(args.runs, args.latency, args.steps))
+        print(f"\n{'metric':<28}{'median':>12}")
+        for metric, value in report['median'].items():
+            print(f"{metric:<28}{value:>12}")
+        print(f"\n{report['completed_runs']}/{args.runs} runs reached the cart")
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        sys.exit(0)
+
+    with open(args.baseline) as f:
+        baseline_report = json.load(f)
+    with open(args.current) as f:
+        current_report = json.load(f)
+    comparison = compare(
+        baseline_report,
+        current_report,
+        args.threshold,
+        _parse_overrides(args.metric_threshold),
+        args.min_seconds
+    )
+    print(f"{'metric':<28}{'baseline':>12}{'current':>12}{'change':>9}")
+    for row in comparison:
+        flag = '  REGRESSION' if row['regression'] else ''
+        print(f"{row['metric']:<28}{row['baseline']:>12}{row['current']:>12}"
+              f"{row['change_pct']:>8}%{flag}")
+    regressions = [row for row in comparison if row['regression']]
+    print(f"\n{len(regressions)} regression(s) beyond threshold")
+    sys.exit(1 if regressions else 0)
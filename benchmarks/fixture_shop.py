@@ -0,0 +1,179 @@
+"""
+Local fixture shop for end-to-end benchmarks: a homepage with a search box,
+search results, product pages and a cart, served over HTTP on localhost.
+"""
+
+import html
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+PRODUCTS = [
+    ('dcd771c2', 'DEWALT 20V MAX Cordless 1/2 in. Drill/Driver Kit', 99.00),
+    ('xfd131', 'Makita 18V LXT Brushless 1/2 in. Cordless Driver-Drill Kit', 129.00),
+    ('r86009k', 'RYOBI ONE+ HP 18V Brushless Cordless Compact Drill Kit', 79.97),
+    ('2801-22ct', 'Milwaukee M18 Compact Brushless Cordless Drill/Driver Kit', 149.00),
+    ('cd1250', 'Black+Decker 12V MAX Cordless Drill/Driver', 49.98),
+    ('pcck607lb', 'PORTER-CABLE 20V MAX Lithium-Ion Cordless Drill/Driver', 69.00),
+]
+
+LAYOUT = """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>{title} | Fixture Hardware</title>
+<link rel="stylesheet" href="/static/site.css"></head>
+<body>
+<header class="header">
+  <a class="logo" href="/">Fixture Hardware</a>
+  <nav class="navigation">
+    <a href="/category/power-tools">Power Tools</a>
+    <a href="/category/garden">Garden</a>
+    <a href="/cart">Cart ({cart})</a>
+  </nav>
+  <form class="search" action="/search" method="get">
+    <input type="search" name="q" id="search-input" placeholder="Search products">
+  </form>
+</header>
+<main>
+{body}
+</main>
+<footer><p>Fixture Hardware &middot; local benchmark site</p></footer>
+<script src="/static/site.js"></script>
+</body>
+</html>
+"""
+
+STATIC = {
+    '/static/site.css': (
+        'text/css',
+        'body{font-family:sans-serif;margin:0}header,footer{padding:1em}'
+        '.product-card{display:inline-block;width:30%;margin:1%}' * 20
+    ),
+    '/static/site.js': (
+        'application/javascript',
+        'document.documentElement.dataset.ready = "1";\n'
+    ),
+}
+
+
+class FixtureShop:
+    """Serves the shop from a background thread and counts the traffic.
+
+    The cart is a single in-memory list shared by all clients, cleared by
+    ``reset()`` between benchmark runs.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0):
+        self.cart = []
+        self.stats = {'requests': 0, 'bytes_sent': 0}
+        self._lock = threading.Lock()
+        shop = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                shop._handle(self, 'GET')
+
+            def do_POST(self):
+                shop._handle(self, 'POST')
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'FixtureShop':
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset(self):
+        with self._lock:
+            self.cart.clear()
+            self.stats = {'requests': 0, 'bytes_sent': 0}
+
+    def _handle(self, request: BaseHTTPRequestHandler, method: str):
+        url = urlparse(request.path)
+        status, content_type, body, location = 200, 'text/html', '', None
+        if url.path in STATIC:
+            content_type, body = STATIC[url.path]
+        elif url.path == '/':
+            body = self._page('Home', self._home())
+        elif url.path.startswith('/category/'):
+            body = self._page('Power Tools', self._results(''))
+        elif url.path == '/search':
+            query = parse_qs(url.query).get('q', [''])[0]
+            body = self._page(f'Results for {query}', self._results(query))
+        elif url.path.startswith('/p/') and method == 'GET':
+            body = self._product(url.path.split('/')[2])
+        elif url.path == '/cart/add' and method == 'POST':
+            length = int(request.headers.get('Content-Length', 0))
+            form = parse_qs(request.rfile.read(length).decode())
+            with self._lock:
+                self.cart.append(form.get('sku', ['?'])[0])
+            status, location = 303, '/cart'
+        elif url.path == '/cart':
+            items = ''.join(f'<li class="cart-item">{sku}</li>' for sku in self.cart)
+            body = self._page('Cart', f'<h1>Your cart</h1><ul class="cart">{items}</ul>')
+        else:
+            status, body = 404, self._page('Page not found', '<h1>Page not found</h1>')
+
+        payload = body.encode('utf-8')
+        request.send_response(status)
+        request.send_header('Content-Type', f'{content_type}; charset=utf-8')
+        request.send_header('Content-Length', str(len(payload)))
+        if location:
+            request.send_header('Location', location)
+        request.end_headers()
+        request.wfile.write(payload)
+        with self._lock:
+            self.stats['requests'] += 1
+            self.stats['bytes_sent'] += len(payload)
+
+    def _page(self, title: str, body: str) -> str:
+        return LAYOUT.format(title=html.escape(title), cart=len(self.cart), body=body)
+
+    @staticmethod
+    def _home() -> str:
+        categories = ''.join(
+            f'<li class="category"><a href="/category/{slug}">{slug.title()}</a></li>'
+            for slug in ('power-tools', 'hand-tools', 'garden', 'paint', 'lighting')
+        )
+        return (
+            '<h1>Welcome to Fixture Hardware</h1>'
+            f'<ul class="menu">{categories}</ul>'
+            '<section class="product"><h2>Deals of the day</h2>'
+            '<p>Save on cordless drills and more.</p></section>'
+        )
+
+    @staticmethod
+    def _results(query: str) -> str:
+        cards = ''.join(
+            '<article class="product product-card" data-testid="product-pod">'
+            f'<a class="product-link" href="/p/{sku}">{html.escape(name)}</a>'
+            f'<span class="price">${price:.2f}</span></article>'
+            for sku, name, price in PRODUCTS
+        )
+        heading = f'{len(PRODUCTS)} results for "{html.escape(query)}"' if query else ''
+        return f'<h1>{heading or "Power Tools"}</h1><div class="results">{cards}</div>'
+
+    def _product(self, sku: str) -> str:
+        product = next((p for p in PRODUCTS if p[0] == sku), None)
+        if product is None:
+            return self._page('Page not found', '<h1>Page not found</h1>')
+        _, name, price = product
+        return self._page(name, (
+            f'<h1 class="product-title">{html.escape(name)}</h1>'
+            f'<p class="price">${price:.2f}</p>'
+            '<p>' + 'Brushless motor, two batteries, charger and bag. ' * 30 + '</p>'
+            '<form action="/cart/add" method="post">'
+            f'<input type="hidden" name="sku" value="{sku}">'
+            '<button id="add-to-cart" type="submit">Add to Cart</button></form>'
+        ))
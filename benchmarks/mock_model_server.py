@@ -0,0 +1,172 @@
+"""
+Mock Anthropic Messages API for end-to-end benchmarks: answers ``POST
+/v1/messages`` after a configurable latency with canned JSON decisions that
+walk the fixture shop from homepage to cart.
+"""
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+# Next action by the path of the page the navigator is on.
+SHOP_SCRIPT = (
+    ('/cart', 'cart', {'action': 'done', 'target': ''}),
+    ('/p/', 'product_page', {'action': 'click', 'target': '#add-to-cart'}),
+    ('/search', 'search_results', {'action': 'click', 'target': 'a.product-link'}),
+    ('/category/', 'search_results', {'action': 'click', 'target': 'a.product-link'}),
+    ('', 'homepage', {'action': 'search', 'target': 'cordless drill'}),
+)
+
+URL_PATTERN = re.compile(r'URL: (\S+)')
+
+
+class MockModelServer:
+    """Serves canned Messages API responses from a background thread.
+
+    Each response is chosen from the request's tool name (or system prompt when
+    no tool is offered) and, for navigation decisions, the page URL in the
+    prompt. Token usage is estimated at four characters per token.
+    """
+
+    def __init__(self, latency: float = 0.2, host: str = '127.0.0.1', port: int = 0):
+        self.latency = latency
+        self.stats = {'requests': 0, 'bytes_received': 0, 'bytes_sent': 0}
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                server._handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'MockModelServer':
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset(self):
+        with self._lock:
+            self.stats = {'requests': 0, 'bytes_received': 0, 'bytes_sent': 0}
+
+    def _handle(self, request: BaseHTTPRequestHandler):
+        length = int(request.headers.get('Content-Length', 0))
+        raw = request.rfile.read(length)
+        params = json.loads(raw or b'{}')
+        time.sleep(self.latency)
+
+        answer = self.answer(params)
+        tools = params.get('tools') or []
+        if tools:
+            block = {
+                'type': 'tool_use',
+                'id': f'toolu_bench_{self.stats["requests"]}',
+                'name': tools[0]['name'],
+                'input': answer
+            }
+        else:
+            block = {'type': 'text', 'text': json.dumps(answer)}
+        prompt_chars = len(_text(params.get('system', ''))) + sum(
+            len(_text(message.get('content', ''))) for message in params['messages']
+        )
+        payload = json.dumps({
+            'id': f'msg_bench_{self.stats["requests"]}',
+            'type': 'message',
+            'role': 'assistant',
+            'model': params.get('model', 'mock'),
+            'content': [block],
+            'stop_reason': 'tool_use' if tools else 'end_turn',
+            'stop_sequence': None,
+            'usage': {
+                'input_tokens': prompt_chars // 4,
+                'output_tokens': len(json.dumps(answer)) // 4,
+                'cache_creation_input_tokens': 0,
+                'cache_read_input_tokens': 0
+            }
+        }).encode('utf-8')
+
+        request.send_response(200)
+        request.send_header('Content-Type', 'application/json')
+        request.send_header('Content-Length', str(len(payload)))
+        request.end_headers()
+        request.wfile.write(payload)
+        with self._lock:
+            self.stats['requests'] += 1
+            self.stats['bytes_received'] += len(raw)
+            self.stats['bytes_sent'] += len(payload)
+
+    def answer(self, params: Dict) -> Dict:
+        tools = params.get('tools') or []
+        kind = tools[0]['name'] if tools else _kind_from_system(
+            _text(params.get('system', ''))
+        )
+        prompt = ''.join(_text(m.get('content', '')) for m in params['messages'])
+        if kind == 'report_page_status':
+            return {
+                'is_cloudflare_challenge': False,
+                'website_elements_present': True,
+                'challenge_type': 'none',
+                'confidence': 0.95
+            }
+        if kind == 'report_goal_intent':
+            return {
+                'primary_goal': 'add a cordless drill to the cart',
+                'product_keywords': ['cordless', 'drill'],
+                'action_type': 'purchase'
+            }
+        if kind == 'report_simulated_decision':
+            return {'action': 'search', 'reasoning': 'benchmark', 'expected_outcome': ''}
+
+        page_type, decision = _script_step(prompt)
+        if kind == 'report_page_analysis':
+            return {'page_type': page_type, 'key_elements': ['search_box', 'products']}
+        step = dict(decision, reasoning='benchmark script', confidence=0.9)
+        if kind == 'observe_and_decide':
+            step.update(page_type=page_type, key_elements=['products'])
+        return step
+
+
+def _script_step(prompt: str):
+    match = URL_PATTERN.search(prompt)
+    path = match.group(1) if match else ''
+    for marker, page_type, decision in SHOP_SCRIPT:
+        if marker in path:
+            return page_type, decision
+    return SHOP_SCRIPT[-1][1:]
+
+
+def _kind_from_system(system: str) -> Optional[str]:
+    if 'Cloudflare' in system:
+        return 'report_page_status'
+    if 'parsing' in system:
+        return 'report_goal_intent'
+    if 'analyzing web pages' in system:
+        return 'report_page_analysis'
+    if 'simulating' in system:
+        return 'report_simulated_decision'
+    if 'Identify the page' in system:
+        return 'observe_and_decide'
+    return 'choose_action'
+
+
+def _text(content) -> str:
+    if isinstance(content, str):
+        return content
+    return ''.join(block.get('text', '') for block in content if isinstance(block, dict))
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Compare raw innerText truncation with the compact page outline on saved HTML
+fixtures: prompt size always, and page-type accuracy when a model is available.
+
+Usage (from the repository root):
+    python -m benchmarks.page_outline_benchmark [--with-model] [-o results.json]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List
+
+from playwright.async_api import async_playwright
+
+from src.ai_client import AIClient
+from src.config import load_config, with_overrides
+from src.page_outline import PageOutliner
+from src.page_snapshot import PageSnapshotter
+
+FIXTURE_DIR = Path(__file__).parent / 'fixtures' / 'pages'
+
+
+async def count_tokens(client, config, system: str, prompt: str) -> int:
+    """Exact input tokens from the API when a client is given, else ~4 chars/token."""
+    if client is None:
+        return (len(system) + len(prompt)) // 4
+    result = await client.messages.count_tokens(
+        model=config.ai.model,
+        system=system,
+        messages=[{'role': 'user', 'content': prompt}]
+    )
+    return result.input_tokens
+
+
+async def run(with_model: bool) -> List[Dict]:
+    config = with_overrides(load_config('config.toml'), {'ai.cache.enabled': False})
+    outliner = PageOutliner(config)
+    prompt_cfg = config.prompts.page_analysis
+    manifest = json.loads((FIXTURE_DIR / 'manifest.json').read_text())
+
+    client = ai_client = None
+    if with_model:
+        import anthropic
+        client = anthropic.AsyncAnthropic(api_key=os.environ['ANTHROPIC_API_KEY'])
+        ai_client = AIClient(config, client, logging.getLogger(__name__))
+
+    results = []
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True)
+        page = await browser.new_page()
+        snapshotter = PageSnapshotter(config, page)
+        for fixture in manifest:
+            html = (FIXTURE_DIR / fixture['file']).read_text()
+            await page.route(
+                fixture['url'],
+                lambda route, body=html: route.fulfill(
+                    body=body, content_type='text/html'
+                )
+            )
+            await page.goto(fixture['url'])
+            snapshot = await snapshotter.get()
+
+            row = {'fixture': fixture['file']}
+            for mode, content in (
+                ('truncated_text', snapshot.text),
+                ('outline', outliner.outline(snapshot))
+            ):
+                prompt = prompt_cfg.template.format(
+                    title=snapshot.title, content_sample=content
+                )
+                row[mode] = {
+                    'content_chars': len(content),
+                    'prompt_tokens': await count_tokens(
+                        client, config, prompt_cfg.system, prompt
+                    )
+                }
+                if ai_client is not None:
+                    analysis = await ai_client.analyze_page(snapshot.title, content)
+                    row[mode]['page_type'] = analysis.get('page_type')
+                    row[mode]['correct'] = (
+                        analysis.get('page_type') == fixture['expected_page_type']
+                    )
+            results.append(row)
+        await browser.close()
+
+    if ai_client is not None:
+        await ai_client.close()
+    return results
+
+
+def report(results: List[Dict]):
+    print(f"{'fixture':<22}{'text tokens':>12}{'outline tokens':>16}"
+          f"{'saved':>8}  decision")
+    for row in results:
+        raw, outline = row['truncated_text'], row['outline']
+        saved = 1 - outline['prompt_tokens'] / raw['prompt_tokens']
+        decision = (
+            f"{raw.get('page_type')} -> {outline.get('page_type')}"
+            if 'page_type' in raw else 'n/a (run with --with-model)'
+        )
+        print(f"{row['fixture']:<22}{raw['prompt_tokens']:>12}"
+              f"{outline['prompt_tokens']:>16}{saved:>8.0%}  {decision}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--with-model',
+        action='store_true',
+        help='Count tokens with the API and compare page_type decisions '
+             '(needs ANTHROPIC_API_KEY)'
+    )
+    parser.add_argument(
+        '-o',
+        '--output',
+        default='page_outline_benchmark.json',
+        help='Where to write the JSON results (default "page_outline_benchmark.json")'
+    )
+    args = parser.parse_args()
+
+    benchmark_results = asyncio.run(run(args.with_model))
+    report(benchmark_results)
+    with open(args.output, 'w') as f:
+        json.dump(benchmark_results, f, indent=2)
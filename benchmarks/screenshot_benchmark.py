@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Compare inline PNG screenshots with the ScreenshotService pipeline on the
+saved HTML fixtures: time the caller spends per capture and bytes on disk.
+
+Each fixture is captured ``--repeats`` times in a row, as _cloudflare_wait
+does while a page sits unchanged, so duplicate frames are part of the load.
+
+Usage (from the repository root):
+    python -m benchmarks.screenshot_benchmark [--repeats 5] [-o results.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+from playwright.async_api import async_playwright
+
+from src.config import load_config
+from src.screenshots import ScreenshotService
+
+FIXTURE_DIR = Path(__file__).parent / 'fixtures' / 'pages'
+
+
+def disk_usage(directory: str) -> int:
+    return sum(entry.stat().st_size for entry in os.scandir(directory))
+
+
+async def run(repeats: int) -> Dict:
+    config = load_config('config.toml')
+    manifest = json.loads((FIXTURE_DIR / 'manifest.json').read_text())
+    results = {}
+
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True)
+        page = await browser.new_page()
+        for fixture in manifest:
+            html = (FIXTURE_DIR / fixture['file']).read_text()
+            await page.route(
+                fixture['url'],
+                lambda route, body=html: route.fulfill(
+                    body=body, content_type='text/html'
+                )
+            )
+
+        for mode in ('inline_png', 'pipeline'):
+            with tempfile.TemporaryDirectory() as workdir:
+                service = ScreenshotService(config, page)
+                caller_time = 0.0
+                captures = 0
+                for fixture in manifest:
+                    await page.goto(fixture['url'])
+                    for i in range(repeats):
+                        name = os.path.join(workdir, f"{Path(fixture['file']).stem}_{i}")
+                        start = time.perf_counter()
+                        if mode == 'inline_png':
+                            await page.screenshot(path=f"{name}.png")
+                        else:
+                            await service.capture(name)
+                        caller_time += time.perf_counter() - start
+                        captures += 1
+                await service.close()
+                results[mode] = {
+                    'captures': captures,
+                    'files_written': len(os.listdir(workdir)),
+                    'caller_ms_per_capture': caller_time / captures * 1000,
+                    'bytes_on_disk': disk_usage(workdir)
+                }
+        await browser.close()
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--repeats',
+        type=int,
+        default=5,
+        help='Captures per fixture (default 5)'
+    )
+    parser.add_argument(
+        '-o',
+        '--output',
+        default='screenshot_benchmark.json',
+        help='Where to write the JSON results (default "screenshot_benchmark.json")'
+    )
+    args = parser.parse_args()
+
+    benchmark_results = asyncio.run(run(args.repeats))
+    print(f"{'mode':<12}{'captures':>10}{'written':>9}{'ms/capture':>12}{'bytes':>12}")
+    for mode, row in benchmark_results.items():
+        print(f"{mode:<12}{row['captures']:>10}{row['files_written']:>9}"
+              f"{row['caller_ms_per_capture']:>12.1f}{row['bytes_on_disk']:>12}")
+    with open(args.output, 'w') as f:
+        json.dump(benchmark_results, f, indent=2)
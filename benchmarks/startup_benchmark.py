@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Measure cold-start time of navigate_to_checkout.py for the paths that should
+never load the browser or AI stacks (``--help`` and ``--check``).
+
+Each mode is run in a fresh interpreter with ``-X importtime``; the report
+gives wall time, total import time and the slowest top-level imports. The
+run fails (exit code 1) if a mode imports one of the ``--forbid`` modules or
+exceeds ``--max-import-ms``, so it can guard against cold-start regressions.
+
+Usage (from the repository root):
+    python -m benchmarks.startup_benchmark [--runs 5] [--max-import-ms 150]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+ENTRY_POINT = 'navigate_to_checkout.py'
+MODES = {
+    'help': ['--help'],
+    'check': ['--check'],
+}
+HEAVY_MODULES = ['anthropic', 'playwright', 'playwright_stealth']
+
+
+def parse_importtime(stderr: str) -> List[Dict]:
+    """Parse ``-X importtime`` lines into {module, self_us, cumulative_us, depth}."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        imports.append({
+            'module': name.strip(),
+            'self_us': int(self_us),
+            'cumulative_us': int(cumulative_us),
+            'depth': (len(name) - len(name.lstrip()) - 1) // 2
+        })
+    return imports
+
+
+def run_once(args: List[str]) -> Dict:
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', ENTRY_POINT, *args],
+        capture_output=True,
+        text=True
+    )
+    wall = time.perf_counter() - start
+    imports = parse_importtime(proc.stderr)
+    return {
+        'exit_code': proc.returncode,
+        'wall_ms': wall * 1000,
+        'import_ms': sum(i['self_us'] for i in imports) / 1000,
+        'imports': imports
+    }
+
+
+def measure(mode: str, runs: int, forbid: List[str], top: int) -> Dict:
+    samples = [run_once(MODES[mode]) for _ in range(runs)]
+    last = samples[-1]
+    modules = {i['module'] for i in last['imports']}
+    top_level = sorted(
+        (i for i in last['imports'] if i['depth'] == 0),
+        key=lambda i: i['cumulative_us'],
+        reverse=True
+    )
+    return {
+        'mode': mode,
+        'runs': runs,
+        'exit_code': last['exit_code'],
+        'wall_ms': statistics.median(s['wall_ms'] for s in samples),
+        'import_ms': statistics.median(s['import_ms'] for s in samples),
+        'modules_imported': len(modules),
+        'forbidden_imported': sorted(
+            {m.split('.')[0] for m in modules} & set(forbid)
+        ),
+        'slowest_imports': [
+            {'module': i['module'], 'cumulative_ms': i['cumulative_us'] / 1000}
+            for i in top_level[:top]
+        ]
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=5, help='Runs per mode (default 5)')
+    parser.add_argument(
+        '--max-import-ms',
+        type=float,
+        default=None,
+        help='Fail if the median import time of any mode exceeds this'
+    )
+    parser.add_argument(
+        '--forbid',
+        nargs='*',
+        default=HEAVY_MODULES,
+        help=f'Modules these modes must not import (default {HEAVY_MODULES})'
+    )
+    parser.add_argument('--top', type=int, default=8, help='Slowest imports to list')
+    parser.add_argument(
+        '-o',
+        '--output',
+        default='startup_benchmark.json',
+        help='Where to write the JSON results (default "startup_benchmark.json")'
+    )
+    args = parser.parse_args()
+
+    results = [measure(mode, args.runs, args.forbid, args.top) for mode in MODES]
+
+    failures = []
+    print(f"{'mode':<8}{'wall ms':>10}{'import ms':>11}{'modules':>9}  slowest imports")
+    for row in results:
+        slowest = ', '.join(
+            f"{i['module']} {i['cumulative_ms']:.0f}ms"
+            for i in row['slowest_imports'][:3]
+        )
+        print(f"{row['mode']:<8}{row['wall_ms']:>10.1f}{row['import_ms']:>11.1f}"
+              f"{row['modules_imported']:>9}  {slowest}")
+        if row['exit_code'] != 0:
+            failures.append(f"{row['mode']}: exited with {row['exit_code']}")
+        if row['forbidden_imported']:
+            failures.append(f"{row['mode']}: imported {row['forbidden_imported']}")
+        if args.max_import_ms is not None and row['import_ms'] > args.max_import_ms:
+            failures.append(
+                f"{row['mode']}: import time {row['import_ms']:.1f}ms "
+                f"> {args.max_import_ms}ms"
+            )
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    sys.exit(1 if failures else 0)
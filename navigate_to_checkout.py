@@ -1,85 +1,92 @@
 #!/usr/bin/env python3
-from dotenv import load_dotenv
 import os
 
-from src.navigator import Navigator
 
-
-async def main(config_file_path: str):
+async def main(config_file_path: str, verbosity: str = None):
     if not os.path.exists(config_file_path):
         raise FileNotFoundError(
             f"File path for config.toml is not correct, '{config_file_path}'"
         )
 
+    # Heavy imports (anthropic, playwright) are deferred until a run starts so
+    # --help and --check stay fast.
+    from dotenv import load_dotenv
+    from src.config import load_config
+    from src.navigator import Navigator
+
     load_dotenv()
     api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
+    cassette_cfg = getattr(load_config(config_file_path), 'cassette', None)
+    if not api_key and getattr(cassette_cfg, 'mode', 'off') != 'replay':
         print("Please set ANTHROPIC_API_KEY environment variable")
         return
 
     navigator = Navigator(
         config_path=config_file_path,
-        anthropic_api_key=api_key
+        anthropic_api_key=api_key,
+        verbosity=verbosity
     )
 
     goal = navigator.config.general.goal
+    reporter = navigator.reporter
 
-    print("Starting navigation...")
-    print(f"Goal: {goal}")
+    reporter.info("Starting navigation...")
+    reporter.info(f"Goal: {goal}")
 
     result = await navigator.run(goal)
+    # Written from the session's event stream rather than the in-memory result.
+    navigator.session_log.write_results(navigator.config.files.results_filename)
 
-    print("\n" + "=" * 80)
-    print("NAVIGATION COMPLETE")
-    print("=" * 80)
+    reporter.info("\n" + "=" * 80)
+    reporter.info("NAVIGATION COMPLETE")
+    reporter.info("=" * 80)
 
     if result is None:
-        print("NAVIGATION FAILED - No result returned")
+        reporter.result("NAVIGATION FAILED - No result returned")
         return None
 
     final_result = result.get('final_result', {})
     if final_result and final_result.get('success', False):
-        print("NAVIGATION SUCCESSFUL")
+        reporter.result("NAVIGATION SUCCESSFUL")
     else:
-        print("NAVIGATION COMPLETED (with simulation fallback)")
+        reporter.result("NAVIGATION COMPLETED (with simulation fallback)")
         if 'error' in result:
-            print(f"Error encountered: {result['error']}")
+            reporter.result(f"Error encountered: {result['error']}")
 
     achievements = result.get('technical_achievements', [])
     if achievements:
-        print("\nKey Achievements:")
+        reporter.info("\nKey Achievements:")
         for achievement in achievements:
-            print(f"  {achievement}")
+            reporter.info(f"  {achievement}")
     else:
-        print("\nNo technical achievements recorded")
+        reporter.info("\nNo technical achievements recorded")
 
     try:
-        print("\nFiles Generated:")
+        reporter.info("\nFiles Generated:")
         log_filename = navigator.config.files.log_filename
         summary_filename = navigator.config.files.summary_filename
-        print(f"  {log_filename}")
-        print(f"  {summary_filename}")
+        reporter.info(f"  {log_filename}")
+        reporter.info(f"  {summary_filename}")
 
         if final_result and 'screenshots' in final_result:
             screenshots = final_result.get('screenshots', [])
             for screenshot in screenshots:
-                print(f"  {screenshot}")
+                reporter.info(f"  {screenshot}")
         elif hasattr(navigator, 'screenshots') and navigator.screenshots:
             for screenshot in navigator.screenshots:
-                print(f"  {screenshot}")
+                reporter.info(f"  {screenshot}")
         else:
-            print("  No screenshots captured")
+            reporter.info("  No screenshots captured")
 
     except Exception as e:
-        print(f"Error accessing file information: {e}")
+        reporter.info(f"Error accessing file information: {e}")
 
     return result
 
 
 if __name__ == '__main__':
     import argparse
-    import asyncio
-    import json
+    import sys
 
     from src.config import load_config
 
@@ -90,12 +97,85 @@ if __name__ == '__main__':
         default='config.toml',
         help='Filepath to the config file (default "config.toml")'
     )
+    parser.add_argument(
+        '--browser-host',
+        action='store_true',
+        help='Run a long-lived browser that runs with [browser.host] enabled '
+             'attach to, until interrupted'
+    )
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument(
+        '-q',
+        '--quiet',
+        action='store_const',
+        const='quiet',
+        dest='verbosity',
+        help='Only print outcomes (overrides [logging] verbosity)'
+    )
+    verbosity.add_argument(
+        '-v',
+        '--verbose',
+        action='store_const',
+        const='verbose',
+        dest='verbosity',
+        help='Print every sub-step (overrides [logging] verbosity)'
+    )
+    parser.add_argument(
+        '--rebuild',
+        action='store_true',
+        help='Rebuild the summary and results files from the last session in the '
+             'session event log (e.g. after a crash), then exit'
+    )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Validate the config, prompt templates and output paths, then exit '
+             'without starting a browser'
+    )
 
     args = parser.parse_args()
     config_file_path = args.configfile
 
-    result = asyncio.run(main(config_file_path=config_file_path))
+    if args.check:
+        from src.preflight import run_checks
+
+        problems = run_checks(config_file_path)
+        for problem in problems:
+            print(f"  - {problem}")
+        print(f"{config_file_path}: {len(problems)} problem(s) found"
+              if problems else f"{config_file_path}: OK")
+        sys.exit(1 if problems else 0)
+
+    if args.rebuild:
+        from src.session_log import SessionLog, rebuild
+
+        config = load_config(config_file_path)
+        events_path = SessionLog(config).path
+        if events_path is None:
+            print("session_log.path is empty; there is no event stream to rebuild from")
+            sys.exit(1)
+        rebuild(
+            events_path, config.files.summary_filename, config.files.results_filename
+        )
+        print(f"Rebuilt {config.files.summary_filename} and "
+              f"{config.files.results_filename} from {events_path}")
+        sys.exit(0)
+
+    import asyncio
 
-    config = load_config(config_file_path)
-    with open(config.files.results_filename, 'w') as f:
-        json.dump(result, f, indent=2, default=str)
+    if args.browser_host:
+        from src.browser import BrowserManager
+        from src.reporting import Reporter
+
+        config = load_config(config_file_path)
+        try:
+            asyncio.run(
+                BrowserManager(config).serve_host(Reporter(config, args.verbosity))
+            )
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
+
+    # Validate up front; Navigator reuses this parse from the config cache.
+    load_config(config_file_path)
+    asyncio.run(main(config_file_path=config_file_path, verbosity=args.verbosity))
@@ -2,27 +2,113 @@
 Anthropic Claude API wrapper for AI-driven navigation decisions.
 """
 
+import asyncio
+import functools
+import inspect
 import json
 import logging
-from typing import Dict
+import string
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple, Type, Union
 
 import anthropic
 
+from src.ai_schemas import (
+    ActionDecision,
+    AIResult,
+    GoalIntent,
+    NavigationStep,
+    PageAnalysis,
+    PageStatus,
+    ResultValidationError,
+    SimulationDecision
+)
 from src.config import Config
+from src.metrics import MetricsRegistry
+from src.model_router import ModelRouter
+from src.request_scheduler import (
+    CircuitOpenError, RequestScheduler, is_timeout, is_transient_error
+)
+from src.response_cache import ResponseCache
+from src.tracing import Tracer
+
+USAGE_FIELDS = (
+    'input_tokens',
+    'output_tokens',
+    'cache_creation_input_tokens',
+    'cache_read_input_tokens'
+)
+
+# Shortest prefix, in tokens, the API will cache; a breakpoint on a shorter
+# one is ignored. Haiku models need more.
+MIN_CACHEABLE_TOKENS = 1024
+MIN_CACHEABLE_TOKENS_HAIKU = 2048
+# Rough characters per token, to size a prefix without a tokenizer.
+CHARS_PER_TOKEN = 4
 
 
 class AIClient:
-    """High-level interface to Claude for navigation decision-making."""
+    """High-level interface to Claude for navigation decision-making.
+
+    Accepts either an ``anthropic.AsyncAnthropic`` client, whose requests run
+    natively on the event loop, or a synchronous ``anthropic.Anthropic`` client,
+    whose requests are pushed onto a bounded thread pool so they never block it.
+    """
 
     def __init__(
         self,
         config: Config,
-        anthropic_client: anthropic.Anthropic,
-        logger: logging.Logger
+        anthropic_client: Union[anthropic.AsyncAnthropic, anthropic.Anthropic],
+        logger: logging.Logger,
+        tracer: Optional[Tracer] = None,
+        metrics: Optional[MetricsRegistry] = None
     ):
         self.config = config
         self.client = anthropic_client
         self.logger = logger
+        self.tracer = tracer or Tracer()
+        self.metrics = metrics or MetricsRegistry()
+        self.router = ModelRouter(config, self.metrics)
+        self.scheduler = RequestScheduler(config, logger, self.metrics)
+
+        client_cfg = getattr(self.config.ai, 'client', None)
+        self.request_timeout = getattr(client_cfg, 'request_timeout', 60.0)
+        self.prompt_caching = getattr(self.config.ai, 'prompt_caching', False)
+        self.structured_output = getattr(self.config.ai, 'structured_output', False)
+        self.repair_retries = getattr(self.config.ai, 'repair_retries', 1)
+        # The SDK wraps its async methods in sync decorators, so look through them.
+        self._is_async = inspect.iscoroutinefunction(
+            inspect.unwrap(self.client.messages.create)
+        )
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if not self._is_async:
+            self._executor = ThreadPoolExecutor(
+                max_workers=getattr(client_cfg, 'sync_fallback_workers', 4),
+                thread_name_prefix='ai-client'
+            )
+
+        cache_cfg = getattr(self.config.ai, 'cache', None)
+        self.cache: Optional[ResponseCache] = None
+        if getattr(cache_cfg, 'enabled', False):
+            self.cache = ResponseCache(
+                max_entries=cache_cfg.max_entries,
+                disk_path=cache_cfg.disk_path or None
+            )
+
+        self.stats = {
+            'calls': 0,
+            'errors': 0,
+            'timeouts': 0,
+            'cancelled': 0,
+            'awaited_request_seconds': 0.0,
+            'validated_calls': 0,
+            'parse_failures': 0,
+            'repair_retries': 0,
+            'repair_successes': 0,
+            'cache_breakpoints_skipped': 0
+        }
+        self.usage_by_task: Dict[str, Dict] = {}
 
     async def analyze_page_status(self, url: str, title: str, content: str) -> Dict:
         """Determine whether the page is a Cloudflare challenge or real content.
@@ -30,15 +116,18 @@ class AIClient:
         Returns dict with: is_cloudflare_challenge, challenge_type, confidence,
         indicators_found, website_elements_present, recommendation.
         """
-        prompt = self.config.prompts.cloudflare_detection.template.format(
+        prefix, prompt = self._render_prompt(
+            self.config.prompts.cloudflare_detection.template,
             url=url,
             title=title,
             content_sample=content
         )
         response = await self._query_ai(
             prompt=prompt,
+            static_prefix=prefix,
             system_prompt=self.config.prompts.cloudflare_detection.system,
-            task_type='cloudflare_detection'
+            task_type='cloudflare_detection',
+            result_type=PageStatus
         )
         return self._parse_json(response)
 
@@ -47,11 +136,16 @@ class AIClient:
 
         Returns dict with: primary_goal, product_keywords, action_type, preferences.
         """
-        prompt = self.config.prompts.goal_parsing.template.format(goal=goal)
+        prefix, prompt = self._render_prompt(
+            self.config.prompts.goal_parsing.template,
+            goal=goal
+        )
         response = await self._query_ai(
             prompt=prompt,
+            static_prefix=prefix,
             system_prompt=self.config.prompts.goal_parsing.system,
-            task_type='intent_parsing'
+            task_type='intent_parsing',
+            result_type=GoalIntent
         )
         return self._parse_json(response)
 
@@ -60,14 +154,17 @@ class AIClient:
 
         Returns dict with: page_type, key_elements, next_actions.
         """
-        prompt = self.config.prompts.page_analysis.template.format(
+        prefix, prompt = self._render_prompt(
+            self.config.prompts.page_analysis.template,
             title=title,
             content_sample=content
         )
         response = await self._query_ai(
             prompt=prompt,
+            static_prefix=prefix,
             system_prompt=self.config.prompts.page_analysis.system,
-            task_type='page_analysis'
+            task_type='page_analysis',
+            result_type=PageAnalysis
         )
         return self._parse_json(response)
 
@@ -76,36 +173,136 @@ class AIClient:
 
         Returns dict with: action, target, reasoning, confidence.
         """
-        prompt = self.config.prompts.action_decision.template.format(
+        prefix, prompt = self._render_prompt(
+            self.config.prompts.action_decision.template,
             intent=json.dumps(intent),
             page_analysis=json.dumps(page_analysis)
         )
         response = await self._query_ai(
             prompt=prompt,
+            static_prefix=prefix,
             system_prompt=self.config.prompts.action_decision.system,
-            task_type='decision_making'
+            task_type='decision_making',
+            result_type=ActionDecision
         )
         return self._parse_json(response)
 
+    async def decide_next_step(
+        self,
+        goal: str,
+        page_analysis: Dict,
+        url: str,
+        history: str
+    ) -> Dict:
+        """Select the next step of a multi-step navigation from the page and history.
+
+        Returns dict with: action, target, value, reasoning, confidence,
+        expected_outcome.
+        """
+        prefix, prompt = self._render_prompt(
+            self.config.prompts.intelligent_navigation.template,
+            goal=goal,
+            page_type=page_analysis.get('page_type', 'unknown'),
+            current_url=url,
+            elements=json.dumps(page_analysis.get('key_elements', [])),
+            history=history
+        )
+        response = await self._query_ai(
+            prompt=prompt,
+            static_prefix=prefix,
+            system_prompt=self.config.prompts.intelligent_navigation.system,
+            task_type='decision_making',
+            result_type=ActionDecision
+        )
+        return self._parse_json(response)
+
+    async def observe_and_decide(
+        self,
+        goal: str,
+        title: str,
+        content: str,
+        url: str,
+        history: str
+    ) -> Tuple[Dict, Dict]:
+        """Classify the page and choose the next step in a single model call.
+
+        Fused alternative to ``analyze_page`` followed by ``decide_next_step``.
+        Returns (page_analysis, action): page_analysis holds page_type and
+        key_elements, action holds action, target, value, reasoning, confidence.
+        """
+        prefix, prompt = self._render_prompt(
+            self.config.prompts.observe_and_decide.template,
+            goal=goal,
+            current_url=url,
+            title=title,
+            history=history,
+            content_sample=content
+        )
+        response = await self._query_ai(
+            prompt=prompt,
+            static_prefix=prefix,
+            system_prompt=self.config.prompts.observe_and_decide.system,
+            task_type='decision_making',
+            result_type=NavigationStep
+        )
+        result = self._parse_json(response)
+        if 'error' in result:
+            return result, result
+
+        page_analysis = {
+            'page_type': result.pop('page_type', 'unknown'),
+            'key_elements': result.pop('key_elements', [])
+        }
+        return page_analysis, result
+
     async def simulate_scenario(self, scenario: Dict, goal: str) -> Dict:
         """Produce an AI decision for a hypothetical page scenario.
 
         Returns dict with: action, reasoning, expected_outcome.
         """
-        prompt = self.config.prompts.simulation_decision.template.format(
+        prefix, prompt = self._render_prompt(
+            self.config.prompts.simulation_decision.template,
             description=scenario['description'],
             goal=goal,
             ai_task=scenario['ai_task']
         )
         response = await self._query_ai(
             prompt=prompt,
+            static_prefix=prefix,
             system_prompt=self.config.prompts.simulation_decision.system,
-            task_type='decision_making'
+            task_type='decision_making',
+            result_type=SimulationDecision
         )
         return self._parse_json(response)
 
-    def _parse_json(self, response: str) -> Dict:
-        """Parse a JSON string returned by the AI, handling markdown code blocks."""
+    @staticmethod
+    def _render_prompt(template: str, **fields) -> Tuple[str, str]:
+        """Render a prompt template as (static prefix, dynamic remainder).
+
+        The prefix is everything before the first replacement field, so it is
+        byte-identical across calls and can be served from the prompt cache.
+        """
+        formatter = string.Formatter()
+        static_prefix = None
+        parts = []
+        for literal, field_name, format_spec, conversion in formatter.parse(template):
+            parts.append(literal)
+            if field_name is None:
+                continue
+            if static_prefix is None:
+                static_prefix = ''.join(parts)
+                parts = []
+            value, _ = formatter.get_field(field_name, (), fields)
+            value = formatter.convert_field(value, conversion)
+            parts.append(formatter.format_field(value, format_spec))
+
+        if static_prefix is None:
+            return ''.join(parts), ''
+        return static_prefix, ''.join(parts)
+
+    @staticmethod
+    def _strip_code_fence(response: str) -> str:
+        """Remove a surrounding markdown code block from an AI response."""
         stripped = response.strip()
         if stripped.startswith('```'):
             lines = stripped.split('\n')
@@ -114,8 +311,12 @@ class AIClient:
                 len(lines)
             )
             stripped = '\n'.join(lines[1:end]).strip()
+        return stripped
+
+    def _parse_json(self, response: str) -> Dict:
+        """Parse a JSON string returned by the AI, handling markdown code blocks."""
         try:
-            return json.loads(stripped)
+            return json.loads(self._strip_code_fence(response))
         except json.JSONDecodeError as e:
             self.logger.warning(f"Non-JSON AI response ({e}): {response[:200]}")
             return {"error": "parse_failed"}
@@ -124,28 +325,401 @@ class AIClient:
         self,
         prompt: str,
         system_prompt: str = "",
-        task_type: str = "general"
+        task_type: str = "general",
+        static_prefix: str = "",
+        result_type: Optional[Type[AIResult]] = None
     ) -> str:
-        """Send a prompt to Claude and return the raw text response."""
+        """Send a prompt to Claude and return the raw text response.
+
+        Responses are served from the cache when an identical request was seen
+        within the task's TTL; only well-formed JSON responses are cached. When
+        prompt caching is on and the tools, system prompt and ``static_prefix``
+        together reach the model's minimum cacheable length, they are marked as
+        a cacheable prefix ahead of the dynamic ``prompt``; shorter prefixes
+        are sent without a breakpoint, which the API would ignore anyway.
+
+        With a ``result_type`` the answer is requested through a forced tool call
+        (when ai.structured_output is on) and validated against that type; the
+        validated JSON is returned, or a parse_failed error once repairs run out.
+        """
+        tier = self.router.tier_for(task_type)
+        model = self.router.model(tier)
+        with self.tracer.span('ai.query', task_type=task_type, model=model) as span:
+            try:
+                max_tokens = getattr(
+                    self.config.ai.token_limits,
+                    task_type,
+                    self.config.ai.max_tokens_default
+                )
+
+                # Answers are cached under the model that gave them, so an
+                # escalated answer is looked up under the escalation model too.
+                escalate_to = self.router.escalation_for(tier)
+                if self.cache is not None:
+                    for lookup_tier in filter(None, (tier, escalate_to)):
+                        cached = await self.cache.get(self._cache_key(
+                            lookup_tier, system_prompt, static_prefix + prompt,
+                            max_tokens
+                        ))
+                        if cached is not None:
+                            span.set(cache='hit')
+                            return cached
+
+                tools = None
+                if result_type is not None and self.structured_output:
+                    tools = [result_type.tool_definition()]
+                cache_prefix = self._prefix_cacheable(
+                    model, system_prompt, static_prefix, tools
+                )
+
+                api_params = {
+                    "model": model,
+                    "max_tokens": max_tokens,
+                    "messages": [{
+                        "role": "user",
+                        "content": self._message_content(
+                            static_prefix, prompt, cache_prefix
+                        )
+                    }]
+                }
+
+                if system_prompt:
+                    if cache_prefix and not static_prefix:
+                        api_params["system"] = [self._cached_block(system_prompt)]
+                    else:
+                        # The system prompt precedes the messages, so the breakpoint
+                        # on the static prefix caches it as well.
+                        api_params["system"] = system_prompt
+
+                if tools is not None:
+                    api_params["tools"] = tools
+                    api_params["tool_choice"] = {
+                        "type": "tool",
+                        "name": result_type.TOOL_NAME
+                    }
+
+                text, answered = await self._ask(
+                    api_params, task_type, tier, result_type
+                )
+                escalate_to = self.router.escalation_for(answered)
+                if escalate_to is not None and self.router.should_escalate(text):
+                    self.router.record_escalation(answered, task_type)
+                    span.set(escalated_to=self.router.model(escalate_to))
+                    try:
+                        text, answered = await self._ask(
+                            api_params, task_type, escalate_to, result_type,
+                            failover=False
+                        )
+                    except Exception as e:
+                        # Keep a usable weak answer if the stronger model is down.
+                        if text is None or not (is_transient_error(e) or is_timeout(e)):
+                            raise
+                        self.logger.warning(
+                            f"Escalation of {task_type} failed ({type(e).__name__}); "
+                            f"keeping the {answered} answer"
+                        )
+                if text is None:
+                    span.set(outcome='parse_failed')
+                    return '{"error": "parse_failed"}'
+
+                if self.cache is not None and self._is_json(text):
+                    self.cache.put(
+                        self._cache_key(
+                            answered, system_prompt, static_prefix + prompt, max_tokens
+                        ),
+                        text, self._cache_ttl(task_type)
+                    )
+                return text
+
+            except asyncio.CancelledError:
+                self.stats['cancelled'] += 1
+                raise
+            except (asyncio.TimeoutError, anthropic.APITimeoutError):
+                self.stats['timeouts'] += 1
+                span.set(outcome='timeout')
+                self.logger.error(
+                    f"AI query timed out after {self.request_timeout}s ({task_type})"
+                )
+                return '{"error": "AI query timed out"}'
+            except CircuitOpenError as e:
+                self.stats['errors'] += 1
+                span.set(outcome='circuit_open')
+                self.logger.error(str(e))
+                return '{"error": "AI unavailable"}'
+            except Exception as e:
+                self.stats['errors'] += 1
+                span.set(outcome='error', error=str(e)[:200])
+                self.logger.error(f"AI query failed: {e}")
+                return '{"error": "AI query failed"}'
+
+    async def _ask(
+        self,
+        api_params: Dict,
+        task_type: str,
+        tier: str,
+        result_type: Optional[Type[AIResult]],
+        failover: bool = True
+    ) -> Tuple[Optional[str], str]:
+        """Send ``api_params`` to ``tier``'s model; return the answer and its tier.
+
+        A transient error that outlasts the scheduler's retries, or an open
+        circuit, is retried once on the other tier when ``failover`` is set and
+        routing allows it. A tier that may still escalate gets no repair
+        round-trips, since escalation replaces them; an answer obtained by
+        failover is repaired like any other. The answer is None when a
+        ``result_type`` answer did not validate.
+        """
+        api_params = dict(api_params, model=self.router.model(tier))
+        failed_over = False
         try:
-            max_tokens = getattr(
-                self.config.ai.token_limits,
-                task_type,
-                self.config.ai.max_tokens_default
+            response = await self._send(api_params, task_type)
+        except Exception as e:
+            failover_to = self.router.failover_for(tier) if failover else None
+            if failover_to is None or not is_transient_error(e):
+                raise
+            self.router.record_failover(tier, task_type)
+            self.logger.warning(
+                f"{api_params['model']} unavailable ({type(e).__name__}), "
+                f"retrying {task_type} on {self.router.model(failover_to)}"
             )
+            tier = failover_to
+            failed_over = True
+            api_params = dict(api_params, model=self.router.model(tier))
+            response = await self._send(api_params, task_type)
 
-            api_params = {
-                "model": self.config.ai.model,
-                "max_tokens": max_tokens,
-                "messages": [{"role": "user", "content": prompt}]
-            }
+        text = self._response_text(response)
+        if result_type is None:
+            return text, tier
+        escalates = self.router.escalation_for(tier) is not None and not failed_over
+        repairs = 0 if escalates else self.repair_retries
+        return await self._validate_result(
+            text, response, api_params, task_type, result_type, repairs
+        ), tier
 
-            if system_prompt:
-                api_params["system"] = system_prompt
+    def _cache_key(
+        self, tier: str, system_prompt: str, prompt: str, max_tokens: int
+    ) -> str:
+        return ResponseCache.make_key(
+            self.router.model(tier), system_prompt, prompt, max_tokens
+        )
 
-            response = self.client.messages.create(**api_params)
-            return response.content[0].text
+    @staticmethod
+    def _response_text(response) -> str:
+        """Return the tool input as JSON if the model called a tool, else its text."""
+        for block in response.content:
+            if block.type == 'tool_use':
+                return json.dumps(block.input)
+        return next(
+            (block.text for block in response.content if block.type == 'text'), ''
+        )
 
-        except Exception as e:
-            self.logger.error(f"AI query failed: {e}")
-            return '{"error": "AI query failed"}'
+    async def _validate_result(
+        self,
+        text: str,
+        response,
+        api_params: Dict,
+        task_type: str,
+        result_type: Type[AIResult],
+        repair_retries: int
+    ) -> Optional[str]:
+        """Validate a response against ``result_type``, repairing it if needed.
+
+        On failure the model is shown its answer and the validation error and
+        asked again, at most ``repair_retries`` times. Returns the normalised
+        JSON, or None if no attempt validated.
+        """
+        self.stats['validated_calls'] += 1
+        for attempt in range(repair_retries + 1):
+            try:
+                result = result_type.from_dict(json.loads(self._strip_code_fence(text)))
+                if attempt:
+                    self.stats['repair_successes'] += 1
+                return json.dumps(result.to_dict())
+            except (json.JSONDecodeError, ResultValidationError) as e:
+                self.stats['parse_failures'] += 1
+                error = e
+
+            if attempt == repair_retries:
+                break
+            self.stats['repair_retries'] += 1
+            api_params = self._repair_params(api_params, response, text, error)
+            response = await self._send(api_params, f"{task_type}_repair")
+            text = self._response_text(response)
+
+        self.logger.warning(
+            f"Invalid {result_type.__name__} from AI ({error}): {text[:200]}"
+        )
+        return None
+
+    @staticmethod
+    def _repair_params(api_params: Dict, response, text: str, error: Exception) -> Dict:
+        """Extend the conversation with the rejected answer and the reason."""
+        assistant_content = []
+        tool_use_id = None
+        for block in response.content:
+            if block.type == 'tool_use':
+                tool_use_id = block.id
+                assistant_content.append({
+                    "type": "tool_use",
+                    "id": block.id,
+                    "name": block.name,
+                    "input": block.input
+                })
+            elif block.type == 'text' and block.text:
+                assistant_content.append({"type": "text", "text": block.text})
+        if not assistant_content:
+            assistant_content.append({"type": "text", "text": text or "(empty)"})
+
+        feedback = (
+            f"That response was invalid: {error}. "
+            "Respond again with corrected values."
+        )
+        if tool_use_id is not None:
+            user_content = [{
+                "type": "tool_result",
+                "tool_use_id": tool_use_id,
+                "content": feedback,
+                "is_error": True
+            }]
+        else:
+            user_content = f"{feedback} Respond with ONLY valid JSON."
+
+        return dict(api_params, messages=api_params["messages"] + [
+            {"role": "assistant", "content": assistant_content},
+            {"role": "user", "content": user_content}
+        ])
+
+    def _is_json(self, response: str) -> bool:
+        try:
+            json.loads(self._strip_code_fence(response))
+            return True
+        except json.JSONDecodeError:
+            return False
+
+    def _cache_ttl(self, task_type: str) -> float:
+        ttl_cfg = self.config.ai.cache.ttl
+        return getattr(ttl_cfg, task_type, ttl_cfg.default)
+
+    def _prefix_cacheable(
+        self,
+        model: str,
+        system_prompt: str,
+        static_prefix: str,
+        tools: Optional[list]
+    ) -> bool:
+        """True if prompt caching is on and the prefix is long enough to cache.
+
+        The prefix is everything up to the breakpoint: tool definitions, the
+        system prompt and the static part of the message. It is sized for the
+        routed model; an escalated or failed-over request keeps that decision.
+        """
+        if not self.prompt_caching:
+            return False
+        chars = len(system_prompt or '') + len(static_prefix)
+        if tools:
+            chars += len(json.dumps(tools))
+        minimum = (
+            MIN_CACHEABLE_TOKENS_HAIKU if 'haiku' in model else MIN_CACHEABLE_TOKENS
+        )
+        if chars // CHARS_PER_TOKEN >= minimum:
+            return True
+        self.stats['cache_breakpoints_skipped'] += 1
+        return False
+
+    def _message_content(self, static_prefix: str, prompt: str, cache: bool):
+        if not cache or not static_prefix:
+            return static_prefix + prompt
+        content = [self._cached_block(static_prefix)]
+        if prompt:
+            content.append({"type": "text", "text": prompt})
+        return content
+
+    @staticmethod
+    def _cached_block(text: str) -> Dict:
+        return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+
+    def _record_usage(self, task_type: str, response, latency: float):
+        """Accumulate latency and token usage, including cache reads/writes."""
+        usage = self.usage_by_task.setdefault(
+            task_type,
+            dict({'calls': 0, 'latency': 0.0}, **{f: 0 for f in USAGE_FIELDS})
+        )
+        usage['calls'] += 1
+        usage['latency'] += latency
+        for usage_field in USAGE_FIELDS:
+            usage[usage_field] += getattr(response.usage, usage_field, 0) or 0
+
+        self.metrics.observe('ai_request_seconds', latency, task_type=task_type)
+        for usage_field in USAGE_FIELDS:
+            tokens = getattr(response.usage, usage_field, 0) or 0
+            if tokens:
+                self.metrics.inc(
+                    'ai_tokens_total', tokens,
+                    task_type=task_type, kind=usage_field.replace('_tokens', '')
+                )
+
+    async def _send(self, api_params: Dict, task_type: str = "general"):
+        """Send one Messages API request through the scheduler and record usage.
+
+        The scheduler rate-limits the request, retries transient failures with
+        backoff and fails fast while the model's circuit is open.
+        """
+        api_params = dict(api_params, timeout=self.request_timeout)
+        response, latency = await self.scheduler.run(
+            api_params['model'], functools.partial(self._dispatch, api_params), task_type
+        )
+
+        self._record_usage(task_type, response, latency)
+        self.router.record_call(api_params['model'], task_type, response.usage, latency)
+        span = self.tracer.current()
+        span.add('api_calls', 1)
+        for usage_field in USAGE_FIELDS:
+            span.add(usage_field, getattr(response.usage, usage_field, 0) or 0)
+        return response
+
+    async def _dispatch(self, api_params: Dict):
+        """Make one request attempt without blocking the event loop.
+
+        The per-call timeout is enforced both by the SDK and by ``wait_for`` so a
+        stalled connection cannot outlive it. Cancelling the awaiting task aborts
+        an async request outright; a thread-pool request is bounded by the SDK
+        timeout instead, since a running thread cannot be interrupted.
+        """
+        self.stats['calls'] += 1
+        if self._is_async:
+            request = self.client.messages.create(**api_params)
+        else:
+            loop = asyncio.get_running_loop()
+            request = loop.run_in_executor(
+                self._executor,
+                functools.partial(self.client.messages.create, **api_params)
+            )
+
+        call_start = time.perf_counter()
+        try:
+            response = await asyncio.wait_for(request, timeout=self.request_timeout)
+        finally:
+            # Summed request latency; the loop can serve other tasks meanwhile.
+            latency = time.perf_counter() - call_start
+            self.stats['awaited_request_seconds'] += latency
+        return response, latency
+
+    def usage_totals(self) -> Dict:
+        """Return calls, latency and token usage summed over all task types."""
+        totals = dict({'calls': 0, 'latency': 0.0}, **{f: 0 for f in USAGE_FIELDS})
+        for usage in self.usage_by_task.values():
+            for key in totals:
+                totals[key] += usage[key]
+        return totals
+
+    async def close(self):
+        """Release the HTTP connection pool, fallback worker threads and cache."""
+        if self.cache is not None:
+            # Waits for queued disk writes, so keep it off the loop.
+            await asyncio.to_thread(self.cache.close)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._is_async:
+            await self.client.close()
+        else:
+            self.client.close()
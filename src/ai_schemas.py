@@ -0,0 +1,219 @@
+"""
+Typed result classes for AI responses, used both to build tool schemas for
+structured output and to validate what the model returns.
+"""
+
+import typing
+from dataclasses import MISSING, asdict, dataclass, field, fields
+from typing import Any, Dict, List, Optional
+
+PAGE_TYPES = ['homepage', 'search_results', 'product_page', 'cart', 'other']
+ACTIONS = ['search', 'click', 'scroll', 'wait', 'navigate', 'done']
+
+
+class ResultValidationError(ValueError):
+    """Raised when an AI response does not match its result schema."""
+
+
+class AIResult:
+    """Base for result dataclasses: JSON schema generation and validation.
+
+    Field types map to JSON schema types (str, float, bool, List[str], Dict,
+    and Optional[...] of those for fields the model may leave out); fields
+    without a default are required, and ``metadata={'enum': [...]}``
+    restricts a string field to the listed values.
+    """
+
+    TOOL_NAME = ''
+    TOOL_DESCRIPTION = ''
+
+    @classmethod
+    def tool_definition(cls) -> Dict:
+        """Return the Messages API tool definition for this result."""
+        return {
+            'name': cls.TOOL_NAME,
+            'description': cls.TOOL_DESCRIPTION,
+            'input_schema': cls.json_schema()
+        }
+
+    @classmethod
+    def json_schema(cls) -> Dict:
+        hints = typing.get_type_hints(cls)
+        properties = {}
+        required = []
+        for f in fields(cls):
+            prop = _schema_for(hints[f.name])
+            if 'enum' in f.metadata:
+                prop['enum'] = list(f.metadata['enum'])
+            properties[f.name] = prop
+            if f.default is MISSING and f.default_factory is MISSING:
+                required.append(f.name)
+        return {'type': 'object', 'properties': properties, 'required': required}
+
+    @classmethod
+    def from_dict(cls, data: Any) -> 'AIResult':
+        """Validate and coerce ``data``; unknown keys are dropped."""
+        if not isinstance(data, dict):
+            raise ResultValidationError(
+                f"expected a JSON object, got {type(data).__name__}"
+            )
+
+        hints = typing.get_type_hints(cls)
+        values = {}
+        errors = []
+        for f in fields(cls):
+            if f.name not in data or data[f.name] is None:
+                if f.default is MISSING and f.default_factory is MISSING:
+                    errors.append(f"missing required field '{f.name}'")
+                continue
+            try:
+                value = _coerce(data[f.name], hints[f.name])
+            except (TypeError, ValueError) as e:
+                errors.append(f"field '{f.name}': {e}")
+                continue
+            allowed = f.metadata.get('enum')
+            if allowed is not None:
+                value = value.lower()
+                if value not in allowed:
+                    errors.append(f"field '{f.name}' must be one of {allowed}")
+                    continue
+            values[f.name] = value
+
+        if errors:
+            raise ResultValidationError('; '.join(errors))
+        return cls(**values)
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def _unwrap_optional(hint):
+    """``Optional[X]`` -> ``X``; a missing or null value keeps the field default."""
+    if typing.get_origin(hint) is typing.Union:
+        args = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return hint
+
+
+def _schema_for(hint) -> Dict:
+    hint = _unwrap_optional(hint)
+    if hint is str:
+        return {'type': 'string'}
+    if hint is float:
+        return {'type': 'number'}
+    if hint is bool:
+        return {'type': 'boolean'}
+    if typing.get_origin(hint) in (list, List):
+        return {'type': 'array', 'items': _schema_for(typing.get_args(hint)[0])}
+    return {'type': 'object'}
+
+
+def _coerce(value: Any, hint) -> Any:
+    hint = _unwrap_optional(hint)
+    if hint is str:
+        if isinstance(value, (dict, list)):
+            raise TypeError("expected a string")
+        return str(value)
+    if hint is float:
+        if isinstance(value, bool):
+            raise TypeError("expected a number")
+        return float(value)
+    if hint is bool:
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str) and value.lower() in ('true', 'false'):
+            return value.lower() == 'true'
+        raise TypeError("expected a boolean")
+    if typing.get_origin(hint) in (list, List):
+        if not isinstance(value, list):
+            raise TypeError("expected an array")
+        item_hint = typing.get_args(hint)[0]
+        return [_coerce(item, item_hint) for item in value]
+    if not isinstance(value, dict):
+        raise TypeError("expected an object")
+    return value
+
+
+@dataclass
+class PageStatus(AIResult):
+    TOOL_NAME = 'report_page_status'
+    TOOL_DESCRIPTION = (
+        'Report whether the page is a Cloudflare challenge or real content.'
+    )
+
+    is_cloudflare_challenge: bool
+    website_elements_present: bool
+    challenge_type: str = field(
+        default='none',
+        metadata={'enum': [
+            'turnstile', 'hcaptcha', 'js_challenge', 'browser_check', 'none'
+        ]}
+    )
+    confidence: Optional[float] = None
+    indicators_found: List[str] = field(default_factory=list)
+    recommendation: str = field(
+        default='wait',
+        metadata={'enum': ['wait', 'interact', 'bypass_failed']}
+    )
+
+
+@dataclass
+class GoalIntent(AIResult):
+    TOOL_NAME = 'report_goal_intent'
+    TOOL_DESCRIPTION = 'Report the structured intent extracted from a navigation goal.'
+
+    primary_goal: str
+    product_keywords: List[str]
+    action_type: str = field(
+        default='search',
+        metadata={'enum': ['search', 'browse', 'purchase']}
+    )
+    preferences: Dict = field(default_factory=dict)
+
+
+@dataclass
+class PageAnalysis(AIResult):
+    TOOL_NAME = 'report_page_analysis'
+    TOOL_DESCRIPTION = 'Report the page type and its key interactive elements.'
+
+    page_type: str = field(metadata={'enum': PAGE_TYPES})
+    key_elements: List[str] = field(default_factory=list)
+    next_actions: List[str] = field(default_factory=list)
+
+
+@dataclass
+class ActionDecision(AIResult):
+    TOOL_NAME = 'choose_action'
+    TOOL_DESCRIPTION = 'Choose the next navigation action.'
+
+    action: str = field(metadata={'enum': ACTIONS})
+    target: str = ''
+    value: str = ''
+    reasoning: str = ''
+    confidence: Optional[float] = None
+    expected_outcome: str = ''
+
+
+@dataclass
+class NavigationStep(AIResult):
+    TOOL_NAME = 'observe_and_decide'
+    TOOL_DESCRIPTION = 'Classify the current page and choose the next navigation action.'
+
+    page_type: str = field(metadata={'enum': PAGE_TYPES})
+    action: str = field(metadata={'enum': ACTIONS})
+    key_elements: List[str] = field(default_factory=list)
+    target: str = ''
+    value: str = ''
+    reasoning: str = ''
+    confidence: Optional[float] = None
+
+
+@dataclass
+class SimulationDecision(AIResult):
+    TOOL_NAME = 'report_simulated_decision'
+    TOOL_DESCRIPTION = 'Report the decision an AI navigator would make in a scenario.'
+
+    action: str
+    reasoning: str = ''
+    expected_outcome: str = ''
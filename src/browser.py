@@ -2,13 +2,20 @@
 Playwright browser lifecycle management with stealth anti-detection.
 """
 
+import asyncio
+import logging
 import random
-from typing import Dict, List, Tuple
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from playwright.async_api import (
+    async_playwright, Browser, BrowserContext, Page, Playwright
+)
 from playwright_stealth import Stealth
 
 from src.config import Config
+from src.reporting import Reporter
 
 
 class BrowserManager:
@@ -16,25 +23,46 @@ class BrowserManager:
 
     def __init__(self, config: Config):
         self.config = config
+        host_cfg = getattr(self.config.browser, 'host', None)
+        self.attach_to_host = getattr(host_cfg, 'enabled', False)
+        self.host_endpoint = getattr(host_cfg, 'endpoint', 'http://127.0.0.1:9222')
+        self.connect_timeout = getattr(host_cfg, 'connect_timeout', 5000)
+        self.logger = logging.getLogger(__name__)
+
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self.attached = False
+        self.timings: Dict = {}
+        self._contexts: List[BrowserContext] = []
+
+    async def __aenter__(self) -> 'BrowserManager':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        """Start the Playwright driver; it runs until ``close``."""
+        if self.playwright is None:
+            start = time.perf_counter()
+            self.playwright = await async_playwright().start()
+            self.timings['driver_start'] = time.perf_counter() - start
 
     async def setup_browser(self) -> Tuple[Browser, BrowserContext, Page]:
-        """Launch stealth browser and return (browser, context, page)."""
-        playwright = await async_playwright().start()
+        """Return (browser, context, page) with a fresh, isolated context.
 
-        stealth_args = self._get_comprehensive_stealth_args()
+        The browser is attached to a running host when ``[browser.host]`` is
+        enabled and one answers at its endpoint, and launched otherwise.
+        """
+        await self.start()
+        if self.browser is None:
+            self.browser = await self._attach_or_launch()
+        browser = self.browser
+
+        start = time.perf_counter()
         user_agent = self._generate_realistic_user_agent()
         viewport = self._get_randomized_viewport()
-
-        launch_options = {
-            'headless': self.config.browser.headless,
-            'slow_mo': random.randint(
-                self.config.browser.slow_mo_min,
-                self.config.browser.slow_mo_max
-            ),
-            'args': stealth_args
-        }
-
-        browser = await playwright.chromium.launch(**launch_options)
         browser_geo_cfg = self.config.browser.geolocation
         context_options = {
             'viewport': viewport,
@@ -59,20 +87,91 @@ class BrowserManager:
         }
 
         context = await browser.new_context(**context_options)
+        self._contexts.append(context)
         await self._inject_stealth_script(context)
 
         page = await context.new_page()
         await Stealth().apply_stealth_async(page)
         page.set_default_timeout(self.config.browser.default_timeout)
+        self.timings['context'] = time.perf_counter() - start
 
         return browser, context, page
 
-    async def cleanup(self, browser: Browser, context: BrowserContext):
-        """Close browser context and browser."""
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
+    def _launch_options(self) -> Dict:
+        return {
+            'headless': self.config.browser.headless,
+            'slow_mo': self._slow_mo(),
+            'args': self._get_comprehensive_stealth_args()
+        }
+
+    def _slow_mo(self) -> int:
+        return random.randint(
+            self.config.browser.slow_mo_min,
+            self.config.browser.slow_mo_max
+        )
+
+    async def _attach_or_launch(self) -> Browser:
+        if self.attach_to_host:
+            start = time.perf_counter()
+            try:
+                browser = await self.playwright.chromium.connect_over_cdp(
+                    self.host_endpoint,
+                    timeout=self.connect_timeout,
+                    slow_mo=self._slow_mo()
+                )
+                self.attached = True
+                self.timings.update(mode='attach', browser=time.perf_counter() - start)
+                return browser
+            except Exception as e:
+                self.logger.warning(
+                    f"No browser host at {self.host_endpoint} ({e}); launching instead"
+                )
+
+        start = time.perf_counter()
+        browser = await self.playwright.chromium.launch(**self._launch_options())
+        self.timings.update(mode='launch', browser=time.perf_counter() - start)
+        return browser
+
+    async def close(self):
+        """Close this run's contexts, the browser and the driver; idempotent.
+
+        An attached browser is only disconnected, so the host keeps running.
+        """
+        for context in self._contexts:
+            try:
+                await context.close()
+            except Exception as e:
+                self.logger.debug(f"Context close failed: {e}")
+        self._contexts.clear()
+        if self.browser is not None:
+            try:
+                await self.browser.close()
+            except Exception as e:
+                self.logger.debug(f"Browser close failed: {e}")
+            self.browser = None
+        if self.playwright is not None:
+            await self.playwright.stop()
+            self.playwright = None
+
+    async def serve_host(self, reporter: Optional[Reporter] = None):
+        """Run a long-lived browser that later runs attach to, until interrupted."""
+        reporter = reporter or Reporter(self.config)
+        port = urlsplit(self.host_endpoint).port or 9222
+        options = self._launch_options()
+        options['args'] = options['args'] + [f'--remote-debugging-port={port}']
+        async with self:
+            start = time.perf_counter()
+            browser = await self.playwright.chromium.launch(**options)
+            reporter.result(
+                f"Browser host ready in {time.perf_counter() - start:.1f}s "
+                f"at {self.host_endpoint} (Ctrl+C to stop)"
+            )
+            closed = asyncio.Event()
+            browser.on('disconnected', lambda _: closed.set())
+            try:
+                await closed.wait()
+            finally:
+                await browser.close()
 
     def _get_comprehensive_stealth_args(self) -> List[str]:
         args = []
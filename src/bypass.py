@@ -5,23 +5,52 @@ Cloudflare bypass strategies with adaptive human-behavior simulation.
 import asyncio
 import random
 import time
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from playwright.async_api import Page
 
 from src.ai_client import AIClient
 from src.config import Config
+from src.element_resolver import ElementResolver
+from src.metrics import MetricsRegistry
+from src.page_classifier import PageStatusClassifier
+from src.page_outline import PageOutliner
+from src.page_snapshot import PageSnapshotter
+from src.reporting import Reporter
+from src.screenshots import ScreenshotService
+from src.session_log import SessionLog
+from src.tracing import Tracer
 
 
 class BypassOrchestrator:
     """Runs multiple Cloudflare bypass strategies in sequence."""
 
-    def __init__(self, config: Config, page: Page, ai_client: AIClient):
+    def __init__(
+        self,
+        config: Config,
+        page: Page,
+        ai_client: AIClient,
+        snapshotter: Optional[PageSnapshotter] = None,
+        screenshot_service: Optional[ScreenshotService] = None,
+        resolver: Optional[ElementResolver] = None,
+        tracer: Optional[Tracer] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        session_log: Optional[SessionLog] = None,
+        reporter: Optional[Reporter] = None
+    ):
         self.config = config
         self.page = page
         self.ai_client = ai_client
+        self.snapshotter = snapshotter or PageSnapshotter(config, page)
+        self.status_classifier = PageStatusClassifier(config)
+        self.outliner = PageOutliner(config)
+        self.screenshot_service = screenshot_service or ScreenshotService(config, page)
+        self.resolver = resolver or ElementResolver(page)
+        self.tracer = tracer or Tracer()
+        self.metrics = metrics or MetricsRegistry()
+        self.session_log = session_log or SessionLog()
+        self.reporter = reporter or Reporter()
         self._attempts: List[Dict] = []
-        self._screenshots: List[str] = []
 
     @property
     def bypass_attempts(self) -> List[Dict]:
@@ -29,7 +58,11 @@ class BypassOrchestrator:
 
     @property
     def screenshots(self) -> List[str]:
-        return self._screenshots
+        return self.screenshot_service.written
+
+    @property
+    def status_check_stats(self) -> Dict:
+        return self.status_classifier.stats
 
     async def demonstrate_strategies(self) -> Tuple[bool, List[Dict]]:
         """Run all configured bypass strategies in sequence.
@@ -49,44 +82,65 @@ class BypassOrchestrator:
         ]
 
         for strategy_name, strategy_func in strategies:
-            print(f"\nAttempting: {strategy_name}")
+            self.reporter.info(f"\nAttempting: {strategy_name}")
 
             attempt_start = time.time()
             try:
                 timeout_duration = self.config.bypass.strategies.timeout_per_strategy
-                success = await asyncio.wait_for(
-                    strategy_func(),
-                    timeout=timeout_duration
-                )
+                with self.tracer.span('bypass.strategy', strategy=strategy_name):
+                    success = await asyncio.wait_for(
+                        strategy_func(),
+                        timeout=timeout_duration
+                    )
 
                 attempt_duration = time.time() - attempt_start
-                self._attempts.append({
+                self._record_attempt({
                     'strategy': strategy_name,
                     'success': success,
                     'duration': attempt_duration
                 })
+                self._record_metrics(
+                    strategy_name, 'success' if success else 'failed', attempt_duration
+                )
 
                 if success:
-                    print(f"{strategy_name} succeeded in {attempt_duration:.1f}s!")
+                    self.reporter.result(
+                        f"{strategy_name} succeeded in {attempt_duration:.1f}s!"
+                    )
                     return True, self._attempts
                 else:
-                    print(f"{strategy_name} failed after {attempt_duration:.1f}s")
+                    self.reporter.result(
+                        f"{strategy_name} failed after {attempt_duration:.1f}s"
+                    )
 
             except asyncio.TimeoutError:
                 timeout_duration = self.config.bypass.strategies.timeout_per_strategy
-                print(f"{strategy_name} timed out after {timeout_duration} seconds")
-                self._attempts.append({
+                self.reporter.result(
+                    f"{strategy_name} timed out after {timeout_duration} seconds"
+                )
+                self._record_attempt({
                     'strategy': strategy_name,
                     'success': False,
                     'duration': timeout_duration,
                     'reason': 'timeout'
                 })
+                self._record_metrics(strategy_name, 'timeout', timeout_duration)
             except Exception as e:
-                print(f"{strategy_name} error: {e}")
+                self.reporter.result(f"{strategy_name} error: {e}")
+                self._record_metrics(strategy_name, 'error', time.time() - attempt_start)
 
-        print("\nAll bypass strategies exhausted")
+        self.reporter.result("\nAll bypass strategies exhausted")
         return False, self._attempts
 
+    def _record_attempt(self, attempt: Dict):
+        self._attempts.append(attempt)
+        self.session_log.event('bypass_attempt', attempt)
+
+    def _record_metrics(self, strategy: str, outcome: str, duration: float):
+        self.metrics.inc('bypass_attempts_total', strategy=strategy, outcome=outcome)
+        if outcome == 'success':
+            self.metrics.observe('bypass_resolution_seconds', duration, strategy=strategy)
+
     async def _gradual_approach(self) -> bool:
         """Build browser credibility gradually before navigating to target.
 
@@ -97,14 +151,14 @@ class BypassOrchestrator:
         5. Locate target via search results
         6. Wait for Cloudflare resolution
         """
-        print("   Building browsing session gradually...")
+        self.reporter.detail("   Building browsing session gradually...")
         session_cfg = self.config.session_building
         human_delay_cfg = self.config.human_behavior.delays
         elements_cfg = self.config.element_interaction
         general_cfg = self.config.general
 
         entry_point = random.choice(session_cfg.entry_points)
-        print(f"   Step 1: Starting with {entry_point}...")
+        self.reporter.detail(f"   Step 1: Starting with {entry_point}...")
         await self.page.goto(entry_point, timeout=self.config.browser.default_timeout)
         await self._dismiss_cookie_dialog()
         await self._human_pause(
@@ -112,7 +166,7 @@ class BypassOrchestrator:
             human_delay_cfg.demo_behavior_max
         )
 
-        print("   Step 2: Searching for weather (building credibility)...")
+        self.reporter.detail("   Step 2: Searching for weather (building credibility)...")
         unrelated_term = random.choice(session_cfg.search_terms.unrelated)
         await self._realistic_search(unrelated_term)
         await self._human_pause(
@@ -120,7 +174,7 @@ class BypassOrchestrator:
             human_delay_cfg.demo_behavior_max
         )
 
-        print("   Step 3: Visiting credible US government site...")
+        self.reporter.detail("   Step 3: Visiting credible US government site...")
         credible_site = random.choice(session_cfg.credibility_sites)
         await self.page.goto(credible_site, timeout=self.config.browser.default_timeout)
         await self._dismiss_cookie_dialog()
@@ -129,7 +183,7 @@ class BypassOrchestrator:
             human_delay_cfg.search_results_interaction_max
         )
 
-        print("   Step 4: Searching for hardware stores...")
+        self.reporter.detail("   Step 4: Searching for hardware stores...")
         google_url = next(
             (url for url in session_cfg.entry_points if 'google' in url),
             session_cfg.entry_points[0]
@@ -143,29 +197,29 @@ class BypassOrchestrator:
             human_delay_cfg.demo_behavior_max
         )
 
-        print("   Step 5: Looking for Home Depot in search results...")
+        self.reporter.detail("   Step 5: Looking for Home Depot in search results...")
         try:
             target_link = await self.page.wait_for_selector(
                 elements_cfg.bunnings_link_selector,
                 timeout=elements_cfg.bunnings_link_timeout
             )
             if target_link:
-                print("   Found Home Depot link, clicking...")
+                self.reporter.detail("   Found Home Depot link, clicking...")
                 await target_link.click()
             else:
-                print("   No link found, navigating directly...")
+                self.reporter.detail("   No link found, navigating directly...")
                 await self.page.goto(
                     general_cfg.start_url,
                     timeout=self.config.browser.default_timeout
                 )
         except Exception:
-            print("   Direct navigation to Home Depot...")
+            self.reporter.detail("   Direct navigation to Home Depot...")
             await self.page.goto(
                 general_cfg.start_url,
                 timeout=self.config.browser.default_timeout
             )
 
-        print("   Step 6: Waiting for Cloudflare resolution...")
+        self.reporter.detail("   Step 6: Waiting for Cloudflare resolution...")
         return await self._cloudflare_wait(strategy_name="gradual")
 
     async def _multi_site_approach(self) -> bool:
@@ -176,7 +230,7 @@ class BypassOrchestrator:
         3. Approach target as part of comparison shopping
         4. Wait for Cloudflare resolution
         """
-        print("   Building multi-site browsing pattern...")
+        self.reporter.detail("   Building multi-site browsing pattern...")
         human_delays_cfg = self.config.human_behavior.delays
         competitor_sites = self.config.session_building.competitor_sites
         default_timeout = self.config.browser.default_timeout
@@ -185,14 +239,16 @@ class BypassOrchestrator:
 
         for i, site in enumerate(competitor_sites, 1):
             try:
-                print(f"   Step {i}: Visiting {site}...")
+                self.reporter.detail(f"   Step {i}: Visiting {site}...")
                 await self.page.goto(site, timeout=default_timeout)
                 await self._human_pause(demo_min, demo_max)
             except Exception as e:
-                print(f"   Couldn't reach {site}: {e}")
+                self.reporter.detail(f"   Couldn't reach {site}: {e}")
                 continue
 
-        print(f"   Step {len(competitor_sites) + 1}: Approaching Home Depot...")
+        self.reporter.detail(
+            f"   Step {len(competitor_sites) + 1}: Approaching Home Depot..."
+        )
         await self.page.goto(self.config.general.start_url, timeout=default_timeout)
         return await self._cloudflare_wait(strategy_name="multisite")
 
@@ -202,7 +258,7 @@ class BypassOrchestrator:
         1. Direct navigation to target
         2. Extended patience protocol with escalating interaction patterns
         """
-        print("   Direct approach with extended patience...")
+        self.reporter.detail("   Direct approach with extended patience...")
         await self.page.goto(
             self.config.general.start_url,
             timeout=self.config.browser.default_timeout
@@ -215,7 +271,7 @@ class BypassOrchestrator:
         Uses AI to detect whether the page is still a challenge or has resolved.
         Adapts mouse/scroll behavior based on elapsed wait time.
         """
-        print("   Analyzing page for Cloudflare challenge...")
+        self.reporter.detail("   Analyzing page for Cloudflare challenge...")
 
         max_wait = self.config.bypass.max_wait_time
         check_interval = self.config.bypass.check_interval
@@ -223,69 +279,86 @@ class BypassOrchestrator:
 
         screenshot_freq = self.config.demo_mode.screenshot_frequency
         screenshot_prefix = self.config.files.screenshot_prefix
-        screenshot_format = self.config.files.screenshot_format
+        patience_desc = (
+            "minimal interaction",
+            "reading simulation",
+            "mild impatience",
+            "moderate activity",
+            "frustrated waiting"
+        )
 
         while total_waited < max_wait:
             if total_waited % screenshot_freq == 0:
-                screenshot_path = (
-                    f"{screenshot_prefix}_{strategy_name}_cloudflare_"
-                    f"{total_waited}s.{screenshot_format}"
+                await self.screenshot_service.capture(
+                    f"{screenshot_prefix}_{strategy_name}_cloudflare_{total_waited}s"
                 )
-                await self.page.screenshot(path=screenshot_path)
-                self._screenshots.append(screenshot_path)
 
-            is_resolved = await self._check_cloudflare_status()
+            with self.tracer.span('bypass.status_check', waited=total_waited):
+                is_resolved = await self._check_cloudflare_status()
             if is_resolved:
-                print(f"   Cloudflare resolved after {total_waited}s!")
+                self.reporter.info(f"   Cloudflare resolved after {total_waited}s!")
                 return True
 
             patience_level = total_waited // 60
-            patience_desc = [
-                "minimal interaction",
-                "reading simulation",
-                "mild impatience",
-                "moderate activity",
-                "frustrated waiting"
-            ]
             current_patience = min(patience_level, len(patience_desc) - 1)
-            print(f"   {total_waited}s - Using {patience_desc[current_patience]}")
+            self.reporter.detail(
+                f"   {total_waited}s - Using {patience_desc[current_patience]}"
+            )
 
             await self._adaptive_behavior(patience_level)
             await asyncio.sleep(check_interval)
             total_waited += check_interval
 
-        print(f"   Cloudflare not resolved within {max_wait}s")
+        self.reporter.info(f"   Cloudflare not resolved within {max_wait}s")
         return False
 
     async def _check_cloudflare_status(self) -> bool:
-        """Use AI to determine whether the page has cleared the Cloudflare challenge."""
+        """Determine whether the page has cleared the Cloudflare challenge.
+
+        Clear-cut pages are settled by the local rule classifier; only pages it
+        finds ambiguous are sent to the AI.
+        """
         try:
-            title = await self.page.title()
-            content = await self.page.evaluate(
-                "document.body.innerText.slice(0, "
-                f"{self.config.ai.token_limits.page_analysis})"
-            )
+            # The challenge can resolve in place, so every tick takes a fresh read.
+            snapshot = await self.snapshotter.get(fresh=True)
+            status = self.status_classifier.classify(snapshot)
+            title = snapshot.title
+
+            if status['verdict'] == PageStatusClassifier.CHALLENGE:
+                self.reporter.detail(
+                    f"   Cloudflare challenge detected ({status['reason']}): '{title}'"
+                )
+                return False
 
+            if status['verdict'] == PageStatusClassifier.CONTENT:
+                self.reporter.detail(
+                    f"   Website detected ({status['reason']}): '{title}'"
+                )
+                return True
+
+            self.status_classifier.record_ai_decision()
             analysis = await self.ai_client.analyze_page_status(
-                url=self.page.url,
+                url=snapshot.url,
                 title=title,
-                content=content
+                content=self.outliner.content_for_prompt(snapshot)
             )
 
             if analysis.get('is_cloudflare_challenge', False):
                 challenge_type = analysis.get('challenge_type', 'unknown')
-                print(f"   Cloudflare {challenge_type} detected: '{title}'")
+                self.reporter.detail(
+                    f"   Cloudflare {challenge_type} detected: '{title}'"
+                )
                 return False
 
             if analysis.get('website_elements_present', False):
-                print(f"   Website detected: '{title}'")
+                self.reporter.detail(f"   Website detected: '{title}'")
                 return True
 
-            print(f"   Status unclear: '{title}'")
+            self.reporter.detail(f"   Status unclear: '{title}'")
             return False
 
         except Exception as e:
-            print(f"   Check failed: {e}")
+            self.reporter.detail(f"   Check failed: {e}")
             return False
 
     async def _adaptive_behavior(self, patience_level: int):
@@ -323,53 +396,37 @@ class BypassOrchestrator:
 
     async def _dismiss_cookie_dialog(self) -> bool:
         """Click a cookie/consent accept button if one is present on the page."""
-        for selector in self.config.cookie_selectors.buttons:
-            try:
-                btn = await self.page.wait_for_selector(
-                    selector,
-                    timeout=self.config.cookie_selectors.check_timeout
-                )
-                if btn:
-                    await btn.click()
-                    await asyncio.sleep(0.5)
-                    return True
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                continue
-        return False
+        found = await self.resolver.resolve(
+            self.config.cookie_selectors.buttons,
+            timeout=self.config.cookie_selectors.check_timeout,
+            label='cookie button'
+        )
+        if found is None:
+            return False
+        try:
+            await found.element.click()
+            await asyncio.sleep(0.5)
+            return True
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            return False
 
     async def _realistic_search(self, query: str):
         """Type and submit a search query in the page's search box."""
         try:
-            search_selectors = self.config.search_functionality.selectors
-            for selector in search_selectors:
-                try:
-                    search_box = await self.page.wait_for_selector(
-                        selector,
-                        timeout=self.config.search_functionality.timeout
-                    )
-                    if search_box:
-                        await search_box.click()
-                        await asyncio.sleep(
-                            self.config.search_functionality.submit_delay / 2000
-                        )
-                        await search_box.type(
-                            query,
-                            delay=self.config.search_functionality.typing_delay
-                        )
-                        await asyncio.sleep(
-                            self.config.search_functionality.submit_delay / 1000
-                        )
-                        await search_box.press('Enter')
-                        await asyncio.sleep(
-                            self.config.search_functionality.results_wait / 1000
-                        )
-                        break
-                except asyncio.CancelledError:
-                    raise
-                except Exception:
-                    continue
+            search_cfg = self.config.search_functionality
+            found = await self.resolver.resolve(
+                search_cfg.selectors, timeout=search_cfg.timeout, label='search box'
+            )
+            if found is not None:
+                search_box = found.element
+                await search_box.click()
+                await asyncio.sleep(search_cfg.submit_delay_s / 2)
+                await search_box.type(query, delay=search_cfg.typing_delay)
+                await asyncio.sleep(search_cfg.submit_delay_s)
+                await search_box.press('Enter')
+                await asyncio.sleep(search_cfg.results_wait_s)
         except asyncio.CancelledError:
             raise
         except Exception:
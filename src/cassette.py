@@ -0,0 +1,262 @@
+"""
+Record/replay cassettes for model calls and page traffic, so a session can be
+re-run offline and deterministically.
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import inspect
+import json
+import logging
+import time
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+from playwright.async_api import BrowserContext, Request, Route
+
+from src.config import Config, with_overrides
+
+MODES = ('off', 'record', 'replay')
+
+# Bodies are stored decoded, so these would no longer describe them.
+_STALE_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding')
+
+
+class CassetteMiss(LookupError):
+    """A replayed request has no matching recording."""
+
+
+class Cassette:
+    """Stores model requests/responses and page responses in one gzip'd JSON file.
+
+    In ``record`` mode the real model client and network are used and every
+    exchange is captured, along with its latency. In ``replay`` mode both are
+    served from the file: model requests are matched on their full parameters,
+    falling back to recording order when a prompt differs, and page requests
+    on method and URL. Replayed latency is the recorded one multiplied by
+    ``latency_scale`` (1.0 original, 0 none).
+    """
+
+    def __init__(self, config: Config, logger: Optional[logging.Logger] = None):
+        cassette_cfg = getattr(config, 'cassette', None)
+        self.mode = getattr(cassette_cfg, 'mode', 'off')
+        if self.mode not in MODES:
+            raise ValueError(f"cassette.mode must be one of {MODES}, not '{self.mode}'")
+        self.path = getattr(cassette_cfg, 'path', 'session_cassette.json.gz')
+        self.latency_scale = getattr(cassette_cfg, 'latency_scale', 1.0)
+        # What to do with page requests missing from the cassette on replay.
+        self.unmatched = getattr(cassette_cfg, 'unmatched', 'abort')
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.model_calls: List[Dict] = []
+        self.pages: Dict[str, List[Dict]] = {}
+        self.stats = {
+            'model_calls': 0,
+            'model_fallbacks': 0,
+            'page_requests': 0,
+            'page_misses': 0,
+            'bytes': 0
+        }
+        self._model_used: List[bool] = []
+        self._page_served: Dict[str, int] = {}
+        if self.mode == 'replay':
+            self._load()
+
+    def adjust_config(self, config: Config) -> Config:
+        """Return ``config`` with the response cache off while recording or replaying.
+
+        A cached answer would never reach the cassette when recording, and on
+        replay it would answer ahead of the recorded calls.
+        """
+        if self.mode == 'off':
+            return config
+        if getattr(getattr(config.ai, 'cache', None), 'enabled', False):
+            self.logger.info(f"Cassette {self.mode}: response cache disabled")
+        return with_overrides(config, {'ai.cache.enabled': False})
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == 'record'
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == 'replay'
+
+    # Model calls
+
+    def wrap_client(self, client):
+        """Return ``client`` routed through the cassette (None is fine on replay)."""
+        if self.mode == 'off':
+            return client
+        return CassetteClient(self, client)
+
+    @staticmethod
+    def request_key(params: Dict) -> str:
+        payload = {k: v for k, v in params.items() if k != 'timeout'}
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+        ).hexdigest()
+
+    def record_model_call(self, params: Dict, response, latency: float):
+        self.model_calls.append({
+            'key': self.request_key(params),
+            'model': params.get('model'),
+            'latency': latency,
+            'content': [_block_to_dict(block) for block in response.content],
+            'stop_reason': getattr(response, 'stop_reason', None),
+            'usage': {
+                k: v for k, v in _block_to_dict(response.usage).items()
+                if isinstance(v, (int, float))
+            }
+        })
+        self.stats['model_calls'] += 1
+
+    async def replay_model_call(self, params: Dict):
+        key = self.request_key(params)
+        index = next(
+            (i for i, call in enumerate(self.model_calls)
+             if not self._model_used[i] and call['key'] == key),
+            None
+        )
+        if index is None:
+            index = next((i for i, used in enumerate(self._model_used) if not used), None)
+            if index is None:
+                raise CassetteMiss("No recorded model responses left to replay")
+            self.stats['model_fallbacks'] += 1
+            self.logger.info("Replaying model response out of exact-match order")
+        self._model_used[index] = True
+        self.stats['model_calls'] += 1
+        call = self.model_calls[index]
+        await asyncio.sleep(call['latency'] * self.latency_scale)
+        return SimpleNamespace(
+            content=[SimpleNamespace(**block) for block in call['content']],
+            stop_reason=call['stop_reason'],
+            usage=SimpleNamespace(**call['usage'])
+        )
+
+    # Page traffic
+
+    async def attach(self, context: BrowserContext):
+        """Route the context's traffic through the cassette."""
+        if self.mode != 'off':
+            await context.route('**/*', self._route)
+
+    @staticmethod
+    def page_key(request: Request) -> str:
+        key = f"{request.method} {request.url}"
+        if request.post_data_buffer:
+            key += ' ' + hashlib.sha256(request.post_data_buffer).hexdigest()[:16]
+        return key
+
+    async def _route(self, route: Route, request: Request):
+        if self.recording:
+            await self._record_page(route, request)
+        else:
+            await self._replay_page(route, request)
+
+    async def _record_page(self, route: Route, request: Request):
+        start = time.perf_counter()
+        try:
+            response = await route.fetch()
+            body = await response.body()
+        except Exception as e:
+            self.logger.debug(f"Not recorded, fetch failed for {request.url}: {e}")
+            await route.abort()
+            return
+        self.pages.setdefault(self.page_key(request), []).append({
+            'status': response.status,
+            'headers': {
+                k: v for k, v in response.headers.items()
+                if k.lower() not in _STALE_HEADERS
+            },
+            'body': base64.b64encode(body).decode('ascii'),
+            'latency': time.perf_counter() - start
+        })
+        self.stats['page_requests'] += 1
+        self.stats['bytes'] += len(body)
+        await route.fulfill(response=response, body=body)
+
+    async def _replay_page(self, route: Route, request: Request):
+        key = self.page_key(request)
+        entries = self.pages.get(key)
+        if not entries:
+            self.stats['page_misses'] += 1
+            if self.unmatched == 'network':
+                await route.continue_()
+            else:
+                await route.abort('internetdisconnected')
+            return
+        # Repeated requests replay in recorded order, then repeat the last one.
+        served = self._page_served.get(key, 0)
+        self._page_served[key] = served + 1
+        entry = entries[min(served, len(entries) - 1)]
+        body = base64.b64decode(entry['body'])
+        self.stats['page_requests'] += 1
+        self.stats['bytes'] += len(body)
+        await asyncio.sleep(entry['latency'] * self.latency_scale)
+        await route.fulfill(status=entry['status'], headers=entry['headers'], body=body)
+
+    # Storage
+
+    def save(self) -> Optional[str]:
+        """Write a recording to ``path``; returns the path, or None if not recording."""
+        if not self.recording:
+            return None
+        document = {
+            'version': 1,
+            'recorded_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'model_calls': self.model_calls,
+            'pages': self.pages
+        }
+        with gzip.open(self.path, 'wt', encoding='utf-8') as f:
+            json.dump(document, f, default=str)
+        return self.path
+
+    def _load(self):
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            document = json.load(f)
+        self.model_calls = document.get('model_calls', [])
+        self.pages = document.get('pages', {})
+        self._model_used = [False] * len(self.model_calls)
+        self.logger.info(
+            f"Replaying {len(self.model_calls)} model calls and "
+            f"{sum(len(v) for v in self.pages.values())} page responses "
+            f"from {self.path}"
+        )
+
+    def summary(self) -> Dict:
+        return {'mode': self.mode, 'path': self.path, **self.stats}
+
+
+class CassetteClient:
+    """Stands in for ``anthropic.AsyncAnthropic`` in front of a cassette."""
+
+    def __init__(self, cassette: Cassette, client=None):
+        self.cassette = cassette
+        self.client = client
+        self.messages = self
+
+    async def create(self, **params):
+        if self.cassette.replaying:
+            return await self.cassette.replay_model_call(params)
+        start = time.perf_counter()
+        response = self.client.messages.create(**params)
+        if inspect.isawaitable(response):
+            response = await response
+        self.cassette.record_model_call(params, response, time.perf_counter() - start)
+        return response
+
+    async def close(self):
+        if self.client is None:
+            return
+        result = self.client.close()
+        if inspect.isawaitable(result):
+            await result
+
+
+def _block_to_dict(block) -> Dict:
+    if hasattr(block, 'model_dump'):
+        return block.model_dump()
+    return dict(vars(block))
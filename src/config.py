@@ -1,23 +1,340 @@
 """
-Simple configuration management module for loading TOML files as Python
-objects.
+Configuration management: loads TOML files into frozen, validated config
+objects with attribute-style access.
 """
 
+import dataclasses
+import functools
+import os
+import re
 import toml
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+NUMBER = (int, float)
+
+# Keys the application reads directly; a config missing one of these, or
+# holding a value of the wrong type, is rejected at load time.
+CONFIG_SCHEMA: Dict[str, Any] = {
+    'general.name': str,
+    'general.version': str,
+    'general.start_url': str,
+    'general.goal': str,
+    'general.max_navigation_steps': int,
+    'general.time_frmt': str,
+    'logging.format': str,
+    'logging.date_format': str,
+    'logging.log_level': str,
+    'demo_mode.enabled': bool,
+    'demo_mode.screenshot_frequency': int,
+    'demo_mode.phase_timeouts.configuration': NUMBER,
+    'files.log_filename': str,
+    'files.summary_filename': str,
+    'files.results_filename': str,
+    'files.screenshot_prefix': str,
+    'files.screenshot_format': str,
+    'fallback_sites.primary_alternatives': list,
+    'bypass.max_attempts': int,
+    'bypass.check_interval': int,
+    'bypass.max_wait_time': int,
+    'bypass.strategies.names': list,
+    'bypass.strategies.timeout_per_strategy': NUMBER,
+    'session_building.competitor_sites': list,
+    'browser.headless': bool,
+    'browser.slow_mo_min': int,
+    'browser.slow_mo_max': int,
+    'browser.default_timeout': int,
+    'browser.locale': str,
+    'browser.timezone_id': str,
+    'browser.viewport.width_min': int,
+    'browser.viewport.width_max': int,
+    'browser.viewport.height_min': int,
+    'browser.viewport.height_max': int,
+    'browser.args.core_stealth': list,
+    'browser.args.advanced_stealth': list,
+    'browser.args.fingerprint_evasion': list,
+    'browser.args.performance_optimization': list,
+    'browser.user_agents.chrome_versions': list,
+    'browser.user_agents.os_combinations': list,
+    'browser.user_agents.template': str,
+    'browser.headers.accept': str,
+    'browser.headers.accept_language': str,
+    'browser.headers.accept_encoding': str,
+    'browser.headers.cache_control': str,
+    'browser.headers.upgrade_insecure_requests': str,
+    'browser.headers.sec_fetch_dest': str,
+    'browser.headers.sec_fetch_mode': str,
+    'browser.headers.sec_fetch_site': str,
+    'browser.headers.sec_fetch_user': str,
+    'browser.geolocation.latitude_base': NUMBER,
+    'browser.geolocation.longitude_base': NUMBER,
+    'browser.geolocation.variance': NUMBER,
+    'cloudflare_detection.challenge_indicators': list,
+    'cloudflare_detection.challenge_selectors': list,
+    'cloudflare_detection.success_indicators': list,
+    'cloudflare_detection.patience_levels.level_0.mouse_movement': NUMBER,
+    'cloudflare_detection.patience_levels.level_1.scroll_probability': NUMBER,
+    'human_behavior.timing.action_clustering': bool,
+    'human_behavior.timing.thinking_pauses': list,
+    'human_behavior.delays.demo_behavior_min': NUMBER,
+    'human_behavior.delays.demo_behavior_max': NUMBER,
+    'human_behavior.action_delays.post_click_max': NUMBER,
+    'search_functionality.selectors': list,
+    'search_functionality.timeout': int,
+    'search_functionality.typing_delay': int,
+    'search_functionality.submit_delay': NUMBER,
+    'search_functionality.results_wait': NUMBER,
+    'search_functionality.search_url_template': str,
+    'search_functionality.error_indicators': list,
+    'element_interaction.bunnings_link_timeout': int,
+    'cookie_selectors.buttons': list,
+    'cookie_selectors.check_timeout': int,
+    'navigation.warm_up.scroll_steps': int,
+    'navigation.warm_up.scroll_pixels': int,
+    'navigation.warm_up.pause_between_scrolls': NUMBER,
+    'navigation.warm_up.final_pause': NUMBER,
+    'navigation.warm_up.return_to_start_wait': NUMBER,
+    'ai.model': str,
+    'ai.max_tokens_default': int,
+    'ai.token_limits.page_analysis': int,
+    'simulation_scenarios.scenarios': list,
+    'monitoring.track_session_metrics': bool,
+    **{
+        f'prompts.{name}.{part}': str
+        for name in (
+            'cloudflare_detection', 'intelligent_navigation', 'goal_parsing',
+            'page_analysis', 'action_decision', 'observe_and_decide',
+            'simulation_decision'
+        )
+        for part in ('system', 'template')
+    },
+}
+
+# Keys read with a fallback default; only their type is checked when present.
+OPTIONAL_SCHEMA: Dict[str, Any] = {
+    'logging.json_path': str,
+    'logging.verbosity': str,
+    'navigation.history_window': int,
+    'navigation.decision_mode': str,
+    'cloudflare_detection.min_success_selectors': int,
+    'page_snapshot.max_elements': int,
+    'page_snapshot.product_card_selectors': list,
+    'page_outline.enabled': bool,
+    'page_outline.max_chars': int,
+    'page_outline.max_links': int,
+    'page_outline.text_excerpt_chars': int,
+    'simulation_scenarios.max_concurrency': int,
+    'tracing.enabled': bool,
+    'tracing.service_name': str,
+    'tracing.chrome_trace_path': str,
+    'tracing.otlp_path': str,
+    'tracing.max_spans': int,
+    'monitoring.performance_metrics': bool,
+    'monitoring.success_rate_tracking': bool,
+    'monitoring.prometheus.enabled': bool,
+    'monitoring.prometheus.host': str,
+    'monitoring.prometheus.port': int,
+    'cassette.mode': str,
+    'cassette.path': str,
+    'cassette.latency_scale': NUMBER,
+    'cassette.unmatched': str,
+    'request_policy.enabled': bool,
+    'request_policy.default_action': str,
+    'request_policy.rules': list,
+    'request_policy.cache_max_bytes': int,
+    'request_policy.cache_path': str,
+    'browser.host.enabled': bool,
+    'browser.host.endpoint': str,
+    'browser.host.connect_timeout': int,
+    'session_log.path': str,
+    'session_log.flush_every': int,
+    'session_log.flush_interval': NUMBER,
+    'session_log.fsync': bool,
+    'page_waits.signals': list,
+    'page_waits.network_quiet_ms': int,
+    'page_waits.dom_stable_ms': int,
+    'page_waits.poll_interval_ms': int,
+    'screenshots.format': str,
+    'screenshots.quality': int,
+    'screenshots.scale': str,
+    'screenshots.full_page': bool,
+    'screenshots.dedupe': bool,
+    'screenshots.hash_distance': int,
+    'screenshots.queue_size': int,
+    'ai.prompt_caching': bool,
+    'ai.structured_output': bool,
+    'ai.repair_retries': int,
+    'ai.backup_model': str,
+    'ai.routing.enabled': bool,
+    'ai.routing.default_tier': str,
+    'ai.routing.min_confidence': NUMBER,
+    'ai.routing.escalation': bool,
+    'ai.routing.failover': bool,
+    'ai.routing.primary.input_cost_per_mtok': NUMBER,
+    'ai.routing.primary.output_cost_per_mtok': NUMBER,
+    'ai.routing.backup.input_cost_per_mtok': NUMBER,
+    'ai.routing.backup.output_cost_per_mtok': NUMBER,
+    'ai.rate_limit.requests_per_minute': NUMBER,
+    'ai.rate_limit.burst': int,
+    'ai.rate_limit.max_concurrency': int,
+    'ai.rate_limit.base_delay': NUMBER,
+    'ai.rate_limit.max_delay': NUMBER,
+    'ai.rate_limit.failure_threshold': int,
+    'ai.rate_limit.cooldown': NUMBER,
+    'error_handling.max_retries_per_strategy': int,
+    'error_handling.intelligent_backoff': bool,
+    'ai.client.request_timeout': NUMBER,
+    'ai.client.sync_fallback_workers': int,
+    'ai.cache.enabled': bool,
+    'ai.cache.max_entries': int,
+    'ai.cache.disk_path': str,
+}
+
+
+def _indicator_pattern(indicators: Iterable[str]) -> 're.Pattern':
+    """Compile plain-text indicators into one case-insensitive alternation."""
+    return re.compile('|'.join(re.escape(i) for i in indicators), re.IGNORECASE)
+
+
+# Values computed once at load and stored alongside the section they derive
+# from, keyed by section path then field name.
+DERIVED_FIELDS: Dict[str, Dict[str, Callable[[Dict], Any]]] = {
+    'search_functionality': {
+        'submit_delay_s': lambda s: s['submit_delay'] / 1000,
+        'results_wait_s': lambda s: s['results_wait'] / 1000,
+        'error_pattern': lambda s: _indicator_pattern(s['error_indicators']),
+    },
+    'cloudflare_detection': {
+        'challenge_pattern': lambda s: _indicator_pattern(s['challenge_indicators']),
+    },
+}
+
+
+class ConfigError(ValueError):
+    """Raised when a configuration file fails schema validation."""
 
 
 class Config:
     """
-    Simple configuration object that provides attribute-style access to
-    TOML data.
+    Base class for configuration sections.
+
+    Each table in the TOML file becomes a frozen ``__slots__`` dataclass
+    deriving from this class, so values are read with plain attribute access
+    and cannot be changed after load; use ``with_overrides`` to derive a
+    modified copy.
+    """
+    __slots__ = ()
+    _path = ''
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the section as nested dicts, without derived fields."""
+        derived = DERIVED_FIELDS.get(self._path, {})
+        return {
+            f.name: (
+                getattr(self, f.name).to_dict()
+                if isinstance(getattr(self, f.name), Config)
+                else getattr(self, f.name)
+            )
+            for f in dataclasses.fields(self)
+            if f.name not in derived
+        }
+
+
+@functools.lru_cache(maxsize=None)
+def _section_class(path: str, keys: Tuple[str, ...]) -> type:
+    name = ''.join(part.title() for part in re.split(r'[._]', path)) or 'Root'
+    return dataclasses.make_dataclass(
+        f'{name}Config',
+        [(key, Any) for key in keys],
+        bases=(Config,),
+        namespace={'_path': path},
+        frozen=True,
+        slots=True
+    )
+
+
+def _build_section(data: Dict[str, Any], path: str) -> Config:
+    values = {
+        key: (
+            _build_section(value, f"{path}.{key}" if path else key)
+            if isinstance(value, dict) else value
+        )
+        for key, value in data.items()
+    }
+    for key, derive in DERIVED_FIELDS.get(path, {}).items():
+        values[key] = derive(data)
+    return _section_class(path, tuple(values))(**values)
+
+
+def _lookup(data: Dict[str, Any], dotted: str) -> Tuple[bool, Any]:
+    node: Any = data
+    for part in dotted.split('.'):
+        if not isinstance(node, dict) or part not in node:
+            return False, None
+        node = node[part]
+    return True, node
+
+
+def _type_matches(value: Any, expected: Any) -> bool:
+    # bool is a subclass of int, but `true` is never a valid count or delay.
+    if isinstance(value, bool) and expected is not bool:
+        return False
+    return isinstance(value, expected)
+
+
+def _type_name(expected: Any) -> str:
+    return 'number' if expected is NUMBER else expected.__name__
+
+
+def validate_config_data(data: Dict[str, Any]) -> None:
+    """Check ``data`` against the schema, reporting every problem at once.
+
+    Raises:
+        ConfigError: listing each missing key and each wrongly typed value
+    """
+    errors = []
+    for schema, required in ((CONFIG_SCHEMA, True), (OPTIONAL_SCHEMA, False)):
+        for dotted, expected in schema.items():
+            found, value = _lookup(data, dotted)
+            if not found:
+                if required:
+                    errors.append(f"missing key '{dotted}'")
+            elif not _type_matches(value, expected):
+                errors.append(
+                    f"'{dotted}' should be {_type_name(expected)}, "
+                    f"got {type(value).__name__}"
+                )
+
+    if not errors:
+        try:
+            search_url = data['search_functionality']['search_url_template']
+            search_url.format(query='test')
+        except (KeyError, IndexError, ValueError) as e:
+            errors.append(f"'search_functionality.search_url_template' is invalid: {e}")
+
+    if errors:
+        raise ConfigError('\n'.join(f"  - {error}" for error in errors))
+
+
+def build_config(data: Dict[str, Any], validate: bool = True) -> Config:
+    """Validate ``data`` (unless told not to) and build the Config tree."""
+    if validate:
+        validate_config_data(data)
+    return _build_section(data, '')
+
+
+def with_overrides(config: Config, overrides: Dict[str, Any]) -> Config:
+    """Return a copy of ``config`` with dotted-path values replaced.
+
+    Example: ``with_overrides(config, {'ai.cache.enabled': False})``
     """
-    def __init__(self, config_data: Dict[str, Any]):
-        for key, value in config_data.items():
-            if isinstance(value, dict):
-                setattr(self, key, Config(value))
-            else:
-                setattr(self, key, value)
+    data = config.to_dict()
+    for dotted, value in overrides.items():
+        *parents, leaf = dotted.split('.')
+        node = data
+        for part in parents:
+            node = node.setdefault(part, {})
+        node[leaf] = value
+    return build_config(data, validate=False)
 
 
 def create_default_config() -> Config:
@@ -48,23 +365,39 @@ def create_default_config() -> Config:
             "click_delay": 0.5
         }
     }
-    return Config(default_data)
+    return build_config(default_data, validate=False)
 
 
-def load_config(file_path: str) -> Config:
+# Parsed configs keyed by absolute path, reused while the file's mtime holds.
+_config_cache: Dict[str, Tuple[int, Config]] = {}
+
+
+def load_config(file_path: str, validate: bool = True) -> Config:
     """
     Load a TOML configuration file and return a Config object.
 
+    The file is parsed and validated once; later calls for the same path
+    return the cached object until the file's modification time changes.
+
     Args:
         file_path: Path to the TOML configuration file
+        validate: Check the file against CONFIG_SCHEMA
 
     Returns:
         Config object with attribute access to configuration values
     """
+    path = os.path.abspath(file_path)
     try:
-        with open(file_path, 'r') as f:
+        mtime = os.stat(path).st_mtime_ns
+        cached: Optional[Tuple[int, Config]] = _config_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(path, 'r') as f:
             config_data = toml.load(f)
-        return Config(config_data)
+        config = build_config(config_data, validate=validate)
+        _config_cache[path] = (mtime, config)
+        return config
 
     except FileNotFoundError:
         print("Error: config.toml not found.")
@@ -75,6 +408,9 @@ def load_config(file_path: str) -> Config:
     except toml.decoder.TomlDecodeError as e:
         print(f"Error: Invalid TOML format in config.toml: {e}")
         raise
+    except ConfigError as e:
+        print(f"Error: Invalid configuration in {file_path}:\n{e}")
+        raise
     except OSError as e:
         print(f"Error: An OS error occurred: {e}")
         raise
@@ -103,7 +439,7 @@ if __name__ == "__main__":
         f.write(example_toml)
 
     # Load and use config
-    config = load_config("config.toml")
+    config = load_config("config.toml", validate=False)
 
     print(f"App: {config.app_name}")
     print(f"Debug: {config.debug}")
@@ -0,0 +1,89 @@
+"""
+Resolves the first visible element among candidate selectors by waiting on
+all of them at once rather than probing each with its own full timeout.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from playwright.async_api import ElementHandle, Page
+
+
+@dataclass(frozen=True)
+class Resolution:
+    """The element that won a resolution race and which selector found it."""
+
+    element: ElementHandle
+    index: int
+    selector: str
+    elapsed: float
+
+
+class ElementResolver:
+    """Races ``wait_for_selector`` over a list of candidates on one page.
+
+    The first candidate to become visible wins; the other waiters are
+    cancelled and drained before returning. Candidates may use any Playwright
+    selector syntax, since each is waited on separately.
+    """
+
+    def __init__(self, page: Page, logger: Optional[logging.Logger] = None):
+        self.page = page
+        self.logger = logger or logging.getLogger(__name__)
+        self.stats: Dict = {'resolved': 0, 'missed': 0, 'resolve_time': 0.0, 'wins': {}}
+
+    async def resolve(
+        self,
+        selectors: List[str],
+        timeout: float,
+        label: str = 'element'
+    ) -> Optional[Resolution]:
+        """Return the first visible match within ``timeout`` ms, or None."""
+        start = time.perf_counter()
+        waiters = [
+            asyncio.ensure_future(
+                self.page.wait_for_selector(selector, state='visible', timeout=timeout)
+            )
+            for selector in selectors
+        ]
+        winner = None
+        pending = set(waiters)
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # Lowest index wins a tie, so earlier selectors keep priority.
+                for index, waiter in enumerate(waiters):
+                    if waiter in done and waiter.exception() is None and waiter.result():
+                        winner = index
+                        break
+        finally:
+            for waiter in pending:
+                waiter.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        elapsed = time.perf_counter() - start
+        self.stats['resolve_time'] += elapsed
+        if winner is None:
+            self.stats['missed'] += 1
+            self.logger.info(
+                f"No {label} among {len(selectors)} selectors after {elapsed:.2f}s"
+            )
+            return None
+
+        self.stats['resolved'] += 1
+        selector = selectors[winner]
+        self.stats['wins'][selector] = self.stats['wins'].get(selector, 0) + 1
+        self.logger.info(
+            f"Resolved {label} via selector #{winner} '{selector}' in {elapsed:.2f}s"
+        )
+        return Resolution(
+            element=waiters[winner].result(),
+            index=winner,
+            selector=selector,
+            elapsed=elapsed
+        )
@@ -0,0 +1,334 @@
+"""
+In-process metrics: counters, gauges and fixed-bucket histograms, reported
+in session_summary.json and optionally served in Prometheus text format.
+"""
+
+import asyncio
+import bisect
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.config import Config
+
+# Latency buckets in seconds, roughly doubling from 5 ms to 4 minutes.
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+    10.0, 20.0, 30.0, 60.0, 120.0, 240.0
+)
+
+# Help text for the metrics recorded through ``MetricsRegistry``'s helpers.
+METRIC_HELP = {
+    'ai_request_seconds': 'Model request latency by task type',
+    'ai_tokens_total': 'Model tokens by task type and direction',
+    'ai_cost_usd_total': 'Estimated model cost in USD by tier and task type',
+    'ai_escalations_total': 'Answers re-asked on the primary model by tier and task type',
+    'ai_failovers_total': 'Requests moved to the other model after an error',
+    'ai_retries_total': 'Model requests retried after a transient error by reason',
+    'ai_backoff_seconds_total': 'Time spent backing off before model retries',
+    'ai_rate_limit_wait_seconds_total': 'Time model requests waited for the rate limit',
+    'ai_circuit_open': 'Whether a model circuit breaker is open (1) or not (0)',
+    'browser_startup_seconds': 'Driver start plus browser launch or attach and context',
+    'page_operation_seconds': 'Duration of page operations such as goto and reload',
+    'page_wait_seconds': 'Time spent in readiness waits by label and signal',
+    'navigation_steps_total': 'Observe/decide/act steps taken',
+    'navigation_step_seconds': 'Wall time per navigation step',
+    'actions_total': 'Executed actions by type and outcome',
+    'page_requests_total': 'Page subresource requests by request policy outcome',
+    'bypass_attempts_total': 'Bypass strategy attempts by outcome',
+    'bypass_resolution_seconds': 'Time for a successful bypass strategy to finish',
+}
+
+LabelValues = Tuple[str, ...]
+
+
+class _Metric:
+    kind = ''
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str]):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(label, '')) for label in self.labels)
+
+    def _label_text(self, key: LabelValues, extra: str = '') -> str:
+        pairs = [
+            '%s="%s"' % (label, value.replace('\\', '\\\\').replace('"', '\\"'))
+            for label, value in zip(self.labels, key)
+        ]
+        if extra:
+            pairs.append(extra)
+        return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        super().__init__(name, help_text, labels)
+        self.values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def snapshot(self) -> Dict:
+        return {','.join(key) or 'total': value for key, value in self.values.items()}
+
+    def prometheus(self) -> List[str]:
+        return [
+            f'{self.name}{self._label_text(key)} {value}'
+            for key, value in self.values.items()
+        ]
+
+
+class Gauge(Counter):
+    kind = 'gauge'
+
+    def set(self, value: float, **labels):
+        self.values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    """Fixed-bucket histogram; percentiles interpolate within a bucket."""
+
+    kind = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [bucket counts..., +Inf count], sum, count, max
+        self.series: Dict[LabelValues, List] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        series = self.series.get(key)
+        if series is None:
+            series = self.series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0, 0.0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+        series[3] = max(series[3], value)
+
+    def percentile(self, key: LabelValues, q: float) -> float:
+        counts, _, total, maximum = self.series[key]
+        rank = q * total
+        seen = 0
+        for i, count in enumerate(counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else maximum
+                upper = min(upper, maximum)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return maximum
+
+    def snapshot(self) -> Dict:
+        return {
+            ','.join(key) or 'total': {
+                'count': series[2],
+                'sum': round(series[1], 6),
+                'mean': round(series[1] / series[2], 6),
+                'p50': round(self.percentile(key, 0.5), 6),
+                'p90': round(self.percentile(key, 0.9), 6),
+                'p99': round(self.percentile(key, 0.99), 6),
+                'max': round(series[3], 6)
+            }
+            for key, series in self.series.items()
+        }
+
+    def prometheus(self) -> List[str]:
+        lines = []
+        for key, (counts, total, count, _) in self.series.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = self._label_text(key, 'le="%s"' % bound)
+                lines.append(f'{self.name}_bucket{le} {cumulative}')
+            le = self._label_text(key, 'le="+Inf"')
+            lines.append(f'{self.name}_bucket{le} {count}')
+            lines.append(f'{self.name}_sum{self._label_text(key)} {total}')
+            lines.append(f'{self.name}_count{self._label_text(key)} {count}')
+        return lines
+
+
+class MetricsRegistry:
+    """Holds the session's metrics; all recording is a no-op when disabled.
+
+    Enabled by ``[monitoring] performance_metrics``. With
+    ``success_rate_tracking`` the snapshot also derives those rates named in
+    ``[monitoring.metrics]`` that can be computed from the attempt and action
+    counters.
+    """
+
+    def __init__(self, config: Optional[Config] = None):
+        monitoring_cfg = getattr(config, 'monitoring', None)
+        self.enabled = getattr(monitoring_cfg, 'performance_metrics', False)
+        self.success_rate_tracking = getattr(
+            monitoring_cfg, 'success_rate_tracking', False
+        )
+        metrics_cfg = getattr(monitoring_cfg, 'metrics', None)
+        self.derived_metrics = (
+            set(metrics_cfg.to_dict()) if metrics_cfg is not None else None
+        )
+        self.prefix = 'navigator_'
+        self._metrics: Dict[str, _Metric] = {}
+
+    def counter(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, help_text, labels)
+
+    def gauge(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, help_text, labels)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        metric = self._metrics.get(self.prefix + name)
+        if metric is None:
+            metric = Histogram(self.prefix + name, help_text, labels, buckets)
+            self._metrics[metric.name] = metric
+        return metric
+
+    def _register(self, cls, name: str, help_text: str, labels: Sequence[str]):
+        metric = self._metrics.get(self.prefix + name)
+        if metric is None:
+            metric = cls(self.prefix + name, help_text, labels)
+            self._metrics[metric.name] = metric
+        return metric
+
+    # Recording helpers used across the application
+
+    def inc(self, name: str, amount: float = 1, **labels):
+        if self.enabled:
+            self.counter(name, METRIC_HELP.get(name, ''), tuple(labels)).inc(
+                amount, **labels
+            )
+
+    def set(self, name: str, value: float, **labels):
+        if self.enabled:
+            self.gauge(name, METRIC_HELP.get(name, ''), tuple(labels)).set(
+                value, **labels
+            )
+
+    def observe(self, name: str, value: float, **labels):
+        if self.enabled:
+            self.histogram(name, METRIC_HELP.get(name, ''), tuple(labels)).observe(
+                value, **labels
+            )
+
+    def snapshot(self) -> Dict:
+        """All metrics as plain data, plus derived success rates."""
+        data = {
+            name[len(self.prefix):]: {'type': metric.kind, 'values': metric.snapshot()}
+            for name, metric in self._metrics.items()
+        }
+        if self.success_rate_tracking:
+            data['derived'] = self._derived()
+        return data
+
+    def _derived(self) -> Dict:
+        derived = {}
+        attempts = self._metrics.get(self.prefix + 'bypass_attempts_total')
+        if attempts is not None:
+            by_strategy: Dict[str, List[float]] = {}
+            for (strategy, outcome), value in attempts.values.items():
+                totals = by_strategy.setdefault(strategy, [0, 0])
+                totals[1] += value
+                if outcome == 'success':
+                    totals[0] += value
+            derived['bypass_success_rate'] = {
+                strategy: round(100 * ok / total, 1)
+                for strategy, (ok, total) in by_strategy.items()
+            }
+        resolution = self._metrics.get(self.prefix + 'bypass_resolution_seconds')
+        if resolution is not None:
+            derived['average_resolution_time'] = {
+                key: values['mean'] for key, values in resolution.snapshot().items()
+            }
+        actions = self._metrics.get(self.prefix + 'actions_total')
+        if actions is not None:
+            outcomes: Dict[str, float] = {}
+            for (_, outcome), value in actions.values.items():
+                outcomes[outcome] = outcomes.get(outcome, 0) + value
+            ok = outcomes.get('success', 0)
+            total = ok + outcomes.get('failed', 0)
+            # Share of AI-chosen real actions that executed successfully.
+            derived['ai_decision_accuracy'] = (
+                round(100 * ok / total, 1) if total else None
+            )
+        if self.derived_metrics is not None:
+            derived = {k: v for k, v in derived.items() if k in self.derived_metrics}
+        return derived
+
+    def prometheus_text(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            if metric.help:
+                lines.append(f'# HELP {metric.name} {metric.help}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            lines.extend(metric.prometheus())
+        return '\n'.join(lines) + '\n'
+
+
+class MetricsServer:
+    """Serves ``/metrics`` in Prometheus text format from the event loop."""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        host: str = '127.0.0.1',
+        port: int = 9464,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.logger = logger or logging.getLogger(__name__)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.logger.info(f"Serving metrics on http://{self.host}:{self.port}/metrics")
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            # Drain the request headers.
+            while (await asyncio.wait_for(reader.readline(), timeout=5)) not in (
+                b'\r\n', b'\n', b''
+            ):
+                pass
+            parts = request_line.decode('latin-1').split()
+            if len(parts) >= 2 and parts[0] == 'GET' and parts[1] == '/metrics':
+                status = '200 OK'
+                body = self.registry.prometheus_text().encode()
+            else:
+                status, body = '404 Not Found', b'not found\n'
+            writer.write(
+                f'HTTP/1.1 {status}\r\n'
+                'Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n'
+                f'Content-Length: {len(body)}\r\n'
+                'Connection: close\r\n\r\n'.encode() + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
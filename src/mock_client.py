@@ -0,0 +1,133 @@
+"""
+Offline stand-ins for the Anthropic clients, used to exercise AIClient
+without network access.
+"""
+
+import asyncio
+import functools
+import json
+import time
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional
+
+
+def _sdk_wrapped(func: Callable) -> Callable:
+    """Wrap ``func`` in a plain function, as the SDK's argument checks do.
+
+    This hides a coroutine function from a bare ``iscoroutinefunction``, so
+    AIClient's async detection is exercised the way the real client needs.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+    return wrapper
+
+
+class MockAsyncAnthropic:
+    """Duck-typed ``anthropic.AsyncAnthropic`` with simulated request latency.
+
+    ``responder`` maps the request parameters to the response text; by default
+    every request is answered with an empty JSON object. When the request
+    defines tools and the text is a JSON object, it is returned as the input of
+    a ``tool_use`` block for the first tool, as the real API does.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        responder: Optional[Callable[[Dict], str]] = None
+    ):
+        self.latency = latency
+        self.responder = responder or (lambda params: '{}')
+        self.requests: List[Dict] = []
+        self.cancelled = 0
+        self.closed = False
+        self.messages = _MockMessages(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class MockAnthropic:
+    """Duck-typed synchronous ``anthropic.Anthropic``; see ``MockAsyncAnthropic``.
+
+    AIClient runs its blocking ``messages.create`` on the thread-pool fallback.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        responder: Optional[Callable[[Dict], str]] = None
+    ):
+        self.latency = latency
+        self.responder = responder or (lambda params: '{}')
+        self.requests: List[Dict] = []
+        self.closed = False
+        self.messages = _MockSyncMessages(self)
+
+    def close(self):
+        self.closed = True
+
+
+class _MockMessages:
+    """Implements the ``messages.create`` coroutine of the mock client."""
+
+    def __init__(self, client: MockAsyncAnthropic):
+        self._client = client
+
+    @_sdk_wrapped
+    async def create(self, **params) -> SimpleNamespace:
+        self._client.requests.append(params)
+        try:
+            await asyncio.sleep(self._client.latency)
+        except asyncio.CancelledError:
+            self._client.cancelled += 1
+            raise
+        return _response(
+            params, self._client.responder(params), len(self._client.requests)
+        )
+
+
+class _MockSyncMessages:
+    """Implements the blocking ``messages.create`` of the synchronous mock."""
+
+    def __init__(self, client: MockAnthropic):
+        self._client = client
+
+    @_sdk_wrapped
+    def create(self, **params) -> SimpleNamespace:
+        self._client.requests.append(params)
+        time.sleep(self._client.latency)
+        return _response(
+            params, self._client.responder(params), len(self._client.requests)
+        )
+
+
+def _response(params: Dict, text: str, request_number: int) -> SimpleNamespace:
+    """Build a Messages API response for ``text``, as a tool call when tools are set."""
+    block = SimpleNamespace(type='text', text=text)
+    if params.get('tools'):
+        try:
+            tool_input = json.loads(text)
+        except json.JSONDecodeError:
+            tool_input = None
+        if isinstance(tool_input, dict):
+            block = SimpleNamespace(
+                type='tool_use',
+                id=f"toolu_mock_{request_number}",
+                name=params['tools'][0]['name'],
+                input=tool_input
+            )
+    prompt_chars = len(params.get('system', '')) + sum(
+        len(str(message['content'])) for message in params.get('messages', [])
+    )
+    return SimpleNamespace(
+        model=params.get('model'),
+        content=[block],
+        usage=SimpleNamespace(
+            input_tokens=prompt_chars // 4,
+            output_tokens=len(text) // 4,
+            cache_creation_input_tokens=0,
+            cache_read_input_tokens=0
+        )
+    )
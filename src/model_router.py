@@ -0,0 +1,155 @@
+"""
+Task-aware model routing between ``ai.model`` and ``ai.backup_model``, with
+escalation on weak answers, failover on overload, and per-tier accounting.
+"""
+
+import json
+from typing import Dict, Optional
+
+from src.config import Config
+from src.metrics import MetricsRegistry
+
+TIERS = ('primary', 'backup')
+
+# Per-million-token prices when a tier's table does not set them.
+DEFAULT_COSTS = {
+    'primary': {'input_cost_per_mtok': 3.0, 'output_cost_per_mtok': 15.0},
+    'backup': {'input_cost_per_mtok': 1.0, 'output_cost_per_mtok': 5.0}
+}
+
+# Cache writes and reads are billed relative to the input price.
+CACHE_WRITE_FACTOR = 1.25
+CACHE_READ_FACTOR = 0.1
+
+
+class ModelRouter:
+    """Chooses a model tier per ``task_type`` from ``[ai.routing]``.
+
+    "primary" is ``ai.model`` and "backup" is ``ai.backup_model``. Tasks
+    routed to the backup are escalated to the primary when the answer is not
+    valid JSON or it reports a ``confidence`` below ``min_confidence``. A request
+    that still fails with a transient error after the scheduler's retries, or
+    whose circuit is open, is retried once on the other tier. Disabled (the
+    default without config), every task uses the primary with neither
+    escalation nor failover.
+    """
+
+    def __init__(self, config: Config, metrics: Optional[MetricsRegistry] = None):
+        ai_cfg = config.ai
+        routing_cfg = getattr(ai_cfg, 'routing', None)
+        self.enabled = getattr(routing_cfg, 'enabled', False)
+        self.models = {
+            'primary': ai_cfg.model,
+            'backup': getattr(ai_cfg, 'backup_model', '') or ai_cfg.model
+        }
+        self._distinct = self.models['backup'] != self.models['primary']
+        self.default_tier = getattr(routing_cfg, 'default_tier', 'primary')
+        tiers_cfg = getattr(routing_cfg, 'tiers', None)
+        self.tiers: Dict[str, str] = tiers_cfg.to_dict() if tiers_cfg is not None else {}
+        for tier in list(self.tiers.values()) + [self.default_tier]:
+            if tier not in TIERS:
+                raise ValueError(f"ai.routing tiers must be one of {TIERS}, not '{tier}'")
+        self.min_confidence = getattr(routing_cfg, 'min_confidence', 0.6)
+        self.escalation = getattr(routing_cfg, 'escalation', True)
+        self.failover = getattr(routing_cfg, 'failover', True)
+        self.costs = {
+            tier: {
+                key: getattr(getattr(routing_cfg, tier, None), key, default)
+                for key, default in DEFAULT_COSTS[tier].items()
+            }
+            for tier in TIERS
+        }
+        self.metrics = metrics or MetricsRegistry()
+
+        self.stats: Dict[str, Dict] = {
+            tier: {
+                'calls': 0,
+                'latency': 0.0,
+                'input_tokens': 0,
+                'output_tokens': 0,
+                'cost_usd': 0.0,
+                'escalations': 0,
+                'failovers': 0
+            }
+            for tier in TIERS
+        }
+
+    def tier_for(self, task_type: str) -> str:
+        if not self.enabled:
+            return 'primary'
+        return self.tiers.get(task_type, self.default_tier)
+
+    def model(self, tier: str) -> str:
+        return self.models[tier]
+
+    def tier_of(self, model: str) -> str:
+        if self._distinct and model == self.models['backup']:
+            return 'backup'
+        return 'primary'
+
+    def escalation_for(self, tier: str) -> Optional[str]:
+        """Tier to re-ask when ``tier`` gives a weak answer, if any."""
+        if self.enabled and self.escalation and self._distinct and tier == 'backup':
+            return 'primary'
+        return None
+
+    def failover_for(self, tier: str) -> Optional[str]:
+        if not (self.enabled and self.failover and self._distinct):
+            return None
+        return 'backup' if tier == 'primary' else 'primary'
+
+    def should_escalate(self, text: Optional[str]) -> bool:
+        """True for a missing or non-JSON answer, or one reporting low confidence."""
+        if text is None:
+            return True
+        try:
+            result = json.loads(text)
+        except ValueError:
+            return True
+        if not isinstance(result, dict) or 'error' in result:
+            return True
+        confidence = result.get('confidence')
+        return isinstance(confidence, (int, float)) and confidence < self.min_confidence
+
+    def record_call(self, model: str, task_type: str, usage, latency: float):
+        tier = self.tier_of(model)
+        stats = self.stats[tier]
+        stats['calls'] += 1
+        stats['latency'] += latency
+        input_tokens = getattr(usage, 'input_tokens', 0) or 0
+        output_tokens = getattr(usage, 'output_tokens', 0) or 0
+        stats['input_tokens'] += input_tokens
+        stats['output_tokens'] += output_tokens
+        costs = self.costs[tier]
+        cost = (
+            input_tokens * costs['input_cost_per_mtok']
+            + (getattr(usage, 'cache_creation_input_tokens', 0) or 0)
+            * costs['input_cost_per_mtok'] * CACHE_WRITE_FACTOR
+            + (getattr(usage, 'cache_read_input_tokens', 0) or 0)
+            * costs['input_cost_per_mtok'] * CACHE_READ_FACTOR
+            + output_tokens * costs['output_cost_per_mtok']
+        ) / 1_000_000
+        stats['cost_usd'] += cost
+        self.metrics.inc('ai_cost_usd_total', cost, tier=tier, task_type=task_type)
+
+    def record_escalation(self, tier: str, task_type: str):
+        self.stats[tier]['escalations'] += 1
+        self.metrics.inc('ai_escalations_total', tier=tier, task_type=task_type)
+
+    def record_failover(self, tier: str, task_type: str):
+        self.stats[tier]['failovers'] += 1
+        self.metrics.inc('ai_failovers_total', tier=tier, task_type=task_type)
+
+    def summary(self) -> Dict:
+        """Per-tier calls, mean latency, tokens, cost and escalation rate."""
+        summary = {}
+        for tier, stats in self.stats.items():
+            calls = stats['calls']
+            summary[tier] = {
+                'model': self.models[tier],
+                **stats,
+                'cost_usd': round(stats['cost_usd'], 6),
+                'mean_latency': stats['latency'] / calls if calls else 0.0,
+                'escalation_rate': stats['escalations'] / calls if calls else 0.0
+            }
+        return {'enabled': self.enabled, 'tiers': summary}
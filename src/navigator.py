@@ -4,7 +4,6 @@ and AI-powered navigation.
 """
 
 import asyncio
-import json
 import logging
 import time
 from typing import Dict, List
@@ -15,6 +14,17 @@ from src import config as config_module
 from src.ai_client import AIClient
 from src.browser import BrowserManager
 from src.bypass import BypassOrchestrator
+from src.cassette import Cassette
+from src.element_resolver import ElementResolver
+from src.metrics import MetricsRegistry, MetricsServer
+from src.page_outline import PageOutliner
+from src.page_snapshot import PageSnapshotter
+from src.page_waits import PageWaiter
+from src.reporting import LogPipeline, Reporter, set_step
+from src.request_policy import RequestPolicy
+from src.screenshots import ScreenshotService
+from src.session_log import SessionLog
+from src.tracing import Tracer
 
 
 def _suppress_playwright_timeout_futures(loop, context):
@@ -29,12 +39,25 @@ def _suppress_playwright_timeout_futures(loop, context):
     loop.default_exception_handler(context)
 
 
+def _action_outcome(execution_result: str) -> str:
+    """Classify an action handler's result message for the actions metric."""
+    if execution_result.startswith(('Successfully', 'Navigated')):
+        return 'success'
+    if execution_result.startswith('Simulated'):
+        return 'simulated'
+    return 'failed'
+
+
 class Navigator:
     """Orchestrates browser setup, bypass strategies, and AI-driven navigation."""
 
-    def __init__(self, config_path: str = "config.toml", anthropic_api_key: str = None):
+    def __init__(
+        self,
+        config_path: str = "config.toml",
+        anthropic_api_key: str = None,
+        verbosity: str = None
+    ):
         self.config = config_module.load_config(config_path)
-        self.client = anthropic.Anthropic(api_key=anthropic_api_key)
 
         self.page = None
         self.browser = None
@@ -42,29 +65,53 @@ class Navigator:
 
         self.demo_mode = self.config.demo_mode.enabled
         self.start_time = time.time()
-        self.bypass_attempts: List[Dict] = []
-        self.ai_decisions: List[Dict] = []
-        self.screenshots: List[str] = []
 
+        # Decisions, attempts and results are streamed here as they happen.
+        self.session_log = SessionLog(self.config)
         self._setup_logging()
+        self.reporter = Reporter(self.config, verbosity)
+
+        # A replayed session needs neither an API key nor a network.
+        self.cassette = Cassette(self.config, self.logger)
+        self.config = self.cassette.adjust_config(self.config)
+        self.client = self.cassette.wrap_client(
+            None if self.cassette.replaying else anthropic.AsyncAnthropic(
+                api_key=anthropic_api_key,
+                timeout=self.config.ai.client.request_timeout,
+                # RequestScheduler owns retries; SDK retries would multiply them.
+                max_retries=0
+            )
+        )
 
+        self.tracer = Tracer(self.config)
+        self.metrics = MetricsRegistry(self.config)
+        self.metrics_server = None  # started in run() when configured
         self.browser_mgr = BrowserManager(self.config)
-        self.ai_client = AIClient(self.config, self.client, self.logger)
+        self.request_policy = RequestPolicy(self.config, self.logger, self.metrics)
+        self.ai_client = AIClient(
+            self.config, self.client, self.logger, self.tracer, self.metrics
+        )
+        self.outliner = PageOutliner(self.config)
         self.bypass_mgr = None  # created in _setup_browser after page exists
+        self.snapshotter = None  # created in _setup_browser after page exists
+        self.screenshot_service = None  # created in _setup_browser after page exists
+        self.waiter = None  # created in _setup_browser after page exists
+        self.resolver = None  # created in _setup_browser after page exists
+
+        self.reporter.info("Navigator initialized")
+        self.reporter.info(f"Demo mode: {'ON' if self.demo_mode else 'OFF'}")
 
-        print("Navigator initialized")
-        print(f"Demo mode: {'ON' if self.demo_mode else 'OFF'}")
+    @property
+    def screenshots(self) -> List[str]:
+        """Screenshot files actually written to disk, in write order."""
+        if self.screenshot_service is None:
+            return []
+        return self.screenshot_service.written
 
     def _setup_logging(self):
-        logging.basicConfig(
-            level=self.config.logging.log_level,
-            datefmt=self.config.logging.date_format,
-            format=self.config.logging.format,
-            handlers=[
-                logging.FileHandler(self.config.files.log_filename),
-                logging.StreamHandler()
-            ]
-        )
+        """Send logging through a queue so file and console writes leave the loop."""
+        self.log_pipeline = LogPipeline(self.config, self.session_log.session)
+        self.log_pipeline.start()
         self.logger = logging.getLogger(__name__)
 
     async def run(self, goal: str) -> Dict:
@@ -72,47 +119,76 @@ class Navigator:
         loop = asyncio.get_running_loop()
         loop.set_exception_handler(_suppress_playwright_timeout_futures)
 
-        print("\n" + "=" * 80)
-        print("AI-DRIVEN WEB NAVIGATOR")
-        print("=" * 80)
+        self.reporter.info("\n" + "=" * 80 + "\nAI-DRIVEN WEB NAVIGATOR\n" + "=" * 80)
 
         session_result = {
             'goal': goal,
             'start_time': time.time(),
             'start_time_formatted': time.strftime(self.config.general.time_frmt),
             'phases': [],
-            'ai_decisions': [],
             'technical_achievements': [],
             'final_result': None
         }
+        self.session_log.start(
+            goal=goal,
+            start_time=session_result['start_time'],
+            start_time_formatted=session_result['start_time_formatted']
+        )
 
         try:
-            await self._setup_phase(session_result)
-            await self._setup_browser(session_result)
-
-            bypass_success = await self._run_bypass(session_result)
-
-            if bypass_success:
-                final_result = await self._navigate(goal, session_result)
-            else:
-                final_result = await self._simulate(goal, session_result)
-
-            session_result['final_result'] = final_result
-            await self._summarise(session_result)
-
-            return session_result
+            await self._start_metrics_server()
+            # The manager owns the Playwright driver and browser for the session.
+            async with self.browser_mgr:
+                with self.tracer.span('phase.configuration'):
+                    await self._setup_phase(session_result)
+                with self.tracer.span('phase.browser_setup'):
+                    await self._setup_browser(session_result)
+
+                with self.tracer.span('phase.bypass'):
+                    bypass_success = await self._run_bypass(session_result)
+
+                if bypass_success:
+                    with self.tracer.span('phase.navigation'):
+                        final_result = await self._navigate(goal, session_result)
+                else:
+                    with self.tracer.span('phase.simulation'):
+                        final_result = await self._simulate(goal, session_result)
+
+                session_result['final_result'] = final_result
+                self._record_final_result(final_result)
+                with self.tracer.span('phase.summary'):
+                    await self._summarise(session_result)
+
+                return session_result
 
         except Exception as e:
             self.logger.error(f"Navigation failed: {e}")
             session_result['error'] = str(e)
+            self.session_log.event('error', {'message': str(e)})
             return session_result
         finally:
             await self.cleanup()
 
+    async def _start_metrics_server(self):
+        """Serve Prometheus metrics locally if [monitoring.prometheus] enables it."""
+        prometheus_cfg = getattr(self.config.monitoring, 'prometheus', None)
+        if not self.metrics.enabled or not getattr(prometheus_cfg, 'enabled', False):
+            return
+        self.metrics_server = MetricsServer(
+            self.metrics,
+            getattr(prometheus_cfg, 'host', '127.0.0.1'),
+            getattr(prometheus_cfg, 'port', 9464),
+            self.logger
+        )
+        try:
+            await self.metrics_server.start()
+        except OSError as e:
+            self.logger.warning(f"Metrics endpoint not started: {e}")
+            self.metrics_server = None
+
     async def _setup_phase(self, session_result: Dict):
         """Phase 1: Display configuration summary."""
-        print("\nPHASE 1: Configuration-Driven Architecture")
-        print("-" * 50)
+        self.reporter.section("PHASE 1: Configuration-Driven Architecture")
 
         config_highlights = {
             'browser_strategies': len(self.config.bypass.strategies.names),
@@ -123,55 +199,98 @@ class Navigator:
             'monitoring_enabled': self.config.monitoring.track_session_metrics
         }
 
-        print(f"Configuration loaded: {self.config.general.name} "
-              f"v{self.config.general.version}")
-        print(f"   - Browser strategies: {config_highlights['browser_strategies']}")
-        print(f"   - AI model: {config_highlights['ai_model']}")
-        print(f"   - Max bypass attempts: {config_highlights['max_bypass_attempts']}")
-        print(f"   - Adaptive timing: {config_highlights['timing_adaptive']}")
-        print(f"   - Fallback sites: {config_highlights['fallback_sites']}")
+        self.reporter.info(f"Configuration loaded: {self.config.general.name} "
+                           f"v{self.config.general.version}")
+        self.reporter.detail(
+            f"   - Browser strategies: {config_highlights['browser_strategies']}"
+        )
+        self.reporter.detail(f"   - AI model: {config_highlights['ai_model']}")
+        self.reporter.detail(
+            f"   - Max bypass attempts: {config_highlights['max_bypass_attempts']}"
+        )
+        self.reporter.detail(
+            f"   - Adaptive timing: {config_highlights['timing_adaptive']}"
+        )
+        self.reporter.detail(
+            f"   - Fallback sites: {config_highlights['fallback_sites']}"
+        )
 
-        session_result['phases'].append({
+        self._add_phase(session_result, {
             'name': 'Configuration',
             'status': 'completed',
             'highlights': config_highlights,
             'duration': self.config.demo_mode.phase_timeouts.configuration
         })
-        session_result['technical_achievements'].append(
+        self._add_achievements(
+            session_result,
             "Externalized all configuration to TOML for easy modification"
         )
 
     async def _setup_browser(self, session_result: Dict):
         """Phase 2: Launch stealth browser via BrowserManager."""
-        print("\nPHASE 2: Advanced Browser Setup with Stealth")
-        print("-" * 50)
+        self.reporter.section("PHASE 2: Advanced Browser Setup with Stealth")
 
         setup_start = time.time()
-        print("Applying stealth configuration:")
-        print("   - Removing automation artifacts")
-        print("   - Spoofing browser fingerprints")
-        print("   - Randomizing viewport and user agent")
-        print("   - Injecting human behavior simulation")
+        self.reporter.detail("Applying stealth configuration:")
+        self.reporter.detail("   - Removing automation artifacts")
+        self.reporter.detail("   - Spoofing browser fingerprints")
+        self.reporter.detail("   - Randomizing viewport and user agent")
+        self.reporter.detail("   - Injecting human behavior simulation")
 
         try:
-            self.browser, self.context, self.page = await self.browser_mgr.setup_browser()
-            self.bypass_mgr = BypassOrchestrator(self.config, self.page, self.ai_client)
+            self.browser, self.context, page = await self.browser_mgr.setup_browser()
+            startup = self.browser_mgr.timings
+            self.metrics.observe(
+                'browser_startup_seconds',
+                startup.get('driver_start', 0) + startup['browser'] + startup['context'],
+                mode=startup['mode']
+            )
+            await self.cassette.attach(self.context)
+            # Registered last so it is consulted first; a cassette does the fetching.
+            await self.request_policy.attach(
+                self.context, cache=self.cassette.mode == 'off'
+            )
+            self.page = self.tracer.instrument_page(page, self.metrics)
+            self.snapshotter = PageSnapshotter(self.config, self.page)
+            self.waiter = PageWaiter(self.config, self.page, self.logger, self.metrics)
+            self.resolver = ElementResolver(self.page, self.logger)
+            self.screenshot_service = ScreenshotService(
+                self.config, self.page, self.logger, self.session_log
+            )
+            self.bypass_mgr = BypassOrchestrator(
+                self.config,
+                self.page,
+                self.ai_client,
+                self.snapshotter,
+                self.screenshot_service,
+                self.resolver,
+                self.tracer,
+                self.metrics,
+                self.session_log,
+                self.reporter
+            )
 
             setup_duration = time.time() - setup_start
-            print(f"Advanced browser setup completed in {setup_duration:.1f}s")
+            how = 'attached to host' if startup['mode'] == 'attach' else 'launched'
+            self.reporter.result(
+                f"Advanced browser setup completed in {setup_duration:.1f}s "
+                f"({how}, browser {startup['browser']:.2f}s)"
+            )
 
-            session_result['phases'].append({
+            self._add_phase(session_result, {
                 'name': 'Browser Setup',
                 'status': 'completed',
                 'stealth_features': len(self.config.browser.args.core_stealth),
-                'duration': setup_duration
+                'duration': setup_duration,
+                'browser_mode': startup['mode']
             })
-            session_result['technical_achievements'].append(
+            self._add_achievements(
+                session_result,
                 "Implemented comprehensive browser fingerprint evasion"
             )
         except Exception as e:
-            print(f"Browser setup failed: {e}")
-            session_result['phases'].append({
+            self.reporter.result(f"Browser setup failed: {e}")
+            self._add_phase(session_result, {
                 'name': 'Browser Setup',
                 'status': 'failed',
                 'error': str(e)
@@ -180,27 +299,25 @@ class Navigator:
 
     async def _run_bypass(self, session_result: Dict) -> bool:
         """Phase 3: Run Cloudflare bypass strategies via BypassOrchestrator."""
-        print("\nPHASE 3: Intelligent Cloudflare Bypass")
-        print("-" * 50)
+        self.reporter.section("PHASE 3: Intelligent Cloudflare Bypass")
 
         success, attempts = await self.bypass_mgr.demonstrate_strategies()
-        self.bypass_attempts.extend(attempts)
-        self.screenshots.extend(self.bypass_mgr.screenshots)
 
         if success:
             last = attempts[-1] if attempts else {}
-            session_result['phases'].append({
+            self._add_phase(session_result, {
                 'name': 'Bypass Successful',
                 'strategy': last.get('strategy', 'unknown'),
                 'duration': last.get('duration', 0),
                 'status': 'completed'
             })
-            session_result['technical_achievements'].append(
+            self._add_achievements(
+                session_result,
                 f"Successfully bypassed Cloudflare using {last.get('strategy', 'unknown')}"
             )
             return True
 
-        session_result['phases'].append({
+        self._add_phase(session_result, {
             'name': 'Bypass Attempts',
             'status': 'failed',
             'strategies_tried': len(attempts),
@@ -209,82 +326,196 @@ class Navigator:
         return False
 
     async def _navigate(self, goal: str, session_result: Dict) -> Dict:
-        """Phase 4A: Real AI navigation after successful Cloudflare bypass."""
-        print("\nPHASE 4A: AI-Driven Navigation")
-        print("-" * 50)
+        """Phase 4A: Real AI navigation after successful Cloudflare bypass.
+
+        Parses the goal once, then runs observe/decide/act steps until the AI
+        reports the goal as done or general.max_navigation_steps is reached.
+        navigation.decision_mode selects one fused model call per step
+        ("fused") or a page analysis followed by a decision ("two_call").
+        """
+        self.reporter.section("PHASE 4A: AI-Driven Navigation")
 
         try:
-            print("Step 1: AI analyzing goal and extracting intent...")
+            self.reporter.info("AI analyzing goal and extracting intent...")
             intent = await self.ai_client.parse_goal(goal)
             self._track_ai_decision('goal_parsing', {'goal': goal}, intent)
-            print(f"   Goal parsed: {intent.get('product_keywords', 'N/A')}")
-
-            print("Step 2: AI analyzing current page...")
-            title = await self.page.title()
-            content = await self.page.evaluate(
-                "document.body.innerText.slice(0, "
-                f"{self.config.ai.token_limits.page_analysis})"
-            )
-            page_analysis = await self.ai_client.analyze_page(title, content)
-            self._track_ai_decision(
-                'page_analysis',
-                {'title': title, 'content_length': len(content)},
-                page_analysis
-            )
-            print(f"   Page type: {page_analysis.get('page_type', 'unknown')}")
-
-            print("Step 3: AI deciding next action...")
-            next_action = await self.ai_client.decide_action(intent, page_analysis)
-            self._track_ai_decision(
-                'action_decision',
-                {'intent': intent, 'page_analysis': page_analysis},
-                next_action
-            )
-            print(
-                f"   AI decision: {next_action.get('action', 'unknown')} - "
-                f"{next_action.get('reasoning', 'N/A')}"
+            self.reporter.detail(
+                f"   Goal parsed: {intent.get('product_keywords', 'N/A')}"
             )
 
-            print("Step 3.5: Warming up on target site before acting...")
+            self.reporter.info("Warming up on target site before acting...")
             await self._warm_up_page()
 
-            print("Step 4: Executing AI-recommended action...")
-            execution_result = await self._execute_action(next_action)
+            max_steps = self.config.general.max_navigation_steps
+            decision_mode = getattr(self.config.navigation, 'decision_mode', 'two_call')
+            fused = decision_mode == 'fused'
+            history: List[Dict] = []
+            steps: List[Dict] = []
+            page_analysis: Dict = {}
+            analysed_snapshot = None
+            goal_completed = False
+
+            for step in range(1, max_steps + 1):
+                set_step(step)
+                step_start = time.time()
+                usage_before = self.ai_client.usage_totals()
+
+                # The snapshot is only re-read after a navigation or an action
+                # that invalidated it, so an unchanged page is not re-analysed.
+                snapshot = await self.snapshotter.get()
+                reanalysed = fused or snapshot is not analysed_snapshot
+                content = self.outliner.content_for_prompt(snapshot)
+
+                if fused:
+                    page_analysis, next_action = await self.ai_client.observe_and_decide(
+                        goal=goal,
+                        title=snapshot.title,
+                        content=content,
+                        url=snapshot.url,
+                        history=self._compact_history(history)
+                    )
+                else:
+                    if reanalysed:
+                        page_analysis = await self.ai_client.analyze_page(
+                            snapshot.title, content
+                        )
+                        analysed_snapshot = snapshot
+                    next_action = await self.ai_client.decide_next_step(
+                        goal=goal,
+                        page_analysis=page_analysis,
+                        url=snapshot.url,
+                        history=self._compact_history(history)
+                    )
+
+                if reanalysed:
+                    self._track_ai_decision(
+                        'page_analysis',
+                        {'title': snapshot.title, 'url': snapshot.url},
+                        page_analysis
+                    )
+                self._track_ai_decision(
+                    'action_decision',
+                    {'step': step, 'page_type': page_analysis.get('page_type')},
+                    next_action
+                )
+                action_type = next_action.get('action', 'unknown')
+                self.reporter.info(
+                    f"Step {step}: [{page_analysis.get('page_type', 'unknown')}] "
+                    f"{action_type} {next_action.get('target', '')} - "
+                    f"{next_action.get('reasoning', 'N/A')}"
+                )
+
+                if action_type == 'done':
+                    goal_completed = True
+                    execution_result = "Goal reported complete"
+                else:
+                    with self.tracer.span('action.execute', action=action_type):
+                        execution_result = await self._execute_action(next_action)
+                    self.reporter.info(f"   {execution_result}")
+                    self.metrics.inc(
+                        'actions_total',
+                        action=action_type,
+                        outcome=_action_outcome(execution_result)
+                    )
+
+                history.append({
+                    'step': step,
+                    'action': action_type,
+                    'target': next_action.get('target', ''),
+                    'result': execution_result
+                })
+                usage_after = self.ai_client.usage_totals()
+                steps.append({
+                    'step': step,
+                    'model_calls': usage_after['calls'] - usage_before['calls'],
+                    'action': next_action,
+                    'execution_result': execution_result,
+                    'page_reanalysed': reanalysed,
+                    'duration': time.time() - step_start,
+                    'input_tokens': usage_after['input_tokens']
+                    - usage_before['input_tokens'],
+                    'output_tokens': usage_after['output_tokens']
+                    - usage_before['output_tokens']
+                })
+                self.session_log.event(
+                    'step',
+                    {k: v for k, v in steps[-1].items() if k != 'action'},
+                    action=next_action
+                )
+                self.metrics.inc('navigation_steps_total')
+                self.metrics.observe('navigation_step_seconds', steps[-1]['duration'])
+                self.reporter.detail(f"   Step {step} took {steps[-1]['duration']:.1f}s, "
+                                     f"{steps[-1]['model_calls']} model calls, "
+                                     f"{steps[-1]['input_tokens']} input tokens")
+
+                if goal_completed:
+                    break
+            set_step(None)
 
             time_stamp = time.strftime(self.config.general.time_frmt)
             frmtd_time_stamp = '-'.join(
                 time_stamp.replace('-', '').replace(':', '').split(' ')[:2]
             )
-            final_screenshot = f"navigation_result_{frmtd_time_stamp}.png"
-            await self.page.screenshot(path=final_screenshot)
-            self.screenshots.append(final_screenshot)
+            final_screenshot = await self.screenshot_service.capture(
+                f"navigation_result_{frmtd_time_stamp}", dedupe=False
+            )
 
-            session_result['technical_achievements'].extend([
+            self._add_achievements(
+                session_result,
                 "Implemented natural language goal parsing",
                 "Created context-aware page analysis",
-                "Built intelligent action decision system"
-            ])
+                "Built intelligent multi-step action loop"
+            )
 
             return {
-                'success': True,
+                'success': goal_completed,
                 'type': 'real_navigation',
                 'intent': intent,
                 'page_analysis': page_analysis,
-                'ai_action': next_action,
-                'execution_result': execution_result,
+                'steps': steps,
+                'steps_taken': len(steps),
+                'decision_mode': decision_mode,
+                'goal_completed': goal_completed,
                 'screenshot': final_screenshot,
-                'ai_decisions_made': len(self.ai_decisions)
+                'ai_decisions_made': self.session_log.counts.get('decision', 0)
             }
 
         except Exception as e:
-            print(f"AI navigation failed: {e}")
+            set_step(None)
+            self.reporter.result(f"AI navigation failed: {e}")
             return {'success': False, 'type': 'real_navigation', 'error': str(e)}
 
+    def _compact_history(self, history: List[Dict]) -> str:
+        """Render the step history for the prompt, keeping it bounded.
+
+        The most recent navigation.history_window steps are listed verbatim;
+        older ones are folded into a count per action type.
+        """
+        if not history:
+            return "none yet"
+        window = getattr(self.config.navigation, 'history_window', 5)
+        older, recent = history[:-window], history[-window:]
+
+        lines = []
+        if older:
+            counts: Dict[str, int] = {}
+            for entry in older:
+                counts[entry['action']] = counts.get(entry['action'], 0) + 1
+            summary = ', '.join(f"{n}x {action}" for action, n in counts.items())
+            lines.append(f"steps 1-{len(older)}: {summary}")
+        for entry in recent:
+            lines.append(
+                f"step {entry['step']}: {entry['action']} "
+                f"'{entry['target']}' -> {entry['result'][:80]}"
+            )
+        return '; '.join(lines)
+
     async def _simulate(self, goal: str, session_result: Dict) -> Dict:
         """Phase 4B: Simulate AI navigation when bypass was unsuccessful."""
-        print("\nPHASE 4B: AI Navigation Simulation")
-        print("-" * 50)
-        print("Bypass did not succeed — demonstrating AI logic through simulation...")
+        self.reporter.section("PHASE 4B: AI Navigation Simulation")
+        self.reporter.info(
+            "Bypass did not succeed — demonstrating AI logic through simulation..."
+        )
 
         simulation_scenarios = [
             {
@@ -295,13 +526,35 @@ class Navigator:
             for scenario in self.config.simulation_scenarios.scenarios
         ]
 
+        # Scenarios are independent, so query them concurrently and report the
+        # results afterwards in their original order.
+        max_concurrency = getattr(
+            self.config.simulation_scenarios, 'max_concurrency', 0
+        ) or len(simulation_scenarios) or 1
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_scenario(scenario: Dict) -> Dict:
+            async with semaphore:
+                return await self.ai_client.simulate_scenario(scenario, goal)
+
+        simulation_start = time.time()
+        ai_decisions = await asyncio.gather(
+            *(run_scenario(scenario) for scenario in simulation_scenarios),
+            return_exceptions=True
+        )
+        simulation_duration = time.time() - simulation_start
+
         simulation_results = []
 
-        for i, scenario in enumerate(simulation_scenarios, 1):
-            print(f"\nSimulation {i}: {scenario['description']}")
-            ai_decision = await self.ai_client.simulate_scenario(scenario, goal)
-            print(f"   AI Decision: {ai_decision.get('action', 'N/A')} - "
-                  f"{ai_decision.get('reasoning', 'N/A')}")
+        for i, (scenario, ai_decision) in enumerate(
+            zip(simulation_scenarios, ai_decisions), 1
+        ):
+            self.reporter.info(f"\nSimulation {i}: {scenario['description']}")
+            if isinstance(ai_decision, BaseException):
+                self.logger.error(f"Simulation {i} failed: {ai_decision}")
+                ai_decision = {'error': str(ai_decision)}
+            self.reporter.detail(f"   AI Decision: {ai_decision.get('action', 'N/A')} - "
+                                 f"{ai_decision.get('reasoning', 'N/A')}")
 
             simulation_results.append({
                 'scenario': scenario,
@@ -310,69 +563,110 @@ class Navigator:
             })
             self._track_ai_decision('simulation', scenario, ai_decision)
 
-        session_result['technical_achievements'].extend([
+        self.reporter.info(f"\n{len(simulation_results)} scenarios simulated in "
+                           f"{simulation_duration:.1f}s (concurrency {max_concurrency})")
+
+        self._add_achievements(
+            session_result,
             "Demonstrated AI decision-making logic",
             "Showed context-aware navigation strategies",
             "Illustrated goal-oriented action planning"
-        ])
+        )
 
         return {
             'success': True,
             'type': 'simulation',
             'scenarios_completed': len(simulation_results),
             'simulation_results': simulation_results,
-            'ai_decisions_demonstrated': len(self.ai_decisions)
+            'simulation_duration': simulation_duration,
+            'ai_decisions_demonstrated': self.session_log.counts.get('decision', 0)
         }
 
     async def _summarise(self, session_result: Dict):
         """Phase 5: Print session summary and populate result dict."""
-        print("\nPHASE 5: Results Analysis and Technical Summary")
-        print("-" * 50)
+        self.reporter.section("PHASE 5: Results Analysis and Technical Summary")
 
         total_duration = time.time() - session_result['start_time']
-
-        print(f"Total session duration: {total_duration:.1f}s")
-        print(f"Bypass attempts made: {len(self.bypass_attempts)}")
-        print(f"AI decisions made: {len(self.ai_decisions)}")
-        print(f"Screenshots captured: {len(self.screenshots)}")
-
-        print("\nTechnical Achievements:")
+        if self.screenshot_service is not None:
+            await self.screenshot_service.flush()
+
+        self.reporter.result(f"Total session duration: {total_duration:.1f}s")
+        counts = self.session_log.counts
+        self.reporter.info(f"Bypass attempts made: {counts.get('bypass_attempt', 0)}")
+        self.reporter.info(f"AI decisions made: {counts.get('decision', 0)}")
+        self.reporter.info(f"Time spent awaiting AI requests: "
+                           f"{self.ai_client.stats['awaited_request_seconds']:.1f}s")
+        self.reporter.info(f"Screenshots captured: {len(self.screenshots)}")
+        if self.waiter is not None:
+            self.reporter.info(f"Idle time removed by readiness waits: "
+                               f"{self.waiter.stats['saved']:.1f}s over "
+                               f"{self.waiter.stats['waits']} waits")
+
+        self.reporter.info("\nTechnical Achievements:")
         for achievement in session_result['technical_achievements']:
-            print(f"   {achievement}")
+            self.reporter.info(f"   {achievement}")
 
-        print("\nConfiguration Management:")
-        print("   All settings externalized to TOML")
-        print("   No hardcoded values in application logic")
-        print("   Easy modification for different sites/strategies")
+        self.reporter.detail("\nConfiguration Management:")
+        self.reporter.detail("   All settings externalized to TOML")
+        self.reporter.detail("   No hardcoded values in application logic")
+        self.reporter.detail("   Easy modification for different sites/strategies")
 
-        print("\nAI Navigation Capabilities:")
-        print("   Natural language goal parsing")
-        print("   Context-aware page analysis")
-        print("   Intelligent action planning")
-        print("   Adaptive strategy selection")
+        self.reporter.detail("\nAI Navigation Capabilities:")
+        self.reporter.detail("   Natural language goal parsing")
+        self.reporter.detail("   Context-aware page analysis")
+        self.reporter.detail("   Intelligent action planning")
+        self.reporter.detail("   Adaptive strategy selection")
 
-        print("\nCode Quality Features:")
-        print("   PEP8 compliance with 90-character lines")
-        print("   Comprehensive error handling")
-        print("   Type hints throughout")
-        print("   Detailed logging and monitoring")
+        self.reporter.detail("\nCode Quality Features:")
+        self.reporter.detail("   PEP8 compliance with 90-character lines")
+        self.reporter.detail("   Comprehensive error handling")
+        self.reporter.detail("   Type hints throughout")
+        self.reporter.detail("   Detailed logging and monitoring")
 
         session_result['summary'] = {
             'total_duration': total_duration,
-            'bypass_attempts': len(self.bypass_attempts),
-            'ai_decisions': len(self.ai_decisions),
+            'bypass_attempts': counts.get('bypass_attempt', 0),
+            'ai_decisions': counts.get('decision', 0),
             'screenshots': len(self.screenshots),
             'technical_achievements': len(session_result['technical_achievements'])
         }
-        session_result['ai_decisions'] = self.ai_decisions
+        self.session_log.event('summary', session_result['summary'])
+
+    def _add_phase(self, session_result: Dict, phase: Dict):
+        session_result['phases'].append(phase)
+        self.session_log.event('phase', phase)
+
+    def _add_achievements(self, session_result: Dict, *achievements: str):
+        for achievement in achievements:
+            session_result['technical_achievements'].append(achievement)
+            self.session_log.event('achievement', {'text': achievement})
 
     def _track_ai_decision(self, decision_type: str, input_data: Dict, output_data: Dict):
-        self.ai_decisions.append({
-            'type': decision_type,
-            'input': input_data,
-            'output': output_data,
-            'timestamp': time.strftime(self.config.general.time_frmt)
-        })
+        """Log a decision; input and output are stored once and referenced by id."""
+        self.session_log.event(
+            'decision',
+            {
+                'type': decision_type,
+                'timestamp': time.strftime(self.config.general.time_frmt)
+            },
+            input=input_data,
+            output=output_data
+        )
+
+    def _record_final_result(self, final_result: Dict):
+        """Log the phase 4 result; steps are already in the stream as step events."""
+        refs = {
+            key: final_result[key] for key in ('intent', 'page_analysis')
+            if key in final_result
+        }
+        self.session_log.event(
+            'final_result',
+            {
+                k: v for k, v in final_result.items()
+                if k not in refs and k != 'steps'
+            },
+            **refs
+        )
 
     async def _execute_action(self, action: Dict) -> str:
         """Dispatch an AI-recommended action to the appropriate handler."""
@@ -413,7 +707,7 @@ class Navigator:
             if getattr(warm_up_cfg, 'pre_search_browse', False):
                 await self._browse_category_before_search(warm_up_cfg)
 
-            print(f"   Warm-up complete ({scroll_steps} scroll steps)")
+            self.reporter.detail(f"   Warm-up complete ({scroll_steps} scroll steps)")
         except Exception as e:
             self.logger.warning(f"Warm-up skipped: {e}")
 
@@ -434,7 +728,7 @@ class Navigator:
             await self.page.goto(
                 browse_url, wait_until='domcontentloaded', timeout=timeout
             )
-            await asyncio.sleep(warm_up_cfg.pre_search_browse_wait)
+            await self.waiter.dwell('category_browse', warm_up_cfg.pre_search_browse_wait)
 
             if await self._is_error_page():
                 self.logger.warning("Browse URL returned error page — returning to homepage")
@@ -443,7 +737,10 @@ class Navigator:
                     wait_until='domcontentloaded',
                     timeout=timeout
                 )
-                await asyncio.sleep(2.0)
+                await self.waiter.dwell(
+                    'return_to_start',
+                    getattr(warm_up_cfg, 'return_to_start_wait', 2.0)
+                )
                 return
 
             for i in range(warm_up_cfg.pre_search_browse_scrolls):
@@ -453,7 +750,7 @@ class Navigator:
 
             await self.page.evaluate("window.scrollTo(0, 0)")
             await asyncio.sleep(1.5)
-            print("   Pre-search category browse complete")
+            self.reporter.detail("   Pre-search category browse complete")
         except Exception as e:
             self.logger.warning(f"Pre-search browse skipped: {e}")
 
@@ -463,57 +760,55 @@ class Navigator:
         Falls back to direct URL navigation if the result page shows an error.
         """
         search_term = action.get('target', self.config.general.goal)
+        search_cfg = self.config.search_functionality
         try:
-            search_selectors = self.config.search_functionality.selectors
-            for selector in search_selectors:
-                try:
-                    search_box = await self.page.wait_for_selector(
-                        selector,
-                        timeout=self.config.search_functionality.timeout
-                    )
-                    if search_box:
-                        await search_box.click()
-                        await asyncio.sleep(
-                            self.config.search_functionality.submit_delay / 1000
-                        )
-                        await search_box.type(
-                            search_term,
-                            delay=self.config.search_functionality.typing_delay
-                        )
-                        await asyncio.sleep(
-                            self.config.search_functionality.submit_delay / 1000
-                        )
-                        await search_box.press('Enter')
-                        await asyncio.sleep(
-                            self.config.search_functionality.results_wait / 1000
-                        )
-
-                        if await self._is_error_page():
-                            self.logger.warning(
-                                "Search form returned error page — trying direct URL"
-                            )
-                            return await self._search_via_url(search_term)
+            found = await self.resolver.resolve(
+                search_cfg.selectors, timeout=search_cfg.timeout, label='search box'
+            )
+            if found is None:
+                return await self._search_via_url(search_term)
+
+            try:
+                search_box = found.element
+                await search_box.click()
+                await asyncio.sleep(search_cfg.submit_delay_s)
+                await search_box.type(search_term, delay=search_cfg.typing_delay)
+                await asyncio.sleep(search_cfg.submit_delay_s)
+                async with self.waiter.until_ready(
+                    'search_submit',
+                    search_cfg.results_wait_s,
+                    selector=self._results_selector(),
+                    expect_navigation=True
+                ):
+                    await search_box.press('Enter')
+                self.snapshotter.invalidate()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(
+                    f"Search box interaction failed ({e}) — trying direct URL"
+                )
+                return await self._search_via_url(search_term)
 
-                        return f"Successfully searched for '{search_term}'"
-                except asyncio.CancelledError:
-                    raise
-                except Exception:
-                    continue
+            if await self._is_error_page():
+                self.logger.warning("Search form returned error page — trying direct URL")
+                return await self._search_via_url(search_term)
 
-            return await self._search_via_url(search_term)
+            return f"Successfully searched for '{search_term}'"
         except Exception as e:
             return f"Search failed: {e}"
 
+    def _results_selector(self) -> str:
+        """CSS selector list matching any configured product card."""
+        snapshot_cfg = getattr(self.config, 'page_snapshot', None)
+        return ', '.join(getattr(snapshot_cfg, 'product_card_selectors', []))
+
     async def _is_error_page(self) -> bool:
         """Return True if the current page content matches known error indicators."""
         try:
-            content = await self.page.evaluate(
-                "document.body.innerText.slice(0, 500).toLowerCase()"
-            )
-            return any(
-                indicator in content
-                for indicator in self.config.search_functionality.error_indicators
-            )
+            snapshot = await self.snapshotter.get()
+            error_pattern = self.config.search_functionality.error_pattern
+            return error_pattern.search(snapshot.text[:500]) is not None
         except Exception:
             return False
 
@@ -525,7 +820,11 @@ class Navigator:
             )
             self.logger.info(f"Direct search URL: {url}")
             await self.page.goto(url, timeout=self.config.browser.default_timeout)
-            await asyncio.sleep(self.config.search_functionality.results_wait / 1000)
+            await self.waiter.wait(
+                'direct_search',
+                self.config.search_functionality.results_wait_s,
+                selector=self._results_selector()
+            )
 
             if await self._is_error_page():
                 self.logger.warning("Direct search URL also returned error page")
@@ -549,30 +848,89 @@ class Navigator:
                 await asyncio.sleep(
                     self.config.human_behavior.action_delays.post_click_max
                 )
+                self.snapshotter.invalidate()
                 return f"Successfully clicked {target}"
             else:
                 return f"Element {target} not found"
         except Exception as e:
             return f"Click failed: {e}"
 
+    def _record_stats(self):
+        """Log each component's end-of-session statistics for the summary."""
+        stats = {
+            'ai_client': self.ai_client.stats,
+            'status_checks': (
+                self.bypass_mgr.status_check_stats
+                if self.bypass_mgr is not None else None
+            ),
+            'page_snapshots': (
+                self.snapshotter.stats if self.snapshotter is not None else None
+            ),
+            'ai_usage': self.ai_client.usage_by_task,
+            'ai_routing': self.ai_client.router.summary(),
+            'ai_scheduler': self.ai_client.scheduler.summary(),
+            'ai_cache': (
+                self.ai_client.cache.summary()
+                if self.ai_client.cache is not None else None
+            ),
+            'element_resolution': (
+                self.resolver.stats if self.resolver is not None else None
+            ),
+            'page_waits': (
+                {**self.waiter.stats, 'records': self.waiter.records}
+                if self.waiter is not None else None
+            ),
+            'trace': self.tracer.summary() if self.tracer.enabled else None,
+            'screenshot_pipeline': (
+                self.screenshot_service.stats
+                if self.screenshot_service is not None else None
+            ),
+            'metrics': self.metrics.snapshot() if self.metrics.enabled else None,
+            'browser_startup': self.browser_mgr.timings,
+            'request_policy': (
+                self.request_policy.summary() if self.request_policy.enabled else None
+            ),
+            'cassette': (
+                self.cassette.summary() if self.cassette.mode != 'off' else None
+            )
+        }
+        for name, value in stats.items():
+            self.session_log.event('stats', {'name': name, 'value': value})
+
     async def cleanup(self):
         """Close browser resources and persist session summary."""
         try:
-            await self.browser_mgr.cleanup(self.browser, self.context)
-
+            if self.screenshot_service is not None:
+                await self.screenshot_service.close()
+            if self.metrics_server is not None:
+                await self.metrics_server.stop()
+            await self.browser_mgr.close()
+            await self.ai_client.close()
+            # Waits for queued cache writes, so keep it off the loop.
+            await asyncio.to_thread(self.request_policy.close)
+            cassette_path = self.cassette.save()
+            if cassette_path:
+                self.reporter.info(f"Cassette recorded to {cassette_path}")
+
+            self._record_stats()
+            self.session_log.event(
+                'session_end', {'total_time': time.time() - self.start_time}
+            )
+            self.session_log.close()
             if self.config.monitoring.track_session_metrics:
-                session_summary = {
-                    'total_time': time.time() - self.start_time,
-                    'bypass_attempts': self.bypass_attempts,
-                    'ai_decisions': len(self.ai_decisions),
-                    'screenshots': self.screenshots
-                }
-                with open(self.config.files.summary_filename, 'w') as f:
-                    json.dump(session_summary, f, indent=2, default=str)
-                print(f"\nSession summary saved to {self.config.files.summary_filename}")
+                self.session_log.write_summary(self.config.files.summary_filename)
+                self.reporter.info(
+                    f"\nSession summary saved to {self.config.files.summary_filename}"
+                )
+
+            for trace_path in self.tracer.export():
+                self.reporter.info(f"Trace written to {trace_path}")
 
         except Exception as e:
             self.logger.error(f"Cleanup error: {e}")
+        finally:
+            # Drains queued log records and console lines before returning.
+            self.log_pipeline.stop()
 
 
 async def run_demo():
@@ -586,35 +944,36 @@ async def run_demo():
 
     navigator = Navigator(config_path="config.toml", anthropic_api_key=api_key)
     goal = navigator.config.general.goal
+    reporter = navigator.reporter
 
-    print("Starting navigation...")
-    print(f"Goal: {goal}")
+    reporter.info("Starting navigation...")
+    reporter.info(f"Goal: {goal}")
 
     result = await navigator.run(goal)
 
-    print("\n" + "=" * 80)
-    print("NAVIGATION COMPLETE")
-    print("=" * 80)
+    reporter.info("\n" + "=" * 80)
+    reporter.info("NAVIGATION COMPLETE")
+    reporter.info("=" * 80)
 
     if result and result.get('final_result', {}).get('success'):
-        print("NAVIGATION SUCCESSFUL")
+        reporter.result("NAVIGATION SUCCESSFUL")
     else:
-        print("NAVIGATION COMPLETED (with simulation fallback)")
+        reporter.result("NAVIGATION COMPLETED (with simulation fallback)")
 
     if result:
-        print("\nKey Achievements:")
+        reporter.info("\nKey Achievements:")
         for achievement in result.get('technical_achievements', []):
-            print(f"  {achievement}")
+            reporter.info(f"  {achievement}")
 
-        print("\nFiles Generated:")
+        reporter.info("\nFiles Generated:")
         log_filename = navigator.config.files.log_filename
         summary_filename = navigator.config.files.summary_filename
-        print(f"  {log_filename}")
-        print(f"  {summary_filename}")
+        reporter.info(f"  {log_filename}")
+        reporter.info(f"  {summary_filename}")
 
         screenshots = result.get('final_result', {}).get('screenshots', [])
         for screenshot in screenshots:
-            print(f"  {screenshot}")
+            reporter.info(f"  {screenshot}")
 
     return result
 
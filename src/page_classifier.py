@@ -0,0 +1,77 @@
+"""
+Rule-based page status classifier that settles clear-cut Cloudflare status
+checks locally and defers only ambiguous pages to the AI.
+"""
+
+from typing import Dict, List, Tuple
+
+from src.config import Config
+from src.page_snapshot import PageSnapshot
+
+
+class PageStatusClassifier:
+    """Classifies a page as challenge, content or ambiguous from config rules.
+
+    Title and text are matched against the precompiled ``challenge_indicators``
+    and selector presence is checked for ``challenge_selectors`` and
+    ``success_indicators``, all read from one PageSnapshot.
+    """
+
+    CHALLENGE = 'challenge'
+    CONTENT = 'content'
+    AMBIGUOUS = 'ambiguous'
+
+    def __init__(self, config: Config):
+        self.config = config
+        detection_cfg = self.config.cloudflare_detection
+        self._indicator_pattern = detection_cfg.challenge_pattern
+        self._challenge_selectors = list(detection_cfg.challenge_selectors)
+        self._success_selectors = list(detection_cfg.success_indicators)
+        self._min_success = getattr(detection_cfg, 'min_success_selectors', 3)
+
+        self.stats = {'rules': 0, 'ai': 0}
+
+    def classify(self, snapshot: PageSnapshot) -> Dict:
+        """Apply the rules to a page snapshot.
+
+        Returns dict with: verdict, reason, challenge_selectors, success_selectors.
+        """
+        challenge = snapshot.present(self._challenge_selectors)
+        success = snapshot.present(self._success_selectors)
+        verdict, reason = self._apply_rules(snapshot, challenge, success)
+        if verdict != self.AMBIGUOUS:
+            self.stats['rules'] += 1
+
+        return {
+            'verdict': verdict,
+            'reason': reason,
+            'challenge_selectors': challenge,
+            'success_selectors': success
+        }
+
+    def record_ai_decision(self):
+        """Count a status check that had to be settled by the AI."""
+        self.stats['ai'] += 1
+
+    def _apply_rules(
+        self,
+        snapshot: PageSnapshot,
+        challenge: List[str],
+        success: List[str]
+    ) -> Tuple[str, str]:
+        if challenge:
+            return self.CHALLENGE, f"challenge element {challenge[0]}"
+
+        title_match = self._indicator_pattern.search(snapshot.title)
+        if title_match:
+            return self.CHALLENGE, f"title contains '{title_match.group(0)}'"
+
+        # Indicator words in body text alone can be footer noise on a real page,
+        # so they only make the page ambiguous rather than a challenge.
+        if self._indicator_pattern.search(snapshot.text):
+            return self.AMBIGUOUS, "challenge wording in page text"
+
+        if len(success) >= self._min_success:
+            return self.CONTENT, f"{len(success)} site elements present"
+
+        return self.AMBIGUOUS, "too few site elements"
@@ -0,0 +1,126 @@
+"""
+Distils a PageSnapshot into a compact, size-budgeted outline for AI prompts.
+"""
+
+from typing import Dict, List, Set
+
+from src.config import Config
+from src.page_snapshot import PageSnapshot
+
+FORM_CONTROL_TAGS = ('input', 'select', 'textarea', 'button')
+
+
+class PageOutliner:
+    """Builds a deduplicated text outline of the parts of a page that matter.
+
+    Sections are emitted in priority order (headings, form controls, products,
+    links, then a plain-text excerpt) and filling stops once ``max_chars`` is
+    reached, so menu and footer noise is what gets dropped first.
+    """
+
+    def __init__(self, config: Config):
+        self.config = config
+        outline_cfg = getattr(self.config, 'page_outline', None)
+        self.enabled = getattr(outline_cfg, 'enabled', False)
+        self.max_chars = getattr(outline_cfg, 'max_chars', 2500)
+        self.max_links = getattr(outline_cfg, 'max_links', 25)
+        self.text_excerpt_chars = getattr(outline_cfg, 'text_excerpt_chars', 600)
+
+    def content_for_prompt(self, snapshot: PageSnapshot) -> str:
+        """Return the outline when enabled, otherwise the raw truncated text."""
+        return self.outline(snapshot) if self.enabled else snapshot.text
+
+    def outline(self, snapshot: PageSnapshot) -> str:
+        """Render the snapshot as a compact outline of at most ``max_chars``."""
+        seen: Set[str] = set()
+        sections = [
+            ('HEADINGS', snapshot.headings),
+            ('FORM CONTROLS', self._form_controls(snapshot.interactive)),
+            ('PRODUCTS', self._products(snapshot.products)),
+            ('LINKS', self._links(snapshot.interactive)),
+        ]
+
+        lines = [f"URL: {snapshot.url}"]
+        budget = self.max_chars - len(lines[0])
+        for name, entries in sections:
+            header_cost = len(name) + 2
+            section_lines = []
+            for entry in entries:
+                key = entry.lower()
+                if key in seen:
+                    continue
+                cost = len(entry) + 3 + (0 if section_lines else header_cost)
+                if cost > budget:
+                    break
+                seen.add(key)
+                section_lines.append(f"- {entry}")
+                budget -= cost
+            if section_lines:
+                lines.append(f"{name}:")
+                lines.extend(section_lines)
+
+        excerpt = self._text_excerpt(
+            snapshot.text,
+            '\n'.join(lines).lower(),
+            min(budget - len("\nTEXT:\n"), self.text_excerpt_chars)
+        )
+        if excerpt:
+            lines.append("TEXT:")
+            lines.append(excerpt)
+
+        return '\n'.join(lines)
+
+    def _form_controls(self, interactive: List[Dict]) -> List[str]:
+        entries = []
+        for element in interactive:
+            if element['tag'] not in FORM_CONTROL_TAGS:
+                continue
+            kind = element['tag'] + (f"[{element['type']}]" if element['type'] else '')
+            label = f' "{element["text"]}"' if element['text'] else ''
+            target = f" -> {element['selector']}" if element['selector'] else ''
+            entries.append(f"{kind}{label}{target}")
+        return entries
+
+    def _products(self, products: List[Dict]) -> List[str]:
+        entries = []
+        for product in products:
+            if not product['title']:
+                continue
+            price = f" {product['price']}" if product['price'] else ''
+            target = product['selector'] or product['href']
+            entries.append(
+                f"{product['title']}{price}" + (f" -> {target}" if target else '')
+            )
+        return entries
+
+    def _links(self, interactive: List[Dict]) -> List[str]:
+        entries = []
+        for element in interactive:
+            if element['tag'] != 'a' or not element['text']:
+                continue
+            target = element['selector'] or element['href']
+            if not target:
+                continue  # nothing the model could act on
+            entries.append(f'"{element["text"]}" -> {target}')
+            if len(entries) >= self.max_links:
+                break
+        return entries
+
+    def _text_excerpt(self, text: str, outline: str, limit: int) -> str:
+        """Keep the lines of page text not already covered by the outline."""
+        if limit <= 0:
+            return ''
+        kept = []
+        seen: Set[str] = set()
+        size = 0
+        for line in text.splitlines():
+            line = ' '.join(line.split())
+            key = line.lower()
+            if len(line) < 4 or key in seen or key in outline:
+                continue
+            if size + len(line) + 1 > limit:
+                break
+            seen.add(key)
+            kept.append(line)
+            size += len(line) + 1
+        return '\n'.join(kept)
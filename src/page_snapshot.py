@@ -0,0 +1,191 @@
+"""
+Single-round-trip page snapshots shared by the navigator and the bypass
+orchestrator.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from playwright.async_api import Frame, Page
+
+from src.config import Config
+
+SNAPSHOT_SCRIPT = """
+({trackedSelectors, productSelectors, textLimit, maxElements}) => {
+    const escape = (value) => (window.CSS && CSS.escape) ? CSS.escape(value) : value;
+    const selectorFor = (el) => {
+        const tag = el.tagName.toLowerCase();
+        if (el.id) return '#' + escape(el.id);
+        for (const attr of ['name', 'aria-label', 'data-testid']) {
+            const value = el.getAttribute(attr);
+            if (value) return `${tag}[${attr}="${value.replace(/"/g, '\\\\"')}"]`;
+        }
+        return null;
+    };
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0;
+    };
+    const clean = (value, limit) =>
+        (value || '').trim().replace(/\\s+/g, ' ').slice(0, limit);
+
+    const interactive = [];
+    const candidates = document.querySelectorAll(
+        'a[href], button, input, select, textarea, [role="button"]'
+    );
+    for (const el of candidates) {
+        if (interactive.length >= maxElements) break;
+        if (el.type === 'hidden' || !isVisible(el)) continue;
+        const label = el.innerText || el.value || el.getAttribute('placeholder')
+            || el.getAttribute('aria-label') || '';
+        interactive.push({
+            tag: el.tagName.toLowerCase(),
+            type: el.getAttribute('type') || '',
+            text: clean(label, 80),
+            selector: selectorFor(el),
+            href: el.tagName === 'A' ? el.getAttribute('href') : null
+        });
+    }
+
+    const headings = [];
+    for (const el of document.querySelectorAll('h1, h2, h3')) {
+        if (headings.length >= maxElements) break;
+        const text = clean(el.innerText, 120);
+        if (text && isVisible(el)) headings.push(el.tagName.toLowerCase() + ' ' + text);
+    }
+
+    const products = [];
+    let cards = [];
+    try {
+        cards = productSelectors.length
+            ? document.querySelectorAll(productSelectors.join(', ')) : [];
+    } catch (e) {
+        cards = [];
+    }
+    for (const card of cards) {
+        if (products.length >= maxElements) break;
+        const titleEl = card.querySelector('h2, h3, h4, [data-testid*="title"], a');
+        const price = (card.innerText || '').match(/\\$\\s?\\d[\\d,]*(\\.\\d{2})?/);
+        const link = card.querySelector('a[href]');
+        products.push({
+            title: clean(titleEl ? titleEl.innerText : card.innerText, 100),
+            price: price ? price[0] : '',
+            selector: link ? selectorFor(link) : selectorFor(card),
+            href: link ? link.getAttribute('href') : null
+        });
+    }
+
+    const selectors = {};
+    for (const selector of trackedSelectors) {
+        try {
+            selectors[selector] = document.querySelector(selector) !== null;
+        } catch (e) {
+            selectors[selector] = false;
+        }
+    }
+
+    return {
+        url: location.href,
+        title: document.title,
+        text: document.body ? document.body.innerText.slice(0, textLimit) : '',
+        interactive: interactive,
+        headings: headings,
+        products: products,
+        selectors: selectors
+    };
+}
+"""
+
+
+@dataclass(frozen=True)
+class PageSnapshot:
+    """Everything consumers read from a page, captured in one ``evaluate``."""
+
+    url: str
+    title: str
+    text: str
+    interactive: List[Dict] = field(default_factory=list)
+    headings: List[str] = field(default_factory=list)
+    products: List[Dict] = field(default_factory=list)
+    selectors: Dict[str, bool] = field(default_factory=dict)
+    navigation_id: int = 0
+    taken_at: float = 0.0
+
+    def present(self, selectors: List[str]) -> List[str]:
+        """Return the subset of ``selectors`` that matched an element."""
+        return [s for s in selectors if self.selectors.get(s, False)]
+
+
+class PageSnapshotter:
+    """Captures and caches PageSnapshots for one Playwright page.
+
+    A snapshot is reused until the main frame navigates or a caller
+    invalidates it after acting on the page.
+    """
+
+    def __init__(self, config: Config, page: Page):
+        self.config = config
+        self.page = page
+        self._snapshot: Optional[PageSnapshot] = None
+        self._navigation_id = 0
+
+        self._tracked_selectors = list(dict.fromkeys(
+            list(self.config.cloudflare_detection.challenge_selectors)
+            + list(self.config.cloudflare_detection.success_indicators)
+            + list(self.config.search_functionality.selectors)
+        ))
+        snapshot_cfg = getattr(self.config, 'page_snapshot', None)
+        self._max_elements = getattr(snapshot_cfg, 'max_elements', 60)
+        self._product_selectors = list(
+            getattr(snapshot_cfg, 'product_card_selectors', [])
+        )
+
+        self.stats = {'captured': 0, 'reused': 0, 'invalidated': 0}
+        self.page.on('framenavigated', self._on_frame_navigated)
+
+    @property
+    def navigation_id(self) -> int:
+        """Counter bumped on every main-frame navigation."""
+        return self._navigation_id
+
+    async def get(self, fresh: bool = False) -> PageSnapshot:
+        """Return the current snapshot, capturing a new one if needed.
+
+        Pass ``fresh=True`` when polling for changes that may happen without a
+        navigation, such as a challenge page rewriting itself in place.
+        """
+        if self._snapshot is not None and not fresh:
+            self.stats['reused'] += 1
+            return self._snapshot
+
+        raw = await self.page.evaluate(SNAPSHOT_SCRIPT, {
+            'trackedSelectors': self._tracked_selectors,
+            'productSelectors': self._product_selectors,
+            'textLimit': self.config.ai.token_limits.page_analysis,
+            'maxElements': self._max_elements
+        })
+        self._snapshot = PageSnapshot(
+            url=raw['url'],
+            title=raw['title'],
+            text=raw['text'],
+            interactive=raw['interactive'],
+            headings=raw['headings'],
+            products=raw['products'],
+            selectors=raw['selectors'],
+            navigation_id=self._navigation_id,
+            taken_at=time.time()
+        )
+        self.stats['captured'] += 1
+        return self._snapshot
+
+    def invalidate(self):
+        """Discard the cached snapshot so the next ``get`` re-reads the page."""
+        if self._snapshot is not None:
+            self._snapshot = None
+            self.stats['invalidated'] += 1
+
+    def _on_frame_navigated(self, frame: Frame):
+        if frame == self.page.main_frame:
+            self._navigation_id += 1
+            self.invalidate()
@@ -0,0 +1,269 @@
+"""
+Readiness waits that return as soon as the page is usable, replacing fixed
+sleeps after navigations and form submits.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from typing import AsyncIterator, Dict, List, Optional
+
+from playwright.async_api import Frame, Page, Request
+
+from src.config import Config
+from src.metrics import MetricsRegistry
+
+# Resolves once no DOM mutation has been seen for ``quietMs``. The observer is
+# installed on first poll and lives on the document, so a new document after
+# a navigation simply starts its own quiet period.
+DOM_STABLE_SCRIPT = """
+(quietMs) => {
+    const state = window.__navigatorDomWait
+        || (window.__navigatorDomWait = {last: performance.now()});
+    if (!state.observer && document.documentElement) {
+        state.observer = new MutationObserver(() => { state.last = performance.now(); });
+        state.observer.observe(document.documentElement, {
+            subtree: true, childList: true, attributes: true, characterData: true
+        });
+    }
+    return document.readyState !== 'loading'
+        && performance.now() - state.last >= quietMs;
+}
+"""
+
+SIGNALS = (
+    'commit', 'domcontentloaded', 'load', 'network_quiet', 'selector', 'dom_stable'
+)
+DEADLINE = 'deadline'
+
+
+class PageWaiter:
+    """Waits for the first of several readiness signals, capped by a deadline.
+
+    Signals (``[page_waits] signals``): ``commit`` (a main-frame navigation
+    happened), ``domcontentloaded`` and ``load`` (Playwright load states),
+    ``network_quiet`` (no request in flight for ``network_quiet_ms``),
+    ``selector`` (the caller's selector is visible) and ``dom_stable`` (no
+    DOM mutation for ``dom_stable_ms``). The deadline is the fixed sleep the
+    wait replaces, so a wait is never slower than the sleep it stands in for.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        page: Page,
+        logger: Optional[logging.Logger] = None,
+        metrics: Optional[MetricsRegistry] = None
+    ):
+        self.config = config
+        self.page = page
+        self.logger = logger or logging.getLogger(__name__)
+        self.metrics = metrics or MetricsRegistry()
+
+        wait_cfg = getattr(self.config, 'page_waits', None)
+        self.signals = [
+            s for s in getattr(wait_cfg, 'signals', ['selector', 'network_quiet'])
+            if s in SIGNALS
+        ]
+        self.network_quiet_s = getattr(wait_cfg, 'network_quiet_ms', 500) / 1000
+        self.dom_stable_ms = getattr(wait_cfg, 'dom_stable_ms', 500)
+        self.poll_interval_s = getattr(wait_cfg, 'poll_interval_ms', 100) / 1000
+
+        self.records: List[Dict] = []
+        self.stats = {
+            'waits': 0,
+            'deadline_hits': 0,
+            'waited': 0.0,
+            'budget': 0.0,
+            'saved': 0.0,
+            'by_signal': {}
+        }
+
+        self._inflight = 0
+        self._last_network_activity = time.monotonic()
+        self._navigation_futures: List[asyncio.Future] = []
+        self.page.on('request', self._on_request)
+        self.page.on('requestfinished', self._on_request_done)
+        self.page.on('requestfailed', self._on_request_done)
+        self.page.on('framenavigated', self._on_frame_navigated)
+
+    async def wait(
+        self,
+        label: str,
+        deadline: float,
+        selector: Optional[str] = None
+    ) -> Dict:
+        """Wait for the page to be ready now; returns the wait record."""
+        return await self._wait(label, deadline, selector, None)
+
+    async def dwell(
+        self,
+        label: str,
+        seconds: float,
+        selector: Optional[str] = None
+    ) -> Dict:
+        """Wait for readiness, then stay on the page until ``seconds`` have passed.
+
+        For pauses that pace the session rather than wait for the page (the
+        warm-up dwell times): the readiness signal is recorded, but the full
+        dwell is kept, so no time is counted as saved.
+        """
+        start = time.monotonic()
+        signal = await self._race(selector, seconds)
+        remaining = seconds - (time.monotonic() - start)
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+        return self._record(label, signal, time.monotonic() - start, seconds)
+
+    @contextlib.asynccontextmanager
+    async def until_ready(
+        self,
+        label: str,
+        deadline: float,
+        selector: Optional[str] = None,
+        expect_navigation: bool = False
+    ) -> AsyncIterator[None]:
+        """Wait for readiness after the action performed inside the block.
+
+        With ``expect_navigation`` the signals are only raced once the action
+        has navigated the main frame, so load-state signals are not satisfied
+        by the page being left. The navigation listener is armed before the
+        block runs; if the block raises, no wait happens.
+        """
+        navigated = (
+            asyncio.get_running_loop().create_future() if expect_navigation else None
+        )
+        if navigated is not None:
+            self._navigation_futures.append(navigated)
+        try:
+            yield
+        except BaseException:
+            self._discard(navigated)
+            raise
+        await self._wait(label, deadline, selector, navigated)
+
+    async def _wait(
+        self,
+        label: str,
+        deadline: float,
+        selector: Optional[str],
+        navigated: Optional[asyncio.Future]
+    ) -> Dict:
+        start = time.monotonic()
+        signal = DEADLINE
+        try:
+            if navigated is not None:
+                await asyncio.wait_for(navigated, deadline)
+            if navigated is not None and 'commit' in self.signals:
+                signal = 'commit'
+            else:
+                remaining = max(0.0, deadline - (time.monotonic() - start))
+                signal = await self._race(selector, remaining)
+        except asyncio.TimeoutError:
+            signal = DEADLINE
+        finally:
+            self._discard(navigated)
+
+        return self._record(label, signal, time.monotonic() - start, deadline)
+
+    async def _race(self, selector: Optional[str], timeout: float) -> str:
+        """Return the name of the first signal to fire, or DEADLINE."""
+        waiters = {
+            name: asyncio.ensure_future(coro)
+            for name, coro in self._signal_coroutines(selector, timeout)
+        }
+        if not waiters:
+            await asyncio.sleep(timeout)
+            return DEADLINE
+
+        pending = set(waiters.values())
+        winner = DEADLINE
+        loop = asyncio.get_running_loop()
+        end = loop.time() + timeout
+        try:
+            while pending and winner == DEADLINE:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=max(0.0, end - loop.time()),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                for name, task in waiters.items():
+                    # A signal that errors (e.g. its context was navigated away)
+                    # drops out of the race; the others keep going.
+                    if task in done and task.exception() is None and winner == DEADLINE:
+                        winner = name
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        return winner
+
+    def _signal_coroutines(self, selector: Optional[str], timeout: float):
+        timeout_ms = max(1, int(timeout * 1000))
+        for name in self.signals:
+            if name in ('domcontentloaded', 'load'):
+                yield name, self.page.wait_for_load_state(name, timeout=timeout_ms)
+            elif name == 'network_quiet':
+                yield name, self._network_quiet()
+            elif name == 'selector' and selector:
+                yield name, self.page.wait_for_selector(
+                    selector, state='visible', timeout=timeout_ms
+                )
+            elif name == 'dom_stable':
+                yield name, self.page.wait_for_function(
+                    DOM_STABLE_SCRIPT,
+                    arg=self.dom_stable_ms,
+                    polling=int(self.poll_interval_s * 1000),
+                    timeout=timeout_ms
+                )
+
+    async def _network_quiet(self):
+        while True:
+            idle = time.monotonic() - self._last_network_activity
+            if self._inflight <= 0 and idle >= self.network_quiet_s:
+                return
+            await asyncio.sleep(self.poll_interval_s)
+
+    def _record(self, label: str, signal: str, waited: float, deadline: float) -> Dict:
+        record = {
+            'label': label,
+            'signal': signal,
+            'waited': round(waited, 3),
+            'deadline': deadline
+        }
+        self.records.append(record)
+        self.stats['waits'] += 1
+        self.stats['waited'] += waited
+        self.stats['budget'] += deadline
+        self.stats['saved'] += max(0.0, deadline - waited)
+        self.stats['by_signal'][signal] = self.stats['by_signal'].get(signal, 0) + 1
+        if signal == DEADLINE:
+            self.stats['deadline_hits'] += 1
+        self.metrics.observe('page_wait_seconds', waited, label=label, signal=signal)
+        self.logger.debug(f"Wait '{label}' ended on {signal} after {waited:.2f}s")
+        return record
+
+    def _discard(self, future: Optional[asyncio.Future]):
+        if future is not None and future in self._navigation_futures:
+            self._navigation_futures.remove(future)
+
+    def _on_request(self, request: Request):
+        self._inflight += 1
+        self._last_network_activity = time.monotonic()
+
+    def _on_request_done(self, request: Request):
+        self._inflight = max(0, self._inflight - 1)
+        self._last_network_activity = time.monotonic()
+
+    def _on_frame_navigated(self, frame: Frame):
+        if frame != self.page.main_frame:
+            return
+        # Requests of the old document never report completion.
+        self._inflight = 0
+        self._last_network_activity = time.monotonic()
+        for future in self._navigation_futures:
+            if not future.done():
+                future.set_result(True)
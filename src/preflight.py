@@ -0,0 +1,178 @@
+"""
+Pre-flight checks run by ``navigate_to_checkout.py --check``: validate the
+config, prompt templates, output paths and installed packages without
+importing the browser or AI stacks.
+"""
+
+import importlib.util
+import os
+import string
+from typing import List
+
+import toml
+
+from src.config import Config, ConfigError, build_config
+
+# Replacement fields AIClient passes to each prompt template.
+PROMPT_FIELDS = {
+    'cloudflare_detection': ('url', 'title', 'content_sample'),
+    'goal_parsing': ('goal',),
+    'page_analysis': ('title', 'content_sample'),
+    'action_decision': ('intent', 'page_analysis'),
+    'intelligent_navigation': (
+        'goal', 'page_type', 'current_url', 'elements', 'history'
+    ),
+    'observe_and_decide': (
+        'goal', 'current_url', 'title', 'history', 'content_sample'
+    ),
+    'simulation_decision': ('description', 'goal', 'ai_task'),
+}
+
+RUNTIME_PACKAGES = ('anthropic', 'playwright', 'playwright_stealth', 'dotenv')
+
+
+def check_prompt_templates(config: Config) -> List[str]:
+    """Report templates that fail to parse or reference unknown fields."""
+    problems = []
+    formatter = string.Formatter()
+    for name, allowed in PROMPT_FIELDS.items():
+        template = getattr(config.prompts, name).template
+        try:
+            used = {
+                field.split('.')[0].split('[')[0]
+                for _, field, _, _ in formatter.parse(template)
+                if field is not None
+            }
+        except ValueError as e:
+            problems.append(f"prompts.{name}.template: {e}")
+            continue
+        unknown = sorted(used - set(allowed))
+        if unknown:
+            problems.append(
+                f"prompts.{name}.template: unknown field(s) {unknown}, "
+                f"expected some of {list(allowed)}"
+            )
+    return problems
+
+
+def check_scenarios(config: Config) -> List[str]:
+    """Report simulation scenarios missing the keys the prompt needs."""
+    problems = []
+    for i, scenario in enumerate(config.simulation_scenarios.scenarios):
+        missing = [key for key in ('description', 'ai_task') if key not in scenario]
+        if missing:
+            problems.append(f"simulation_scenarios.scenarios[{i}]: missing {missing}")
+    return problems
+
+
+def check_output_paths(config: Config) -> List[str]:
+    """Report output files whose directory is missing or not writable."""
+    paths = {
+        'files.log_filename': config.files.log_filename,
+        'files.summary_filename': config.files.summary_filename,
+        'files.results_filename': config.files.results_filename,
+        'files.screenshot_prefix': config.files.screenshot_prefix,
+    }
+    if getattr(config.logging, 'json_path', ''):
+        paths['logging.json_path'] = config.logging.json_path
+    log_cfg = getattr(config, 'session_log', None)
+    paths['session_log.path'] = getattr(log_cfg, 'path', 'session_events.jsonl')
+    tracing_cfg = getattr(config, 'tracing', None)
+    if getattr(tracing_cfg, 'enabled', False):
+        for key in ('chrome_trace_path', 'otlp_path'):
+            if getattr(tracing_cfg, key, ''):
+                paths[f'tracing.{key}'] = getattr(tracing_cfg, key)
+    cache_cfg = getattr(config.ai, 'cache', None)
+    if getattr(cache_cfg, 'enabled', False) and getattr(cache_cfg, 'disk_path', ''):
+        paths['ai.cache.disk_path'] = cache_cfg.disk_path
+    policy_cfg = getattr(config, 'request_policy', None)
+    if getattr(policy_cfg, 'enabled', False) and getattr(policy_cfg, 'cache_path', ''):
+        paths['request_policy.cache_path'] = policy_cfg.cache_path
+    cassette_cfg = getattr(config, 'cassette', None)
+    if getattr(cassette_cfg, 'mode', 'off') == 'record':
+        paths['cassette.path'] = cassette_cfg.path
+
+    problems = []
+    for key, path in paths.items():
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.isdir(directory):
+            problems.append(f"{key}: directory '{directory}' does not exist")
+        elif not os.access(directory, os.W_OK):
+            problems.append(f"{key}: directory '{directory}' is not writable")
+    return problems
+
+
+def check_cassette(config: Config) -> List[str]:
+    """Report an unknown cassette mode or a missing cassette to replay."""
+    cassette_cfg = getattr(config, 'cassette', None)
+    mode = getattr(cassette_cfg, 'mode', 'off')
+    if mode not in ('off', 'record', 'replay'):
+        return [f"cassette.mode: expected 'off', 'record' or 'replay', got '{mode}'"]
+    if mode == 'replay' and not os.path.isfile(cassette_cfg.path):
+        return [f"cassette.path: no cassette to replay at '{cassette_cfg.path}'"]
+    return []
+
+
+def check_model_routing(config: Config) -> List[str]:
+    """Report routing tiers other than 'primary' and 'backup'."""
+    routing_cfg = getattr(config.ai, 'routing', None)
+    if not getattr(routing_cfg, 'enabled', False):
+        return []
+    tiers_cfg = getattr(routing_cfg, 'tiers', None)
+    tiers = {'default_tier': getattr(routing_cfg, 'default_tier', 'primary')}
+    if tiers_cfg is not None:
+        tiers.update(tiers_cfg.to_dict())
+    return [
+        f"ai.routing: '{key}' should be 'primary' or 'backup', got '{tier}'"
+        for key, tier in tiers.items()
+        if tier not in ('primary', 'backup')
+    ]
+
+
+def check_rate_limit(config: Config) -> List[str]:
+    """Report negative rate limits and a max_delay below base_delay."""
+    limit_cfg = getattr(config.ai, 'rate_limit', None)
+    if limit_cfg is None:
+        return []
+    problems = [
+        f"ai.rate_limit.{key}: should not be negative, got {getattr(limit_cfg, key)}"
+        for key in (
+            'requests_per_minute', 'burst', 'max_concurrency', 'base_delay',
+            'max_delay', 'failure_threshold', 'cooldown'
+        )
+        if getattr(limit_cfg, key, 0) < 0
+    ]
+    if getattr(limit_cfg, 'max_delay', 30.0) < getattr(limit_cfg, 'base_delay', 1.0):
+        problems.append("ai.rate_limit: max_delay is below base_delay")
+    return problems
+
+
+def check_packages() -> List[str]:
+    """Report runtime packages that are not installed, without importing them."""
+    return [
+        f"package '{name}' is not installed"
+        for name in RUNTIME_PACKAGES
+        if importlib.util.find_spec(name) is None
+    ]
+
+
+def run_checks(config_path: str) -> List[str]:
+    """Run every check against ``config_path`` and return the problems found."""
+    # Parsed here rather than through load_config, which prints its own errors.
+    try:
+        with open(config_path, 'r') as f:
+            config = build_config(toml.load(f))
+    except ConfigError as e:
+        return [f"config: {line.strip('- ').strip()}" for line in str(e).splitlines()]
+    except Exception as e:
+        return [f"config: {e}"]
+
+    return (
+        check_prompt_templates(config)
+        + check_scenarios(config)
+        + check_output_paths(config)
+        + check_cassette(config)
+        + check_model_routing(config)
+        + check_rate_limit(config)
+        + check_packages()
+    )
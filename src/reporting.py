@@ -0,0 +1,170 @@
+"""
+Session logging through a background queue listener, with optional JSON-lines
+output, and the console reporter used in place of print().
+"""
+
+import contextvars
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+from typing import Optional
+
+from src.config import Config
+
+# Logger the reporter writes through; kept out of the text log and stderr.
+CONSOLE_LOGGER = 'navigator.console'
+
+QUIET, NORMAL, VERBOSE = 0, 1, 2
+VERBOSITY = {'quiet': QUIET, 'normal': NORMAL, 'verbose': VERBOSE}
+
+_current_step: contextvars.ContextVar = contextvars.ContextVar(
+    'current_step', default=None
+)
+
+
+def set_step(step: Optional[int]):
+    """Tag log records from the current task with a navigation step (None clears)."""
+    _current_step.set(step)
+
+
+class _ContextFilter(logging.Filter):
+    """Stamps records with the session id and current step before they are queued."""
+
+    def __init__(self, session: str):
+        super().__init__()
+        self.session = session
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.session = self.session
+        record.step = _current_step.get()
+        return True
+
+
+class _NameFilter(logging.Filter):
+    def __init__(self, name: str, exclude: bool = False):
+        super().__init__()
+        self.logger_name = name
+        self.exclude = exclude
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return (record.name == self.logger_name) != self.exclude
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, message, session and step."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': round(record.created, 3),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'session': getattr(record, 'session', None),
+            'step': getattr(record, 'step', None)
+        }
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class LogPipeline:
+    """Routes all logging through a queue drained by a ``QueueListener`` thread.
+
+    Callers on the event loop only enqueue records; the listener writes the
+    text log (``files.log_filename``), stderr, reporter lines to stdout and,
+    if ``[logging] json_path`` is set, JSON lines. ``stop`` drains the queue
+    and removes the handlers again.
+    """
+
+    def __init__(self, config: Config, session: str):
+        log_cfg = config.logging
+        self.level = log_cfg.log_level
+        formatter = logging.Formatter(log_cfg.format, datefmt=log_cfg.date_format)
+        not_console = _NameFilter(CONSOLE_LOGGER, exclude=True)
+
+        handlers = []
+        for handler in (
+            logging.FileHandler(config.files.log_filename),
+            logging.StreamHandler()
+        ):
+            handler.setFormatter(formatter)
+            handler.addFilter(not_console)
+            handlers.append(handler)
+        console = logging.StreamHandler(sys.stdout)
+        console.setFormatter(logging.Formatter('%(message)s'))
+        console.addFilter(_NameFilter(CONSOLE_LOGGER))
+        handlers.append(console)
+        json_path = getattr(log_cfg, 'json_path', '')
+        if json_path:
+            structured = logging.FileHandler(json_path)
+            structured.setFormatter(JsonFormatter())
+            handlers.append(structured)
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._queue_handler = logging.handlers.QueueHandler(self._queue)
+        self._queue_handler.addFilter(_ContextFilter(session))
+        self._listener = logging.handlers.QueueListener(self._queue, *handlers)
+        self._handlers = handlers
+        self._running = False
+
+    def start(self):
+        root = logging.getLogger()
+        root.setLevel(self.level)
+        root.addHandler(self._queue_handler)
+        console = logging.getLogger(CONSOLE_LOGGER)
+        console.setLevel(logging.INFO)
+        console.propagate = False
+        console.addHandler(self._queue_handler)
+        self._listener.start()
+        self._running = True
+
+    def stop(self):
+        """Write out everything queued, then detach. Safe to call twice."""
+        if not self._running:
+            return
+        self._running = False
+        logging.getLogger().removeHandler(self._queue_handler)
+        logging.getLogger(CONSOLE_LOGGER).removeHandler(self._queue_handler)
+        self._listener.stop()
+        for handler in self._handlers:
+            handler.close()
+
+
+class Reporter:
+    """Console output at ``[logging] verbosity``: quiet, normal or verbose.
+
+    ``result`` lines (outcomes) always show, ``info`` from normal up, and
+    ``detail`` (sub-steps) only when verbose. While a ``LogPipeline`` runs,
+    lines are written by its listener thread, off the event loop; otherwise
+    they are printed directly.
+    """
+
+    def __init__(self, config: Optional[Config] = None, verbosity: Optional[str] = None):
+        log_cfg = getattr(config, 'logging', None)
+        verbosity = verbosity or getattr(log_cfg, 'verbosity', 'normal')
+        if verbosity not in VERBOSITY:
+            raise ValueError(f"verbosity must be one of {tuple(VERBOSITY)}")
+        self.verbosity = VERBOSITY[verbosity]
+        self.logger = logging.getLogger(CONSOLE_LOGGER)
+
+    def result(self, message: str):
+        self._emit(QUIET, message)
+
+    def info(self, message: str):
+        self._emit(NORMAL, message)
+
+    def detail(self, message: str):
+        self._emit(VERBOSE, message)
+
+    def section(self, title: str, rule: str = '-', width: int = 50):
+        self.info(f"\n{title}\n{rule * width}")
+
+    def _emit(self, level: int, message: str):
+        if level > self.verbosity:
+            return
+        if self.logger.handlers:
+            self.logger.info(message)
+        else:
+            print(message)
@@ -0,0 +1,262 @@
+"""
+Per-resource-type request policy for the browser context: block, allow, or
+serve from a local cache, counting the requests and bytes saved per page.
+"""
+
+import asyncio
+import fnmatch
+import json
+import logging
+import sqlite3
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from playwright.async_api import BrowserContext, Request, Route
+
+from src.config import Config
+from src.metrics import MetricsRegistry
+
+ACTIONS = ('allow', 'block', 'cache')
+
+# Cached responses are stored decoded, so these would no longer describe them.
+_STALE_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding')
+
+# Per-page breakdowns kept for the session summary.
+MAX_PAGES = 50
+
+
+class RequestPolicy:
+    """Applies ``[request_policy]`` rules to every request of a context.
+
+    Each rule names ``resource_types`` (Playwright's, e.g. "image", "font";
+    empty for any) and ``hosts`` (fnmatch patterns; empty for any) and an
+    ``action``. The first matching rule wins, else ``default_action``.
+    Requests for the main document are always allowed, so what the agent
+    reads is unchanged; sub-frame documents go through the rules.
+
+    Routing a context turns off the browser's HTTP cache, so "cache" keeps
+    successful GET responses in a memory LRU of ``cache_max_bytes`` (and in
+    SQLite at ``cache_path`` if set, to reuse them across runs). SQLite work
+    runs on one worker thread that owns the connection, never in the route
+    handler itself. Allowed requests fall through to other route handlers,
+    such as a cassette.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        logger: Optional[logging.Logger] = None,
+        metrics: Optional[MetricsRegistry] = None
+    ):
+        policy_cfg = getattr(config, 'request_policy', None)
+        self.enabled = getattr(policy_cfg, 'enabled', False)
+        self.default_action = getattr(policy_cfg, 'default_action', 'allow')
+        self.rules: List[Tuple[Tuple[str, ...], Tuple[str, ...], str]] = [
+            (
+                tuple(rule.get('resource_types', [])),
+                tuple(rule.get('hosts', [])),
+                rule.get('action', 'allow')
+            )
+            for rule in getattr(policy_cfg, 'rules', [])
+        ]
+        for action in [rule[2] for rule in self.rules] + [self.default_action]:
+            if action not in ACTIONS:
+                raise ValueError(f"request_policy action must be one of {ACTIONS}")
+        self.cache_max_bytes = getattr(policy_cfg, 'cache_max_bytes', 64 * 1024 * 1024)
+        self.logger = logger or logging.getLogger(__name__)
+        self.metrics = metrics or MetricsRegistry()
+
+        self._memory: "OrderedDict[str, Dict]" = OrderedDict()
+        self._memory_bytes = 0
+        self._db: Optional[sqlite3.Connection] = None
+        self._disk: Optional[ThreadPoolExecutor] = None
+        cache_path = getattr(policy_cfg, 'cache_path', '')
+        if self.enabled and cache_path:
+            self._disk = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='request-policy-cache'
+            )
+            # Queued ahead of every lookup and store; nothing waits for it here.
+            self._disk.submit(self._open, cache_path)
+        self._cache_enabled = True
+
+        self.stats = {
+            'allowed': 0,
+            'blocked': 0,
+            'cache_hits': 0,
+            'cache_stores': 0,
+            'bytes_from_cache': 0,
+            'blocked_by_type': {}
+        }
+        self.pages: "OrderedDict[str, Dict]" = OrderedDict()
+        self._page_url = ''
+
+    async def attach(self, context: BrowserContext, cache: bool = True):
+        """Route ``context`` through the policy.
+
+        Register it after any other handler so it is consulted first. With
+        ``cache`` off, "cache" rules allow instead, leaving fetching to the
+        handlers behind this one.
+        """
+        if not self.enabled:
+            return
+        self._cache_enabled = cache
+        await context.route('**/*', self._route)
+
+    def action_for(self, resource_type: str, url: str) -> str:
+        host = urlsplit(url).hostname or ''
+        for types, hosts, action in self.rules:
+            if types and resource_type not in types:
+                continue
+            if hosts and not any(fnmatch.fnmatch(host, pattern) for pattern in hosts):
+                continue
+            return action
+        return self.default_action
+
+    async def _route(self, route: Route, request: Request):
+        if request.is_navigation_request() and request.frame.parent_frame is None:
+            self._page_url = request.url
+            await route.fallback()
+            return
+
+        action = self.action_for(request.resource_type, request.url)
+        if action == 'block':
+            self._count('blocked', request.resource_type)
+            await route.abort('blockedbyclient')
+        elif action == 'cache' and self._cache_enabled and request.method == 'GET':
+            await self._serve_cached(route, request)
+        else:
+            self._count('allowed', request.resource_type)
+            await route.fallback()
+
+    async def _serve_cached(self, route: Route, request: Request):
+        entry = await self._get(request.url)
+        if entry is not None:
+            self._count('cache_hits', request.resource_type, len(entry['body']))
+            await route.fulfill(
+                status=entry['status'], headers=entry['headers'], body=entry['body']
+            )
+            return
+
+        self._count('allowed', request.resource_type)
+        try:
+            response = await route.fetch()
+            body = await response.body()
+        except Exception as e:
+            self.logger.debug(f"Asset fetch failed for {request.url}: {e}")
+            await route.abort()
+            return
+        cache_control = response.headers.get('cache-control', '')
+        if response.status == 200 and 'no-store' not in cache_control:
+            self._put(request.url, {
+                'status': response.status,
+                'headers': {
+                    k: v for k, v in response.headers.items()
+                    if k.lower() not in _STALE_HEADERS
+                },
+                'body': body
+            })
+        await route.fulfill(response=response, body=body)
+
+    async def _get(self, url: str) -> Optional[Dict]:
+        entry = self._memory.get(url)
+        if entry is not None:
+            self._memory.move_to_end(url)
+            return entry
+        if self._disk is not None:
+            row = await asyncio.get_running_loop().run_in_executor(
+                self._disk, self._select, url
+            )
+            if row is not None:
+                entry = {'status': row[0], 'headers': json.loads(row[1]), 'body': row[2]}
+                self._remember(url, entry)
+                return entry
+        return None
+
+    def _put(self, url: str, entry: Dict):
+        self.stats['cache_stores'] += 1
+        self._remember(url, entry)
+        if self._disk is not None:
+            # Queued behind earlier writes; the route does not wait for it.
+            self._disk.submit(self._insert, url, entry)
+
+    def _remember(self, url: str, entry: Dict):
+        size = len(entry['body'])
+        if size > self.cache_max_bytes:
+            return
+        if url in self._memory:
+            self._memory_bytes -= len(self._memory.pop(url)['body'])
+        self._memory[url] = entry
+        self._memory_bytes += size
+        while self._memory_bytes > self.cache_max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted['body'])
+
+    def _count(self, outcome: str, resource_type: str, cached_bytes: int = 0):
+        self.stats[outcome] += 1
+        self.stats['bytes_from_cache'] += cached_bytes
+        if outcome == 'blocked':
+            by_type = self.stats['blocked_by_type']
+            by_type[resource_type] = by_type.get(resource_type, 0) + 1
+
+        page = self.pages.get(self._page_url)
+        if page is None:
+            page = self.pages[self._page_url] = {
+                'allowed': 0, 'blocked': 0, 'cache_hits': 0, 'bytes_from_cache': 0
+            }
+            if len(self.pages) > MAX_PAGES:
+                self.pages.popitem(last=False)
+        if outcome in page:
+            page[outcome] += 1
+        page['bytes_from_cache'] += cached_bytes
+        self.metrics.inc(
+            'page_requests_total', outcome=outcome, resource_type=resource_type
+        )
+
+    def summary(self) -> Dict:
+        return {**self.stats, 'pages': dict(self.pages)}
+
+    def close(self):
+        """Finish queued cache writes and close the database."""
+        if self._disk is not None:
+            self._disk.submit(self._close_db)
+            self._disk.shutdown(wait=True)
+            self._disk = None
+
+    # Called only on the disk worker thread, which owns the connection.
+
+    def _open(self, cache_path: str):
+        try:
+            db = sqlite3.connect(cache_path)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS assets "
+                "(url TEXT PRIMARY KEY, status INTEGER, headers TEXT, body BLOB)"
+            )
+            db.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Request cache unavailable at {cache_path}: {e}")
+            return
+        self._db = db
+
+    def _select(self, url: str) -> Optional[Tuple]:
+        if self._db is None:
+            return None
+        return self._db.execute(
+            "SELECT status, headers, body FROM assets WHERE url = ?", (url,)
+        ).fetchone()
+
+    def _insert(self, url: str, entry: Dict):
+        if self._db is None:
+            return
+        self._db.execute(
+            "INSERT OR REPLACE INTO assets VALUES (?, ?, ?, ?)",
+            (url, entry['status'], json.dumps(entry['headers']), entry['body'])
+        )
+        self._db.commit()
+
+    def _close_db(self):
+        if self._db is None:
+            return
+        self._db.close()
+        self._db = None
@@ -0,0 +1,264 @@
+"""
+Shared scheduler for model requests: a token-bucket rate limit, a concurrency
+cap, retries with jittered exponential backoff, and a circuit breaker per
+model.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import anthropic
+
+from src.config import Config
+from src.metrics import MetricsRegistry
+
+# HTTP statuses worth retrying: rate limit, server errors and overload.
+TRANSIENT_STATUSES = (429, 500, 502, 503, 504, 529)
+
+
+class CircuitOpenError(RuntimeError):
+    """A model's circuit is open, so the request was not sent."""
+
+
+def is_timeout(error: BaseException) -> bool:
+    """A request that ran into ``ai.client.request_timeout``, ours or the SDK's."""
+    return isinstance(error, (asyncio.TimeoutError, anthropic.APITimeoutError))
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Rate limit, overload, server or connection errors, and open circuits.
+
+    Timeouts are excluded: the request already used its whole time budget,
+    and retrying or failing over would multiply it.
+    """
+    if is_timeout(error):
+        return False
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code in TRANSIENT_STATUSES
+    return isinstance(error, (anthropic.APIConnectionError, CircuitOpenError))
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Seconds the API asked us to wait, from retry-after(-ms) headers."""
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+    for header, scale in (('retry-after-ms', 0.001), ('retry-after', 1.0)):
+        value = headers.get(header)
+        if value is None:
+            continue
+        try:
+            return max(0.0, float(value) * scale)
+        except ValueError:
+            continue  # an HTTP date; fall back to our own backoff
+    return None
+
+
+class TokenBucket:
+    """Allows ``rate`` acquisitions per second with bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> float:
+        """Take one token, sleeping until one is available; returns the wait."""
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return waited
+            delay = (1 - self._tokens) / self.rate
+            await asyncio.sleep(delay)
+            waited += delay
+
+
+class CircuitBreaker:
+    """Opens after ``threshold`` consecutive transient failures.
+
+    While open, requests fail fast. After ``cooldown`` seconds one trial
+    request is let through (half-open): success closes the circuit, another
+    failure opens it again.
+    """
+
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.state = 'closed'
+        self.failures = 0
+        self.opens = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    def allow(self) -> bool:
+        if self.state == 'open':
+            if time.monotonic() - self._opened_at < self.cooldown:
+                return False
+            self.state = 'half_open'
+        if self.state == 'half_open':
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+        return True
+
+    def record_success(self):
+        self.state = 'closed'
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.state == 'half_open' or (
+            self.threshold and self.failures >= self.threshold
+        ):
+            if self.state != 'open':
+                self.opens += 1
+            self.state = 'open'
+            self._opened_at = time.monotonic()
+
+    def release(self):
+        """Forget an abandoned trial request, e.g. one that was cancelled."""
+        self._trial_in_flight = False
+
+
+class RequestScheduler:
+    """Runs model requests under ``[ai.rate_limit]``.
+
+    Each attempt waits for a concurrency slot and a rate-limit token. A
+    transient failure is retried up to ``error_handling.max_retries_per_strategy``
+    times, sleeping outside the slot for the ``retry-after`` the API sent or,
+    with ``error_handling.intelligent_backoff``, a fully jittered exponential
+    delay (otherwise a fixed ``base_delay``). A timed-out request is not
+    retried, so a stuck call costs one ``request_timeout``. Consecutive
+    transient failures and timeouts open a per-model circuit breaker, after
+    which requests raise ``CircuitOpenError`` until its cooldown passes.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        logger: Optional[logging.Logger] = None,
+        metrics: Optional[MetricsRegistry] = None
+    ):
+        limit_cfg = getattr(config.ai, 'rate_limit', None)
+        errors_cfg = getattr(config, 'error_handling', None)
+        requests_per_minute = getattr(limit_cfg, 'requests_per_minute', 0)
+        self.bucket = TokenBucket(
+            requests_per_minute / 60, getattr(limit_cfg, 'burst', 1)
+        )
+        max_concurrency = getattr(limit_cfg, 'max_concurrency', 0)
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self.max_retries = getattr(errors_cfg, 'max_retries_per_strategy', 2)
+        self.intelligent_backoff = getattr(errors_cfg, 'intelligent_backoff', True)
+        self.base_delay = getattr(limit_cfg, 'base_delay', 1.0)
+        self.max_delay = getattr(limit_cfg, 'max_delay', 30.0)
+        self.failure_threshold = getattr(limit_cfg, 'failure_threshold', 5)
+        self.cooldown = getattr(limit_cfg, 'cooldown', 30.0)
+        self.logger = logger or logging.getLogger(__name__)
+        self.metrics = metrics or MetricsRegistry()
+
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.stats = {
+            'attempts': 0,
+            'retries': 0,
+            'backoff_seconds': 0.0,
+            'rate_limit_wait_seconds': 0.0,
+            'circuit_rejections': 0
+        }
+
+    async def run(
+        self,
+        key: str,
+        request: Callable[[], Awaitable[Any]],
+        task_type: str = 'general'
+    ) -> Any:
+        """Await ``request()`` for model ``key``, retrying transient failures."""
+        breaker = self.breakers.get(key)
+        if breaker is None:
+            breaker = self.breakers[key] = CircuitBreaker(
+                self.failure_threshold, self.cooldown
+            )
+        for attempt in range(self.max_retries + 1):
+            if not breaker.allow():
+                self.stats['circuit_rejections'] += 1
+                raise CircuitOpenError(f"Circuit open for {key}; not sending request")
+            try:
+                result = await self._attempt(request)
+            except asyncio.CancelledError:
+                breaker.release()
+                raise
+            except Exception as e:
+                if is_timeout(e):
+                    breaker.record_failure()
+                    self._record_circuit(key, breaker)
+                    raise
+                if not is_transient_error(e):
+                    # The API answered, so it is not degraded.
+                    breaker.record_success()
+                    raise
+                breaker.record_failure()
+                self._record_circuit(key, breaker)
+                if attempt == self.max_retries:
+                    raise
+                delay = self._backoff(attempt, e)
+                self.stats['retries'] += 1
+                self.stats['backoff_seconds'] += delay
+                self.metrics.inc(
+                    'ai_retries_total', task_type=task_type, reason=type(e).__name__
+                )
+                self.metrics.inc('ai_backoff_seconds_total', delay, task_type=task_type)
+                self.logger.warning(
+                    f"{key} request failed ({type(e).__name__}), retry "
+                    f"{attempt + 1}/{self.max_retries} in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+                continue
+            breaker.record_success()
+            self._record_circuit(key, breaker)
+            return result
+
+    async def _attempt(self, request: Callable[[], Awaitable[Any]]) -> Any:
+        if self._semaphore is None:
+            return await self._limited(request)
+        async with self._semaphore:
+            return await self._limited(request)
+
+    async def _limited(self, request: Callable[[], Awaitable[Any]]) -> Any:
+        waited = await self.bucket.acquire()
+        if waited:
+            self.stats['rate_limit_wait_seconds'] += waited
+            self.metrics.inc('ai_rate_limit_wait_seconds_total', waited)
+        self.stats['attempts'] += 1
+        return await request()
+
+    def _backoff(self, attempt: int, error: BaseException) -> float:
+        requested = retry_after(error)
+        if requested is not None:
+            return min(requested, self.max_delay)
+        if not self.intelligent_backoff:
+            return self.base_delay
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def _record_circuit(self, key: str, breaker: CircuitBreaker):
+        is_open = 1 if breaker.state == 'open' else 0
+        self.metrics.set('ai_circuit_open', is_open, model=key)
+
+    def summary(self) -> Dict:
+        return {
+            **self.stats,
+            'circuits': {
+                key: {'state': breaker.state, 'opens': breaker.opens}
+                for key, breaker in self.breakers.items()
+            }
+        }
@@ -0,0 +1,161 @@
+"""
+Content-addressed cache for model responses with an in-memory LRU tier and an
+optional SQLite tier that persists across runs.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+
+class ResponseCache:
+    """Two-tier response cache keyed on the full request content.
+
+    Entries expire after a per-task TTL. The memory tier evicts the least
+    recently used entry once ``max_entries`` is reached; the disk tier, when a
+    path is given, is consulted on memory misses and refilled on every store.
+    All SQLite work runs on one worker thread that owns the connection, so
+    lookups are awaited and stores are queued without blocking the event loop.
+    The database is opened by the first job on that thread; if it cannot be,
+    the cache runs on the memory tier alone.
+    """
+
+    def __init__(self, max_entries: int = 256, disk_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self._disk: Optional[ThreadPoolExecutor] = None
+        if disk_path:
+            self._disk = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='response-cache'
+            )
+            # Queued ahead of every lookup and store; nothing waits for it here.
+            self._disk.submit(self._open, disk_path)
+
+        self.stats = {
+            'hits': 0,
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'evictions': 0
+        }
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, prompt: str, max_tokens: int) -> str:
+        """Hash the request fields that determine the model's answer."""
+        payload = json.dumps(
+            [model, system_prompt, prompt, max_tokens],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached response for ``key`` or None if absent or expired."""
+        now = time.time()
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            expires, response = entry
+            if expires > now:
+                self._memory.move_to_end(key)
+                self.stats['hits'] += 1
+                self.stats['memory_hits'] += 1
+                return response
+            del self._memory[key]
+
+        if self._disk is not None:
+            row = await asyncio.get_running_loop().run_in_executor(
+                self._disk, self._select, key
+            )
+            if row is not None and row[0] > now:
+                self._remember(key, row[0], row[1])
+                self.stats['hits'] += 1
+                self.stats['disk_hits'] += 1
+                return row[1]
+
+        self.stats['misses'] += 1
+        return None
+
+    def put(self, key: str, response: str, ttl: float):
+        """Store ``response`` under ``key`` for ``ttl`` seconds.
+
+        The disk write is queued behind earlier ones and not waited for.
+        """
+        if ttl <= 0:
+            return
+        expires = time.time() + ttl
+        self._remember(key, expires, response)
+        if self._disk is not None:
+            self._disk.submit(self._insert, key, expires, response)
+        self.stats['stores'] += 1
+
+    def summary(self) -> Dict:
+        """Return the counters plus the overall hit rate."""
+        lookups = self.stats['hits'] + self.stats['misses']
+        return dict(
+            self.stats,
+            hit_rate=round(self.stats['hits'] / lookups, 3) if lookups else 0.0
+        )
+
+    def close(self):
+        """Finish queued writes, drop expired disk entries and close the database."""
+        if self._disk is not None:
+            self._disk.submit(self._close_db)
+            self._disk.shutdown(wait=True)
+            self._disk = None
+
+    # Called only on the disk worker thread, which owns the connection.
+
+    def _open(self, disk_path: str):
+        try:
+            db = sqlite3.connect(disk_path)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, expires REAL, response TEXT)"
+            )
+            db.commit()
+        except sqlite3.Error as e:
+            logging.getLogger(__name__).warning(
+                f"Response cache disk tier unavailable at {disk_path}: {e}"
+            )
+            return
+        self._db = db
+
+    def _select(self, key: str) -> Optional[Tuple[float, str]]:
+        if self._db is None:
+            return None
+        return self._db.execute(
+            "SELECT expires, response FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+
+    def _insert(self, key: str, expires: float, response: str):
+        if self._db is None:
+            return
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses (key, expires, response) "
+            "VALUES (?, ?, ?)",
+            (key, expires, response)
+        )
+        self._db.commit()
+
+    def _close_db(self):
+        if self._db is None:
+            return
+        self._db.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),))
+        self._db.commit()
+        self._db.close()
+        self._db = None
+
+    def _remember(self, key: str, expires: float, response: str):
+        self._memory[key] = (expires, response)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.stats['evictions'] += 1
@@ -0,0 +1,191 @@
+"""
+Screenshot service: captures into memory on the caller's path and leaves
+hashing, optional transcoding and disk writes to a background worker.
+"""
+
+import asyncio
+import hashlib
+import io
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+from playwright.async_api import Page
+
+from src.config import Config
+from src.session_log import SessionLog
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional: exact-match dedup and no WebP without it
+    Image = None
+
+FILE_EXTENSIONS = {'png': 'png', 'jpeg': 'jpg', 'webp': 'webp'}
+
+
+class ScreenshotService:
+    """Captures page screenshots and writes them from a bounded queue.
+
+    ``capture`` only waits for the browser to return the encoded image; the
+    worker then drops frames that look like the previous one (a perceptual
+    dHash when Pillow is installed, an exact byte hash otherwise) and writes
+    the rest. ``written`` lists exactly the files that reached disk.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        page: Page,
+        logger: Optional[logging.Logger] = None,
+        session_log: Optional[SessionLog] = None
+    ):
+        self.config = config
+        self.page = page
+        self.logger = logger or logging.getLogger(__name__)
+        self.session_log = session_log or SessionLog()
+
+        shot_cfg = getattr(self.config, 'screenshots', None)
+        self.format = getattr(shot_cfg, 'format', self.config.files.screenshot_format)
+        self.quality = getattr(shot_cfg, 'quality', 70)
+        self.scale = getattr(shot_cfg, 'scale', 'device')
+        self.full_page = getattr(shot_cfg, 'full_page', False)
+        clip = getattr(shot_cfg, 'clip', None)
+        self.clip = clip.to_dict() if isinstance(clip, Config) else clip
+        self.dedupe = getattr(shot_cfg, 'dedupe', True)
+        self.hash_distance = getattr(shot_cfg, 'hash_distance', 4)
+
+        # JPEG, quality, scale and clip are applied by the browser; only WebP
+        # and perceptual dedup depend on Pillow.
+        if Image is None:
+            if self.format == 'webp':
+                self.logger.warning("WebP screenshots need Pillow; writing JPEG instead")
+                self.format = 'jpeg'
+            if self.dedupe and self.hash_distance > 0:
+                self.logger.warning(
+                    "Perceptual screenshot dedup needs Pillow; "
+                    "only byte-identical frames will be skipped"
+                )
+
+        self.written: List[str] = []
+        self.stats = {
+            'captured': 0,
+            'written': 0,
+            'skipped_duplicates': 0,
+            'failed_writes': 0,
+            'bytes_written': 0,
+            'capture_time': 0.0,
+            'queue_wait_time': 0.0,
+            'hash': 'perceptual' if Image is not None else 'exact'
+        }
+        self._queue: asyncio.Queue = asyncio.Queue(
+            maxsize=getattr(shot_cfg, 'queue_size', 8)
+        )
+        self._worker: Optional[asyncio.Task] = None
+        self._last_hash = None
+
+    async def capture(self, name: str, dedupe: bool = True) -> str:
+        """Capture the page and queue it for writing as ``name`` plus extension.
+
+        Returns the path the image will be written to. With ``dedupe`` the
+        frame is dropped if it matches the previous one, in which case the
+        path never appears in ``written``.
+        """
+        path = f"{name}.{FILE_EXTENSIONS.get(self.format, self.format)}"
+        options = {
+            # WebP is transcoded by the worker from a lossless capture.
+            'type': 'png' if self.format == 'webp' else self.format,
+            'scale': self.scale,
+            'full_page': self.full_page
+        }
+        if self.format == 'jpeg':
+            options['quality'] = self.quality
+        if self.clip:
+            options['clip'] = self.clip
+
+        start = time.perf_counter()
+        data = await self.page.screenshot(**options)
+        self.stats['capture_time'] += time.perf_counter() - start
+        self.stats['captured'] += 1
+
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run_worker())
+        # A full queue makes the caller wait, bounding memory held in frames.
+        start = time.perf_counter()
+        await self._queue.put((path, data, dedupe and self.dedupe))
+        self.stats['queue_wait_time'] += time.perf_counter() - start
+        return path
+
+    async def flush(self):
+        """Wait until every queued frame has been written or skipped."""
+        if self._worker is not None:
+            await self._queue.join()
+
+    async def close(self):
+        """Flush pending frames and stop the worker."""
+        await self.flush()
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _run_worker(self):
+        while True:
+            path, data, dedupe = await self._queue.get()
+            try:
+                written = await asyncio.to_thread(self._process, path, data, dedupe)
+                if written:
+                    self.written.append(path)
+                    self.stats['written'] += 1
+                    self.stats['bytes_written'] += written
+                    self.session_log.event('screenshot', {'path': path, 'bytes': written})
+                else:
+                    self.stats['skipped_duplicates'] += 1
+            except Exception as e:
+                self.stats['failed_writes'] += 1
+                self.logger.warning(f"Screenshot {path} not written: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _process(self, path: str, data: bytes, dedupe: bool) -> int:
+        """Hash, transcode and write one frame; return bytes written, 0 if skipped."""
+        image = Image.open(io.BytesIO(data)) if Image is not None else None
+        frame_hash = self._frame_hash(data, image)
+        is_duplicate = self._is_duplicate(frame_hash)
+        self._last_hash = frame_hash
+        if dedupe and is_duplicate:
+            return 0
+
+        if self.format == 'webp':
+            buffer = io.BytesIO()
+            image.save(buffer, format='WEBP', quality=self.quality)
+            data = buffer.getvalue()
+        with open(path, 'wb') as f:
+            f.write(data)
+        return len(data)
+
+    @staticmethod
+    def _frame_hash(data: bytes, image) -> Tuple[str, object]:
+        if image is None:
+            return 'exact', hashlib.sha1(data).digest()
+        # dHash: sign of horizontal gradients on a 9x8 greyscale thumbnail.
+        pixels = image.convert('L').resize((9, 8)).tobytes()
+        bits = 0
+        for row in range(8):
+            for col in range(8):
+                left = pixels[row * 9 + col]
+                bits = (bits << 1) | (left > pixels[row * 9 + col + 1])
+        return 'perceptual', bits
+
+    def _is_duplicate(self, frame_hash: Tuple[str, object]) -> bool:
+        if self._last_hash is None:
+            return False
+        kind, value = frame_hash
+        if kind == 'exact':
+            return value == self._last_hash[1]
+        return bin(value ^ self._last_hash[1]).count('1') <= self.hash_distance
+
+    def summary(self) -> Dict:
+        return {**self.stats, 'files': list(self.written)}
@@ -0,0 +1,290 @@
+"""
+Append-only JSONL event stream for a session, written as it progresses. The
+summary and results files are derived from it, so a crashed or interrupted
+run can still be analysed.
+"""
+
+import hashlib
+import json
+import os
+import time
+import uuid
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional
+
+from src.config import Config
+
+# Kinds that end a unit of work; the buffer is written out after each.
+FLUSH_KINDS = frozenset((
+    'session_start', 'phase', 'final_result', 'error', 'session_end'
+))
+
+
+class Event:
+    """One line of the stream. ``refs`` maps field names to payload ids."""
+
+    __slots__ = ('seq', 'ts', 'kind', 'data', 'refs')
+
+    def __init__(self, seq: int, kind: str, data: Optional[Dict], refs: Optional[Dict]):
+        self.seq = seq
+        self.ts = round(time.time(), 3)
+        self.kind = kind
+        self.data = data
+        self.refs = refs
+
+    def to_json(self) -> str:
+        record = {'seq': self.seq, 'ts': self.ts, 'kind': self.kind}
+        if self.data:
+            record['data'] = self.data
+        if self.refs:
+            record['refs'] = self.refs
+        return json.dumps(record, default=str, separators=(',', ':'))
+
+
+class SessionLog:
+    """Writes session events as JSON lines to ``[session_log] path``.
+
+    Large values (intents, page analyses, decisions) are stored once as
+    ``payload`` events keyed by a content hash; later events reference them
+    by id. Lines are buffered and written whole, after ``flush_every``
+    events, ``flush_interval`` seconds, or any event in ``FLUSH_KINDS``, so
+    a crash loses at most the unflushed tail and never leaves a torn record
+    mid-file. Runs append to the same file, each opened by a
+    ``session_start`` event whose byte offset is remembered, so deriving this
+    session's files reads only its own events. With an empty ``path`` events
+    are kept in memory instead; built without a config, they are only counted.
+    """
+
+    def __init__(self, config: Optional[Config] = None):
+        log_cfg = getattr(config, 'session_log', None)
+        path = getattr(log_cfg, 'path', 'session_events.jsonl') if config else ''
+        # Absolute, so a later chdir does not move the stream.
+        self.path = os.path.abspath(path) if path else None
+        # Without a stream, a configured log keeps its records for the summary.
+        self.records: Optional[List[Dict]] = (
+            [] if config is not None and self.path is None else None
+        )
+        self.flush_every = getattr(log_cfg, 'flush_every', 50)
+        self.flush_interval = getattr(log_cfg, 'flush_interval', 1.0)
+        self.fsync = getattr(log_cfg, 'fsync', False)
+
+        self.session = uuid.uuid4().hex[:12]
+        self.counts: Dict[str, int] = {}
+        self._seq = 0
+        self._payload_ids = set()
+        self._buffer: List[bytes] = []
+        self._last_flush = time.monotonic()
+        self._file = None
+        self._start_index: Optional[int] = None
+        self.start_offset: Optional[int] = None
+
+    def payload(self, value: Any) -> Optional[str]:
+        """Store ``value`` once and return its id (None for None)."""
+        if value is None:
+            return None
+        encoded = json.dumps(value, sort_keys=True, default=str, separators=(',', ':'))
+        payload_id = hashlib.sha1(encoded.encode('utf-8')).hexdigest()[:12]
+        if payload_id not in self._payload_ids:
+            self._payload_ids.add(payload_id)
+            self.event('payload', {'id': payload_id, 'value': value})
+        return payload_id
+
+    def event(self, kind: str, data: Optional[Dict] = None, **refs: Any) -> Event:
+        """Append an event; keyword values are stored as payloads and referenced."""
+        refs = {name: self.payload(value) for name, value in refs.items()}
+        self._seq += 1
+        event = Event(self._seq, kind, data, refs)
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        if self.path is None:
+            if self.records is not None:
+                self.records.append(json.loads(event.to_json()))
+            return event
+        if kind == 'session_start' and self.start_offset is None:
+            self._start_index = len(self._buffer)
+        self._buffer.append(event.to_json().encode('utf-8') + b'\n')
+        if (
+            kind in FLUSH_KINDS
+            or len(self._buffer) >= self.flush_every
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+        return event
+
+    def start(self, **data: Any) -> Event:
+        return self.event('session_start', {'session': self.session, **data})
+
+    def flush(self):
+        self._last_flush = time.monotonic()
+        if not self._buffer or self.path is None:
+            return
+        if self._file is None:
+            self._file = open(self.path, 'ab')
+        if self._start_index is not None:
+            self.start_offset = self._file.tell() + sum(
+                len(line) for line in self._buffer[:self._start_index]
+            )
+            self._start_index = None
+        self._file.write(b''.join(self._buffer))
+        self._buffer.clear()
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def events(self) -> Iterable[Dict]:
+        """This session's events, from memory or from its offset in the stream."""
+        if self.records is not None:
+            return self.records
+        self.flush()
+        return read_events(self.path, self.session, self.start_offset)
+
+    def write_summary(self, path: str):
+        _write_json(path, summarize(self.events()))
+
+    def write_results(self, path: str):
+        _write_json(path, collect_results(self.events()))
+
+
+def read_events(
+    path: str,
+    session: Optional[str] = None,
+    offset: Optional[int] = None
+) -> Iterator[Dict]:
+    """Yield the events of one session in ``path``, the last one by default.
+
+    A known ``offset`` of the session's start event skips the scan for it.
+    Lines that do not parse (a record cut short by a crash) are skipped.
+    """
+    with open(path, 'rb') as f:
+        if offset is None:
+            offset = _session_offset(f, session)
+        f.seek(offset)
+        started = False
+        for line in f:
+            record = _parse(line)
+            if record is None:
+                continue
+            if record['kind'] == 'session_start':
+                if started:
+                    break
+                started = True
+            yield record
+
+
+def _session_offset(f: BinaryIO, session: Optional[str]) -> int:
+    start = offset = 0
+    for line in f:
+        if b'"kind":"session_start"' in line:
+            record = _parse(line)
+            if record and (session is None or record['data']['session'] == session):
+                start = offset
+        offset += len(line)
+    return start
+
+
+def derive_summary(path: str, session: Optional[str] = None) -> Dict:
+    """Rebuild the session summary from the stream."""
+    return summarize(read_events(path, session))
+
+
+def derive_results(path: str, session: Optional[str] = None) -> Dict:
+    """Rebuild the session result from the stream."""
+    return collect_results(read_events(path, session))
+
+
+def rebuild(events_path: str, summary_path: str, results_path: str):
+    """Rewrite the summary and results files from the last session in the stream."""
+    _write_json(summary_path, derive_summary(events_path))
+    _write_json(results_path, derive_results(events_path))
+
+
+def summarize(events: Iterable[Dict]) -> Dict:
+    """Build the session summary from one session's events.
+
+    ``complete`` is False for a run that never reached ``session_end``, whose
+    ``total_time`` then runs to its last recorded event.
+    """
+    summary: Dict[str, Any] = {
+        'complete': False,
+        'total_time': None,
+        'bypass_attempts': [],
+        'ai_decisions': 0,
+        'screenshots': []
+    }
+    start_time = last_ts = None
+    for record in events:
+        last_ts = record['ts']
+        kind, data = record['kind'], record.get('data', {})
+        if kind == 'session_start':
+            summary['session'] = data['session']
+            start_time = data.get('start_time')
+        elif kind == 'bypass_attempt':
+            summary['bypass_attempts'].append(data)
+        elif kind == 'decision':
+            summary['ai_decisions'] += 1
+        elif kind == 'screenshot':
+            summary['screenshots'].append(data['path'])
+        elif kind == 'stats':
+            summary[data['name']] = data.get('value')
+        elif kind == 'session_end':
+            summary['complete'] = True
+            summary['total_time'] = data.get('total_time')
+    if summary['total_time'] is None and start_time is not None:
+        summary['total_time'] = last_ts - start_time
+    return summary
+
+
+def collect_results(events: Iterable[Dict]) -> Dict:
+    """Build the session result (goal, phases, decisions, final result)."""
+    payloads: Dict[str, Any] = {}
+    results: Dict[str, Any] = {
+        'phases': [],
+        'ai_decisions': [],
+        'technical_achievements': [],
+        'final_result': None
+    }
+    steps: List[Dict] = []
+    for record in events:
+        kind, data = record['kind'], record.get('data', {})
+        refs = {
+            name: payloads.get(payload_id)
+            for name, payload_id in record.get('refs', {}).items()
+        }
+        if kind == 'payload':
+            payloads[data['id']] = data['value']
+        elif kind == 'session_start':
+            results.update({k: v for k, v in data.items() if k != 'session'})
+        elif kind == 'phase':
+            results['phases'].append(data)
+        elif kind == 'achievement':
+            results['technical_achievements'].append(data['text'])
+        elif kind == 'decision':
+            results['ai_decisions'].append({**data, **refs})
+        elif kind == 'step':
+            steps.append({**data, **refs})
+        elif kind == 'final_result':
+            results['final_result'] = {**data, **refs}
+            if data.get('type') == 'real_navigation':
+                results['final_result']['steps'] = steps
+        elif kind == 'summary':
+            results['summary'] = data
+        elif kind == 'error':
+            results['error'] = data['message']
+    return results
+
+
+def _parse(line: bytes) -> Optional[Dict]:
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    return record if isinstance(record, dict) and 'kind' in record else None
+
+
+def _write_json(path: str, document: Dict):
+    with open(path, 'w') as f:
+        json.dump(document, f, indent=2, default=str)
@@ -0,0 +1,274 @@
+"""
+Lightweight span tracing for sessions, exported as Chrome trace-event JSON
+(chrome://tracing, Perfetto) and as OTLP/JSON for OpenTelemetry tooling.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import json
+import random
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.config import Config
+
+# Page methods wrapped in a span by ``Tracer.instrument_page``.
+TRACED_PAGE_METHODS = (
+    'goto', 'reload', 'evaluate', 'screenshot', 'wait_for_selector',
+    'wait_for_load_state', 'wait_for_function', 'wait_for_timeout'
+)
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar(
+    'current_span', default=None
+)
+
+
+class Span:
+    """One timed operation; attributes are free-form scalars."""
+
+    __slots__ = (
+        'name', 'span_id', 'parent_id', 'start_ns', 'end_ns', 'thread',
+        'attributes', 'status'
+    )
+
+    def __init__(
+        self,
+        name: str,
+        parent_id: Optional[int],
+        thread: int,
+        attributes: Dict
+    ):
+        self.name = name
+        self.span_id = random.getrandbits(64)
+        self.parent_id = parent_id
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns = 0
+        self.thread = thread
+        self.attributes = attributes
+        self.status = 'ok'
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def add(self, key: str, amount: float):
+        """Accumulate a numeric attribute, e.g. tokens over several requests."""
+        self.attributes[key] = self.attributes.get(key, 0) + amount
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def set(self, **attributes):
+        pass
+
+    def add(self, key: str, amount: float):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Collects spans for one session and writes them out at the end.
+
+    Spans nest by async task through a context variable, so concurrent work
+    (parallel AI calls, raced selectors) keeps correct parents. Each asyncio
+    task is exported as its own track. Built without a config, or with
+    ``[tracing] enabled = false``, every call is a no-op.
+    """
+
+    def __init__(self, config: Optional[Config] = None):
+        tracing_cfg = getattr(config, 'tracing', None)
+        self.enabled = getattr(tracing_cfg, 'enabled', False)
+        self.service_name = getattr(tracing_cfg, 'service_name', 'ai-navigator')
+        self.chrome_trace_path = getattr(
+            tracing_cfg, 'chrome_trace_path', 'trace_chrome.json'
+        )
+        self.otlp_path = getattr(tracing_cfg, 'otlp_path', 'trace_otlp.json')
+        self.max_spans = getattr(tracing_cfg, 'max_spans', 50000)
+
+        self.trace_id = random.getrandbits(128)
+        self.spans: List[Span] = []
+        self.dropped = 0
+        # perf_counter gives ordering; this anchors it to wall-clock time.
+        self._epoch_offset_ns = time.time_ns() - time.perf_counter_ns()
+        self._threads: Dict[int, int] = {}
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Any]:
+        """Time the enclosed block as a child of the current span."""
+        if not self.enabled:
+            yield _NULL_SPAN
+            return
+
+        parent = _current_span.get()
+        span = Span(
+            name,
+            parent.span_id if parent is not None else None,
+            self._thread_id(),
+            attributes
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except asyncio.CancelledError:
+            span.status = 'cancelled'
+            raise
+        except BaseException as e:
+            span.status = 'error'
+            span.attributes['error'] = f"{type(e).__name__}: {e}"[:200]
+            raise
+        finally:
+            span.end_ns = time.perf_counter_ns()
+            _current_span.reset(token)
+            if len(self.spans) < self.max_spans:
+                self.spans.append(span)
+            else:
+                self.dropped += 1
+
+    def current(self) -> Any:
+        """The innermost open span, or a no-op span outside any."""
+        return _current_span.get() or _NULL_SPAN
+
+    def instrument_page(self, page, metrics=None):
+        """Return ``page`` wrapped so its slow operations are traced.
+
+        With an enabled ``MetricsRegistry`` the durations are also recorded as
+        the ``page_operation_seconds`` histogram, even when tracing is off.
+        """
+        timed = metrics is not None and metrics.enabled
+        if not self.enabled and not timed:
+            return page
+        return TracedPage(page, self, metrics if timed else None)
+
+    def _thread_id(self) -> int:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        key = id(task) if task is not None else 0
+        return self._threads.setdefault(key, len(self._threads))
+
+    def export(self) -> List[str]:
+        """Write both trace formats; returns the paths written."""
+        if not self.enabled or not self.spans:
+            return []
+        paths = []
+        for path, document in (
+            (self.chrome_trace_path, self.chrome_trace()),
+            (self.otlp_path, self.otlp_trace())
+        ):
+            if path:
+                with open(path, 'w') as f:
+                    json.dump(document, f, default=str)
+                paths.append(path)
+        return paths
+
+    def chrome_trace(self) -> Dict:
+        """Spans as Chrome trace-event JSON complete ('X') events."""
+        origin = min(s.start_ns for s in self.spans)
+        events = [{
+            'name': 'thread_name',
+            'ph': 'M',
+            'pid': 1,
+            'tid': tid,
+            'args': {'name': 'main' if tid == 0 else f'task-{tid}'}
+        } for tid in self._threads.values()]
+        for span in sorted(self.spans, key=lambda s: s.start_ns):
+            events.append({
+                'name': span.name,
+                'cat': span.name.split('.')[0],
+                'ph': 'X',
+                'ts': (span.start_ns - origin) / 1000,
+                'dur': (span.end_ns - span.start_ns) / 1000,
+                'pid': 1,
+                'tid': span.thread,
+                'args': dict(span.attributes, status=span.status)
+            })
+        return {
+            'traceEvents': events,
+            'displayTimeUnit': 'ms',
+            'otherData': {'service': self.service_name, 'dropped_spans': self.dropped}
+        }
+
+    def otlp_trace(self) -> Dict:
+        """Spans in the OTLP/JSON layout used by OpenTelemetry file exporters."""
+        status_codes = {'ok': 0, 'error': 2, 'cancelled': 2}
+        spans = []
+        for span in self.spans:
+            entry = {
+                'traceId': f'{self.trace_id:032x}',
+                'spanId': f'{span.span_id:016x}',
+                'name': span.name,
+                'kind': 1,
+                'startTimeUnixNano': str(span.start_ns + self._epoch_offset_ns),
+                'endTimeUnixNano': str(span.end_ns + self._epoch_offset_ns),
+                'attributes': [
+                    {'key': key, 'value': _otlp_value(value)}
+                    for key, value in span.attributes.items()
+                ],
+                'status': {'code': status_codes[span.status]}
+            }
+            if span.parent_id is not None:
+                entry['parentSpanId'] = f'{span.parent_id:016x}'
+            if span.status != 'ok':
+                entry['status']['message'] = span.status
+            spans.append(entry)
+        return {'resourceSpans': [{
+            'resource': {'attributes': [
+                {'key': 'service.name', 'value': {'stringValue': self.service_name}}
+            ]},
+            'scopeSpans': [{'scope': {'name': 'src.tracing'}, 'spans': spans}]
+        }]}
+
+    def summary(self) -> Dict:
+        """Total time and count per span name, slowest first."""
+        totals: Dict[str, Dict] = {}
+        for span in self.spans:
+            entry = totals.setdefault(span.name, {'count': 0, 'seconds': 0.0})
+            entry['count'] += 1
+            entry['seconds'] += (span.end_ns - span.start_ns) / 1e9
+        return dict(sorted(totals.items(), key=lambda kv: -kv[1]['seconds']))
+
+
+def _otlp_value(value: Any) -> Dict:
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+class TracedPage:
+    """Proxy for a Playwright Page that opens a span around slow operations.
+
+    Everything else (mouse, keyboard, event handlers, main_frame) passes
+    straight through to the wrapped page.
+    """
+
+    def __init__(self, page, tracer: Tracer, metrics=None):
+        self._page = page
+        self._tracer = tracer
+        self._metrics = metrics
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._page, name)
+        if name not in TRACED_PAGE_METHODS:
+            return attr
+
+        async def traced(*args, **kwargs):
+            target = args[0] if args and isinstance(args[0], str) else ''
+            start = time.perf_counter()
+            try:
+                with self._tracer.span(f'page.{name}', target=target[:120]):
+                    return await attr(*args, **kwargs)
+            finally:
+                if self._metrics is not None:
+                    self._metrics.observe(
+                        'page_operation_seconds', time.perf_counter() - start,
+                        operation=name
+                    )
+        return traced